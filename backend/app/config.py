@@ -1,6 +1,14 @@
 import os
+import tempfile
 from typing import List
 
+_TRUTHY = frozenset({"1", "true", "yes"})
+
+
+def _env_bool(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in _TRUTHY
+
+
 BACKEND_HOST = os.getenv("BACKEND_HOST", "0.0.0.0")
 BACKEND_PORT = int(os.getenv("BACKEND_PORT", "8000"))
 
@@ -15,18 +23,26 @@ VOL_LOOKBACK = int(os.getenv("VOL_LOOKBACK", "30"))
 
 # Redis configuration (optional)
 REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
-ENABLE_REDIS = os.getenv("ENABLE_REDIS", "false").lower() in {"1", "true", "yes"}
+ENABLE_REDIS = _env_bool("ENABLE_REDIS", "false")
 
 # Binance futures endpoints
 BINANCE_FUTURES_REST = os.getenv("BINANCE_FUTURES_REST", "https://fapi.binance.com")
 BINANCE_FUTURES_WS = os.getenv("BINANCE_FUTURES_WS", "wss://fstream.binance.com/stream")
 
+# Volume-ranked Binance perp universe cached on disk across restarts (TTL 0 disables)
+BINANCE_SYMBOLS_CACHE_PATH = os.getenv(
+    "BINANCE_SYMBOLS_CACHE_PATH", os.path.join(tempfile.gettempdir(), "warthog_binance_symbols.json")
+)
+BINANCE_SYMBOLS_CACHE_TTL_SEC = int(os.getenv("BINANCE_SYMBOLS_CACHE_TTL_SEC", "300"))
+
 # Websocket heartbeat/ping
 WS_PING_INTERVAL = float(os.getenv("WS_PING_INTERVAL", "15"))
 
 # Emission cadence
 SNAPSHOT_INTERVAL_MS = int(os.getenv("SNAPSHOT_INTERVAL_MS", "30000"))  # throttle aggregator emits (30 seconds)
 WS_HEARTBEAT_SEC = float(os.getenv("WS_HEARTBEAT_SEC", "30"))  # periodic WS snapshot sender (30 seconds)
+WS_COALESCE_MS = int(os.getenv("WS_COALESCE_MS", "20"))  # window for collapsing back-to-back snapshot pushes
+WS_SEND_TIMEOUT_SEC = float(os.getenv("WS_SEND_TIMEOUT_SEC", "10"))  # drop clients that can't take a snapshot frame in time
 
 # Cipher B thresholds (relaxed to increase frequency)
 CIPHERB_OS_LEVEL = float(os.getenv("CIPHERB_OS_LEVEL", "-40"))
@@ -52,17 +68,17 @@ TRADEPLAN_TP_R_MULTS = (
     float(os.getenv("TRADEPLAN_TP2_R", "2.5")),  # Increased from 2.0
     float(os.getenv("TRADEPLAN_TP3_R", "4.0")),  # Increased from 3.0 - let winners run
 )
-TRADEPLAN_ENABLE = os.getenv("TRADEPLAN_ENABLE", "true").lower() in {"1","true","yes"}
+TRADEPLAN_ENABLE = _env_bool("TRADEPLAN_ENABLE", "true")
 
 # Optional periodic "full refresh" (restart streams + backfill + refetch OI) aligned to 5m boundaries
-ENABLE_FULL_REFRESH_5M = os.getenv("ENABLE_FULL_REFRESH_5M", "false").lower() in {"1", "true", "yes"}
+ENABLE_FULL_REFRESH_5M = _env_bool("ENABLE_FULL_REFRESH_5M", "false")
 FULL_REFRESH_BACKFILL_LIMIT = int(os.getenv("FULL_REFRESH_BACKFILL_LIMIT", "200"))
 FULL_REFRESH_OFFSET_SEC = int(os.getenv("FULL_REFRESH_OFFSET_SEC", "2"))  # wait N seconds after boundary
 
 # Staleness thresholds (used by /debug/status)
 STALE_TICKER_MS = int(os.getenv("STALE_TICKER_MS", "30000"))
 STALE_KLINE_MS = int(os.getenv("STALE_KLINE_MS", "90000"))
-DEBUG_STATUS_INCLUDE_LISTS_DEFAULT = os.getenv("DEBUG_STATUS_INCLUDE_LISTS_DEFAULT", "false").lower() in {"1", "true", "yes"}
+DEBUG_STATUS_INCLUDE_LISTS_DEFAULT = _env_bool("DEBUG_STATUS_INCLUDE_LISTS_DEFAULT", "false")
 
 # Bybit endpoints (public)
 BYBIT_REST = os.getenv("BYBIT_REST", "https://api.bybit.com")
@@ -73,7 +89,7 @@ INCLUDE_SYMBOLS: List[str] = [s.strip().upper() for s in os.getenv("INCLUDE_SYMB
 EXCLUDE_SYMBOLS: List[str] = [s.strip().upper() for s in os.getenv("EXCLUDE_SYMBOLS", "").split(",") if s.strip()]
 
 # Alerting configuration
-ENABLE_ALERTS = os.getenv("ENABLE_ALERTS", "false").lower() in {"1", "true", "yes"}
+ENABLE_ALERTS = _env_bool("ENABLE_ALERTS", "false")
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_BOT_TOKEN", "")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID", "")
 DISCORD_WEBHOOK_URL = os.getenv("DISCORD_WEBHOOK_URL", "")
@@ -81,12 +97,12 @@ ALERT_DEDUP_MIN_MS = int(os.getenv("ALERT_DEDUP_MIN_MS", "60000"))  # 1 minute d
 ALERT_COOLDOWN_PER_SYMBOL_MS = int(os.getenv("ALERT_COOLDOWN_PER_SYMBOL_MS", "300000"))  # legacy/global fallback
 ALERT_COOLDOWN_TOP_MS = int(os.getenv("ALERT_COOLDOWN_TOP_MS", "120000"))  # 2 min for Top 200
 ALERT_COOLDOWN_SMALL_MS = int(os.getenv("ALERT_COOLDOWN_SMALL_MS", "300000"))  # 5 min for Small Caps
-ALERT_INCLUDE_EXPLANATION = os.getenv("ALERT_INCLUDE_EXPLANATION", "true").lower() in {"1","true","yes"}
+ALERT_INCLUDE_EXPLANATION = _env_bool("ALERT_INCLUDE_EXPLANATION", "true")
 ALERT_MIN_GRADE = os.getenv("ALERT_MIN_GRADE", "A").upper()  # 'A' default for outbound notifications
 
 # Volatility Due (Squeeze) alerts
 # Enable/disable independently of other alerts (still respects ENABLE_ALERTS)
-ALERT_VOL_DUE = os.getenv("ALERT_VOL_DUE", "true").lower() in {"1","true","yes"}
+ALERT_VOL_DUE = _env_bool("ALERT_VOL_DUE", "true")
 
 # Compression thresholds
 # BB width is (upper-lower)/middle. 0.03 is a tight squeeze.
@@ -105,8 +121,8 @@ VOL_DUE_LOOKBACK_4H = int(os.getenv("VOL_DUE_LOOKBACK_4H", "60"))     # ~10d
 MARKET_CAP_UPDATE_INTERVAL_SEC = int(os.getenv("MARKET_CAP_UPDATE_INTERVAL_SEC", "3600"))  # 1 hour default
 
 # Analysis recompute scheduler
-ANALYSIS_AUTORUN = os.getenv("ANALYSIS_AUTORUN", "false").lower() in {"1","true","yes"}
+ANALYSIS_AUTORUN = _env_bool("ANALYSIS_AUTORUN", "false")
 ANALYSIS_AUTORUN_INTERVAL_SEC = int(os.getenv("ANALYSIS_AUTORUN_INTERVAL_SEC", "21600"))  # 6h
 ANALYSIS_AUTORUN_WINDOWS = [int(x) for x in os.getenv("ANALYSIS_AUTORUN_WINDOWS", "30,90").split(",") if x.strip().isdigit()]
-ANALYSIS_AUTORUN_TOP200_ONLY = os.getenv("ANALYSIS_AUTORUN_TOP200_ONLY", "true").lower() in {"1","true","yes"}
+ANALYSIS_AUTORUN_TOP200_ONLY = _env_bool("ANALYSIS_AUTORUN_TOP200_ONLY", "true")
 
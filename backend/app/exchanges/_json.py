@@ -0,0 +1,44 @@
+"""JSON encoding/decoding for exchange websocket frames.
+
+Uses orjson when it is installed (C parser, accepts str or bytes frames) and
+falls back to the stdlib json module otherwise. dumps() always returns str so
+outgoing frames (e.g. subscribe requests) are sent as text.
+
+Frames arrive as str: the pinned websockets 12 client always UTF-8 decodes text
+frames and has no option to hand back raw bytes (recv(decode=False) only exists
+on the newer websockets.asyncio client). loads() takes either, so moving to that
+client only needs the connect/recv calls changed.
+"""
+from __future__ import annotations
+
+import json
+from typing import List
+
+try:
+    import orjson
+except ImportError:  # optional dependency
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+    JSONDecodeError = orjson.JSONDecodeError
+
+    def dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+else:
+    loads = json.loads
+    dumps = json.dumps
+    JSONDecodeError = json.JSONDecodeError
+
+# Bybit op responses (subscribe acks, pongs) are serialized starting with this;
+# data frames start with {"topic". Matching it lets readers skip them unparsed.
+BYBIT_OP_PREFIX = '{"success"'
+
+
+def op_frames(op: str, args: List[str], batch: int) -> List[str]:
+    """Serialize Bybit-style {"op", "args"} requests, at most `batch` args per frame.
+
+    Callers build these once before their reconnect loop and resend the same
+    strings on every connect.
+    """
+    return [dumps({"op": op, "args": args[i:i + batch]}) for i in range(0, len(args), batch)]
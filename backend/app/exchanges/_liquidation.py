@@ -0,0 +1,39 @@
+"""Normalized liquidation event shared by the Binance and Bybit liquidation streams."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict
+
+
+@dataclass(slots=True, frozen=True)
+class LiquidationEvent:
+    """A normalized forced-liquidation event.
+
+    Kept as a slotted dataclass rather than a dict: collectors create one per
+    frame, so avoiding a per-event dict keeps the stores small. The same object is
+    stored, aggregated into levels and yielded to streamers; convert with
+    `to_dict()` only when serializing for REST/WS clients.
+    """
+    exchange: str
+    symbol: str
+    ts: int
+    price: float
+    qty: float
+    value_usd: float
+    side: str  # SELL = long liquidated, BUY = short liquidated
+    source: str  # feed that produced the event, e.g. "binance_ws"
+    status: str = ""
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "exchange": self.exchange,
+            "symbol": self.symbol,
+            "ts": self.ts,
+            "timestamp": self.ts,
+            "price": self.price,
+            "qty": self.qty,
+            "value_usd": self.value_usd,
+            "side": self.side,
+            "status": self.status,
+            "source": self.source,
+        }
@@ -0,0 +1,233 @@
+"""Shared websocket connection for per-symbol exchange streams.
+
+A StreamMux keeps one socket per venue/topic family and fans decoded events out
+to per-subscriber rings, instead of every stream_*(symbol) caller opening its
+own connection. A symbol is subscribed on the socket while it has at least one
+subscriber; changes are batched into one request per window, and the whole set
+is resubscribed after a reconnect.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+import websockets
+
+from ..config import WS_PING_INTERVAL
+from . import _json
+from ._reconnect import STABLE_CONNECTION_SEC, Backoff
+
+log = logging.getLogger(__name__)
+
+_SUBSCRIBER_RING_SIZE = 4096  # per-subscriber backlog; oldest events dropped beyond this
+_MAX_BATCH = 32  # events per stream_batches() yield
+# (Un)subscribes within this window go out together; Binance drops sockets sending >10 msg/s
+_SUBSCRIBE_BATCH_SEC = 0.25
+
+
+class _Subscriber:
+    """Bounded ring of pending events plus a wakeup flag for one consumer.
+
+    The reader appends and sets the event; the consumer drains the ring and only
+    awaits once it is empty. A full ring drops its oldest event (deque maxlen).
+    """
+
+    __slots__ = ("ring", "ready", "closed")
+
+    def __init__(self) -> None:
+        self.ring: deque = deque(maxlen=_SUBSCRIBER_RING_SIZE)
+        self.ready = asyncio.Event()
+        self.closed = False
+
+    def push(self, event: Any) -> None:
+        self.ring.append(event)
+        self.ready.set()
+
+    def close(self) -> None:
+        self.closed = True
+        self.ready.set()
+
+    async def wait(self) -> bool:
+        """Wait until events are pending; False once closed and drained."""
+        while not self.ring:
+            if self.closed:
+                return False
+            self.ready.clear()
+            await self.ready.wait()
+        return True
+
+
+class SubscriptionBatcher:
+    """Collects symbol (un)subscribes and sends each kind as one request per window.
+
+    `send(subscribe, symbols)` is called with the net changes once the window
+    closes; opposite changes to a symbol within one window cancel out.
+    """
+
+    def __init__(self, send: Callable[[bool, List[str]], Awaitable[None]]) -> None:
+        self._send = send
+        self._pending: Dict[str, bool] = {}  # symbol -> subscribe (True) / unsubscribe (False)
+        self._task: Optional[asyncio.Task] = None
+
+    def queue(self, symbol: str, subscribe: bool) -> None:
+        pending = self._pending
+        if pending.get(symbol, subscribe) != subscribe:
+            del pending[symbol]
+        else:
+            pending[symbol] = subscribe
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._flush())
+
+    def cancel(self) -> None:
+        """Drop pending changes (the socket is going away)."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._pending.clear()
+
+    async def _flush(self) -> None:
+        await asyncio.sleep(_SUBSCRIBE_BATCH_SEC)
+        pending, self._pending = self._pending, {}
+        await self._send(False, [s for s, sub in pending.items() if not sub])
+        await self._send(True, [s for s, sub in pending.items() if sub])
+
+
+class StreamMux:
+    """One websocket shared by all subscribers of a topic family.
+
+    Subclasses set `name`/`url` and implement `_requests` (subscribe/unsubscribe
+    frames) and `_route` (decoded frame -> (symbol, event) pairs).
+    """
+
+    name = "stream"
+    url = ""
+    skip_prefix: Optional[str] = None  # frames starting with this are dropped unparsed
+
+    def __init__(self) -> None:
+        self._subs: Dict[str, Set[_Subscriber]] = {}
+        self._ws = None
+        self._task: Optional[asyncio.Task] = None
+        self._batcher = SubscriptionBatcher(self._send)
+
+    def _requests(self, subscribe: bool, symbols: List[str]) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+    def _route(self, data: Any) -> List[Tuple[str, Any]]:
+        raise NotImplementedError
+
+    async def stream(self, symbol: str) -> AsyncIterator[Any]:
+        """Yield events for one symbol until the caller stops or the symbol is closed."""
+        sub = await self._attach(symbol)
+        ring = sub.ring
+        try:
+            while await sub.wait():
+                while ring:
+                    yield ring.popleft()
+        finally:
+            await self._unsubscribe(symbol, sub)
+
+    async def stream_batches(self, symbol: str, max_batch: int = _MAX_BATCH) -> AsyncIterator[List[Any]]:
+        """Like stream(), but yield every event already queued (up to max_batch) per wakeup.
+
+        A busy symbol delivers several events per frame; consumers then pay one
+        await/yield per batch instead of per event.
+        """
+        sub = await self._attach(symbol)
+        ring = sub.ring
+        try:
+            while await sub.wait():
+                if len(ring) <= max_batch:
+                    batch = list(ring)
+                    ring.clear()
+                else:
+                    batch = [ring.popleft() for _ in range(max_batch)]
+                yield batch
+        finally:
+            await self._unsubscribe(symbol, sub)
+
+    async def _attach(self, symbol: str) -> _Subscriber:
+        sub = _Subscriber()
+        subs = self._subs.setdefault(symbol, set())
+        subs.add(sub)
+        if len(subs) == 1:
+            self._batcher.queue(symbol, True)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return sub
+
+    def close_symbol(self, symbol: str) -> None:
+        """End every subscriber stream for a symbol (e.g. the venue rejected the topic)."""
+        for sub in self._subs.pop(symbol, ()):
+            sub.close()
+
+    async def _unsubscribe(self, symbol: str, sub: _Subscriber) -> None:
+        subs = self._subs.get(symbol)
+        if subs is not None:
+            subs.discard(sub)
+            if not subs:
+                del self._subs[symbol]
+                self._batcher.queue(symbol, False)
+        if not self._subs and self._task is not None:
+            self._task.cancel()
+            self._task = None
+            self._batcher.cancel()
+
+    async def _send(self, subscribe: bool, symbols: List[str]) -> None:
+        ws = self._ws
+        if ws is None or not symbols:
+            return  # _run() subscribes the current set when it connects
+        try:
+            for req in self._requests(subscribe, symbols):
+                await ws.send(_json.dumps(req))
+        except Exception as e:
+            # The read loop sees the broken socket and resubscribes on reconnect
+            log.debug(f"{self.name} WS (un)subscribe failed: {e}")
+
+    async def _run(self) -> None:
+        backoff = Backoff(cap=20)
+        attempt = 0
+        while True:
+            connected_at: Optional[float] = None
+            try:
+                attempt += 1
+                log.info(f"{self.name} WS connect ({len(self._subs)} symbols, attempt {attempt})")
+                async with websockets.connect(
+                    self.url,
+                    ping_interval=WS_PING_INTERVAL,
+                    ping_timeout=60,
+                    close_timeout=10,
+                    max_queue=4096,
+                ) as ws:
+                    connected_at = time.monotonic()
+                    self._ws = ws
+                    try:
+                        await self._send(True, sorted(self._subs))
+                        skip_prefix = self.skip_prefix
+                        async for message in ws:
+                            if skip_prefix is not None and message.startswith(skip_prefix):
+                                continue
+                            try:
+                                routed = self._route(_json.loads(message))
+                            except Exception as e:
+                                log.debug(f"{self.name} parse error: {e}")
+                                continue
+                            for symbol, event in routed:
+                                for sub in self._subs.get(symbol, ()):
+                                    sub.push(event)
+                    finally:
+                        self._ws = None
+                reason = "closed by server"
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                reason = f"error: {type(e).__name__}: {e}"
+            # Only a connection that stayed up for a while earns a fresh backoff, so a
+            # connect-then-drop loop keeps backing off instead of resubscribing every symbol.
+            if connected_at is not None and time.monotonic() - connected_at >= STABLE_CONNECTION_SEC:
+                backoff.reset()
+            delay = backoff.next_delay()
+            log.warning(f"{self.name} WS {reason} (reconnect {delay:.1f}s)")
+            await asyncio.sleep(delay)
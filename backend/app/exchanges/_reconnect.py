@@ -0,0 +1,37 @@
+"""Reconnect delays for the exchange websocket loops.
+
+Every stream backs off exponentially between reconnect attempts. The delay is
+drawn uniformly from [0, current backoff] ("full jitter") so streams that drop
+together (venue restart, network blip) don't all reconnect in lock-step.
+"""
+from __future__ import annotations
+
+import random
+
+# Seconds a connection must stay up before the reconnect backoff resets, so a
+# connect-then-drop loop keeps backing off instead of reconnecting at once
+STABLE_CONNECTION_SEC = 60
+
+
+class Backoff:
+    """Capped exponential backoff with full jitter.
+
+    Args:
+        cap: Upper bound for the backoff window, in seconds.
+        initial: Window after construction or reset(), in seconds.
+    """
+
+    def __init__(self, cap: float, initial: float = 1.0) -> None:
+        self.cap = cap
+        self.initial = initial
+        self._window = initial
+
+    def reset(self) -> None:
+        """Call once a connection is established."""
+        self._window = self.initial
+
+    def next_delay(self) -> float:
+        """Seconds to sleep before the next attempt; widens the window for the one after."""
+        delay = random.uniform(0, self._window)
+        self._window = min(self._window * 2, self.cap)
+        return delay
@@ -1,13 +1,16 @@
 from __future__ import annotations
-import abc
 from typing import AsyncIterator
 from ..models import Kline
 
-class PerpKlineSource(abc.ABC):
-    @abc.abstractmethod
+class PerpKlineSource:
+    """Interface for perpetual-futures 1m kline sources; subclasses implement both methods."""
+
     async def symbols(self) -> list[str]:
-        ...
+        raise NotImplementedError
+
+    async def symbols_count(self) -> int:
+        """Number of symbols; for callers that only need the count (status endpoints)."""
+        return len(await self.symbols())
 
-    @abc.abstractmethod
     async def stream_1m_klines(self) -> AsyncIterator[Kline]:
-        ...
+        raise NotImplementedError
@@ -29,27 +29,55 @@ Message format:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import math
 import time
-from typing import AsyncIterator, Dict, List, Any, Optional, Set
 from collections import deque
+from itertools import islice
+from typing import AbstractSet, AsyncIterator, Dict, List, Any, Optional, Set, Tuple, Union
 
 import websockets
+from sortedcontainers import SortedDict
 
 from ..config import BINANCE_FUTURES_WS, WS_PING_INTERVAL
+from . import _json
+from ._liquidation import LiquidationEvent
+from ._reconnect import STABLE_CONNECTION_SEC, Backoff
 
 log = logging.getLogger(__name__)
 
+
 # In-memory store for recent liquidations per symbol
-# Structure: {symbol: deque([{liquidation_event}, ...])}
+# Structure: {symbol: deque([LiquidationEvent, ...])}
 _liquidation_store: Dict[str, deque] = {}
 _MAX_STORED_LIQUIDATIONS = 100  # Keep last 100 per symbol
 
-# Liquidation levels heatmap store
-# Structure: {symbol: {price_bucket: {"long_value": float, "short_value": float, "count": int, "last_ts": int}}}
-_liquidation_levels: Dict[str, Dict[float, Dict[str, Any]]] = {}
+# Liquidation levels heatmap store, keyed by integer price tick and sorted for range queries.
+# A bucket's price is tick * _bucket_size[symbol].
+# Structure: {symbol: SortedDict({tick: {"long_value": float, "short_value": float, "count": int, "last_ts": int}})}
+_liquidation_levels: Dict[str, SortedDict] = {}
+
+# Read side of the heatmap: immutable per-symbol copies served to callers so they
+# never iterate buckets the collector is mutating. A symbol's copy is rebuilt on
+# read only if it changed and is older than _LEVEL_SNAPSHOT_MAX_AGE_MS.
+# Structure: {symbol: (published_ms, bucket_size, SortedDict({tick: level}))}
+_levels_snap: Dict[str, Tuple[int, float, SortedDict]] = {}
+_levels_dirty: Set[str] = set()
+_LEVEL_SNAPSHOT_MAX_AGE_MS = 100
 _LEVEL_EXPIRY_MS = 60 * 60 * 1000  # 1 hour - levels older than this are removed
+_LEVEL_SWEEP_INTERVAL_SEC = 60  # how often the collector sweeps expired levels
+
+# Large (> $100k) liquidations tallied per symbol and logged once per interval
+# Structure: {symbol: (count, value_usd, long_count)}
+_large_liq_accum: Dict[str, Tuple[int, float, int]] = {}
+_LARGE_LIQ_LOG_INTERVAL_SEC = 1.0
+
+# Raw frames buffered between the socket reader and the parser; oldest dropped when full
+_FRAME_QUEUE_MAXSIZE = 4096
+_PARSE_BATCH_SIZE = 64
+
+# Per-symbol heatmap bucket size: {symbol: bucket_size}
+_bucket_size: Dict[str, float] = {}
 
 
 def get_recent_liquidations(symbol: str, limit: int = 20) -> List[Dict[str, Any]]:
@@ -57,15 +85,14 @@ def get_recent_liquidations(symbol: str, limit: int = 20) -> List[Dict[str, Any]
     if symbol not in _liquidation_store:
         return []
     
-    liqs = list(_liquidation_store[symbol])
-    # Sort by timestamp descending (most recent first)
-    liqs.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-    return liqs[:limit]
+    # The deque is append-only in arrival order, so it is already time-ascending:
+    # walk it backwards for most-recent-first instead of sorting.
+    return [l.to_dict() for l in islice(reversed(_liquidation_store[symbol]), limit)]
 
 
 def get_liquidation_summary(symbol: str) -> Dict[str, Any]:
     """Get summary stats for recent liquidations."""
-    liqs = get_recent_liquidations(symbol, limit=_MAX_STORED_LIQUIDATIONS)
+    liqs = _liquidation_store.get(symbol)
     
     if not liqs:
         return {
@@ -77,22 +104,36 @@ def get_liquidation_summary(symbol: str) -> Dict[str, Any]:
             "short_liq_value": 0,
         }
     
-    # Filter to last 5 minutes for summary
-    now_ms = int(time.time() * 1000)
+    # Filter to last 5 minutes for summary; single pass over the store.
+    # The deque is in arrival order, so walk newest-first and stop at the cutoff.
+    now_ms = time.time_ns() // 1_000_000
     five_min_ago = now_ms - (5 * 60 * 1000)
-    recent = [l for l in liqs if l.get("timestamp", 0) > five_min_ago]
+    recent_count = long_count = short_count = 0
+    total_value = long_value = short_value = 0
+    for l in reversed(liqs):
+        if l.ts <= five_min_ago:
+            break
+        v = l.value_usd
+        recent_count += 1
+        total_value += v
+        if l.side == "SELL":
+            long_count += 1
+            long_value += v
+        elif l.side == "BUY":
+            short_count += 1
+            short_value += v
     
     return {
-        "recent_count": len(recent),
-        "long_liq_count": sum(1 for l in recent if l.get("side") == "SELL"),
-        "short_liq_count": sum(1 for l in recent if l.get("side") == "BUY"),
-        "total_value_usd": sum(l.get("value_usd", 0) for l in recent),
-        "long_liq_value": sum(l.get("value_usd", 0) for l in recent if l.get("side") == "SELL"),
-        "short_liq_value": sum(l.get("value_usd", 0) for l in recent if l.get("side") == "BUY"),
+        "recent_count": recent_count,
+        "long_liq_count": long_count,
+        "short_liq_count": short_count,
+        "total_value_usd": total_value,
+        "long_liq_value": long_value,
+        "short_liq_value": short_value,
     }
 
 
-def _store_liquidation(symbol: str, liq: Dict[str, Any]) -> None:
+def _store_liquidation(symbol: str, liq: LiquidationEvent) -> None:
     """Store a liquidation event in the in-memory store."""
     if symbol not in _liquidation_store:
         _liquidation_store[symbol] = deque(maxlen=_MAX_STORED_LIQUIDATIONS)
@@ -103,9 +144,9 @@ def _store_liquidation(symbol: str, liq: Dict[str, Any]) -> None:
     _aggregate_liquidation_level(symbol, liq)
 
 
-def _get_price_bucket(price: float, bucket_size: float) -> float:
-    """Round price to nearest bucket for aggregation."""
-    return round(price / bucket_size) * bucket_size
+def _price_tick(price: float, bucket_size: float) -> int:
+    """Index of the bucket nearest to price; the bucket price is tick * bucket_size."""
+    return int(price / bucket_size + 0.5)
 
 
 def _calculate_bucket_size(price: float) -> float:
@@ -122,7 +163,6 @@ def _calculate_bucket_size(price: float) -> float:
     raw_bucket = price * 0.001
     
     # Round to nearest power of 10 with nice multipliers
-    import math
     magnitude = 10 ** math.floor(math.log10(raw_bucket))
     normalized = raw_bucket / magnitude
     
@@ -136,27 +176,63 @@ def _calculate_bucket_size(price: float) -> float:
     return nice_bucket
 
 
-def _aggregate_liquidation_level(symbol: str, liq: Dict[str, Any]) -> None:
+def _bucket_size_for(symbol: str, price: float) -> float:
+    """Bucket size for symbol, kept while it stays within 0.025%-0.2% of price.
+
+    Sticking to one size per symbol keeps its tick keys consistent and skips the
+    log10 math on nearly every event. When price drifts out of range the size is
+    recomputed and the symbol's existing levels are re-bucketed.
+    """
+    bucket_size = _bucket_size.get(symbol)
+    if bucket_size is not None and bucket_size * 500 <= price <= bucket_size * 4000:
+        return bucket_size
+    
+    new_size = _calculate_bucket_size(price)
+    _bucket_size[symbol] = new_size
+    if bucket_size is not None and new_size != bucket_size and symbol in _liquidation_levels:
+        _rebucket_levels(symbol, bucket_size, new_size)
+    return new_size
+
+
+def _rebucket_levels(symbol: str, old_size: float, new_size: float) -> None:
+    """Merge a symbol's levels from old_size ticks into new_size ticks."""
+    rebucketed = SortedDict()
+    for tick, data in _liquidation_levels[symbol].items():
+        new_tick = _price_tick(tick * old_size, new_size)
+        level = rebucketed.get(new_tick)
+        if level is None:
+            rebucketed[new_tick] = dict(data)
+            continue
+        for key in ("long_value", "short_value", "long_count", "short_count", "total_value", "total_count"):
+            level[key] += data[key]
+        level["last_ts"] = max(level["last_ts"], data["last_ts"])
+    _liquidation_levels[symbol] = rebucketed
+    _levels_dirty.add(symbol)
+
+
+def _aggregate_liquidation_level(symbol: str, liq: LiquidationEvent) -> None:
     """Aggregate a liquidation into price level buckets for heatmap."""
-    price = liq.get("price", 0)
-    value_usd = liq.get("value_usd", 0)
-    side = liq.get("side", "")
-    ts = liq.get("timestamp", int(time.time() * 1000))
+    price = liq.price
+    value_usd = liq.value_usd
+    side = liq.side
+    ts = liq.ts
     
     if price <= 0 or value_usd <= 0:
         return
     
-    # Initialize symbol store if needed
-    if symbol not in _liquidation_levels:
-        _liquidation_levels[symbol] = {}
+    # Calculate bucket size based on price (sticky per symbol)
+    bucket_size = _bucket_size_for(symbol, price)
+    tick = _price_tick(price, bucket_size)
     
-    # Calculate bucket size based on price
-    bucket_size = _calculate_bucket_size(price)
-    bucket = _get_price_bucket(price, bucket_size)
+    # Initialize symbol store if needed
+    buckets = _liquidation_levels.get(symbol)
+    if buckets is None:
+        buckets = _liquidation_levels[symbol] = SortedDict()
     
     # Initialize or update bucket
-    if bucket not in _liquidation_levels[symbol]:
-        _liquidation_levels[symbol][bucket] = {
+    level = buckets.get(tick)
+    if level is None:
+        level = buckets[tick] = {
             "long_value": 0,
             "short_value": 0,
             "long_count": 0,
@@ -164,13 +240,12 @@ def _aggregate_liquidation_level(symbol: str, liq: Dict[str, Any]) -> None:
             "total_value": 0,
             "total_count": 0,
             "last_ts": ts,
-            "bucket_size": bucket_size,
         }
     
-    level = _liquidation_levels[symbol][bucket]
     level["last_ts"] = ts
     level["total_value"] += value_usd
     level["total_count"] += 1
+    _levels_dirty.add(symbol)
     
     if side == "SELL":  # Long liquidated
         level["long_value"] += value_usd
@@ -198,70 +273,217 @@ def get_liquidation_levels(symbol: str, current_price: float = 0, range_pct: flo
         - short_count: Number of short liquidations
         - intensity: Normalized intensity 0-1 for heatmap coloring
     """
-    if symbol not in _liquidation_levels:
+    now_ms = time.time_ns() // 1_000_000
+    snap = _levels_snap.get(symbol)
+    if symbol in _levels_dirty and (snap is None or now_ms - snap[0] >= _LEVEL_SNAPSHOT_MAX_AGE_MS):
+        snap = _publish_levels(symbol, now_ms)
+    if snap is None:
         return []
     
-    now_ms = int(time.time() * 1000)
+    _, bucket_size, buckets = snap
     levels = []
     max_value = 0
     
-    # Clean up expired levels and collect valid ones
-    expired_buckets = []
-    for bucket, data in _liquidation_levels[symbol].items():
-        # Remove levels older than expiry time
-        if now_ms - data["last_ts"] > _LEVEL_EXPIRY_MS:
-            expired_buckets.append(bucket)
-            continue
-        
-        # Filter by price range if current_price provided
-        if current_price > 0:
-            price_diff_pct = abs(bucket - current_price) / current_price * 100
-            if price_diff_pct > range_pct:
-                continue
-        
+    # Buckets are kept sorted by tick, so a range query only touches levels
+    # inside the window. Expiry is handled by _sweep_expired_levels.
+    if current_price > 0:
+        lo = current_price * (1 - range_pct / 100) / bucket_size
+        hi = current_price * (1 + range_pct / 100) / bucket_size
+        keys = buckets.irange(lo, hi)
+    else:
+        keys = buckets.keys()
+    
+    for tick in keys:
+        data = buckets[tick]
         level_data = {
-            "price": bucket,
+            "price": tick * bucket_size,
             "long_value": data["long_value"],
             "short_value": data["short_value"],
             "total_value": data["total_value"],
             "long_count": data["long_count"],
             "short_count": data["short_count"],
             "total_count": data["total_count"],
-            "bucket_size": data["bucket_size"],
+            "bucket_size": bucket_size,
         }
         levels.append(level_data)
         max_value = max(max_value, data["total_value"])
     
-    # Clean up expired buckets
-    for bucket in expired_buckets:
-        del _liquidation_levels[symbol][bucket]
-    
     # Calculate intensity for each level (normalized 0-1)
     if max_value > 0:
         for level in levels:
             level["intensity"] = level["total_value"] / max_value
     
-    # Sort by price ascending
-    levels.sort(key=lambda x: x["price"])
-    
     return levels
 
 
+def _publish_levels(symbol: str, now_ms: int) -> Optional[Tuple[int, float, SortedDict]]:
+    """Replace the read-side snapshot of symbol's buckets with a fresh copy."""
+    _levels_dirty.discard(symbol)
+    buckets = _liquidation_levels.get(symbol)
+    if not buckets:
+        _levels_snap.pop(symbol, None)
+        return None
+    snap = (now_ms, _bucket_size[symbol], SortedDict({tick: dict(data) for tick, data in buckets.items()}))
+    _levels_snap[symbol] = snap
+    return snap
+
+
+def _expire_levels(now_ms: int) -> int:
+    """Drop heatmap buckets not updated within _LEVEL_EXPIRY_MS. Returns count removed."""
+    cutoff = now_ms - _LEVEL_EXPIRY_MS
+    removed = 0
+    for symbol, buckets in list(_liquidation_levels.items()):
+        expired = [b for b, data in buckets.items() if data["last_ts"] < cutoff]
+        for b in expired:
+            del buckets[b]
+        if expired:
+            _levels_dirty.add(symbol)
+        removed += len(expired)
+    return removed
+
+
+async def _sweep_expired_levels(interval_sec: float = _LEVEL_SWEEP_INTERVAL_SEC) -> None:
+    """Periodically expire stale heatmap buckets for all symbols."""
+    while True:
+        await asyncio.sleep(interval_sec)
+        try:
+            removed = _expire_levels(time.time_ns() // 1_000_000)
+            if removed:
+                log.debug(f"Expired {removed} Binance liquidation levels")
+        except Exception as e:
+            log.debug(f"Binance liquidation level sweep error: {e}")
+
+
 def clear_liquidation_levels(symbol: str = None) -> None:
     """Clear liquidation levels cache.
     
     Args:
         symbol: Specific symbol to clear, or None to clear all
     """
-    global _liquidation_levels
+    global _liquidation_levels, _levels_snap
     if symbol:
         if symbol in _liquidation_levels:
             del _liquidation_levels[symbol]
+        _levels_snap.pop(symbol, None)
+        _levels_dirty.discard(symbol)
     else:
         _liquidation_levels = {}
+        _levels_snap = {}
+        _levels_dirty.clear()
 
 
-async def stream_all_liquidations(symbols: Optional[Set[str]] = None) -> AsyncIterator[dict]:
+def _parse_force_order(message: Union[str, bytes], symbols: Optional[AbstractSet[str]]) -> Optional[LiquidationEvent]:
+    """Decode one !forceOrder@arr frame into a LiquidationEvent (None if skipped)."""
+    data = _json.loads(message)
+    
+    # Handle combined stream format
+    payload = data.get("data") if isinstance(data, dict) else None
+    if not payload:
+        return None
+    
+    # Check event type
+    if payload.get("e") != "forceOrder":
+        return None
+    
+    order = payload.get("o", {})
+    if not order:
+        return None
+    
+    symbol = order.get("s", "")
+    
+    # Filter by symbols if provided
+    if symbols is not None and symbol not in symbols:
+        return None
+    
+    # Parse liquidation data. Numbers arrive as JSON strings, so each field costs
+    # one float(); fall back to the limit price / original qty only when the
+    # average price / filled qty is missing or zero (e.g. "0").
+    price = float(order.get("ap") or 0) or float(order.get("p") or 0)  # Average price or limit price
+    qty = float(order.get("z") or 0) or float(order.get("q") or 0)  # Filled qty or original qty
+    ts = order.get("T") or payload.get("E") or time.time_ns() // 1_000_000  # JSON integers decode to int already
+    
+    # Side: SELL = long position liquidated, BUY = short position liquidated
+    side = order.get("S", "")
+    
+    if not symbol or not price or not qty:
+        return None
+    
+    return LiquidationEvent(
+        exchange="binance",
+        symbol=symbol,
+        ts=ts,
+        price=price,
+        qty=qty,
+        value_usd=price * qty,
+        side=side,
+        source="binance_ws",
+        status=order.get("X", ""),
+    )
+
+
+def _handle_force_order(message: Union[str, bytes], symbols: Optional[AbstractSet[str]]) -> Optional[LiquidationEvent]:
+    """Parse one frame and record it in the in-memory stores.
+
+    This is the whole per-frame kernel (decode, normalize, store, aggregate);
+    the websocket coroutine only moves frames and yields the results.
+    """
+    event = _parse_force_order(message, symbols)
+    if event is None:
+        return None
+    
+    # Store in memory for REST API access
+    _store_liquidation(event.symbol, event)
+    
+    # Tally significant liquidations (> $100k); _flush_large_liquidations logs them
+    if event.value_usd > 100_000:
+        t = _large_liq_accum.get(event.symbol)
+        is_long = 1 if event.side == "SELL" else 0
+        if t is None:
+            _large_liq_accum[event.symbol] = (1, event.value_usd, is_long)
+        else:
+            _large_liq_accum[event.symbol] = (t[0] + 1, t[1] + event.value_usd, t[2] + is_long)
+    return event
+
+
+def _flush_large_liquidations() -> None:
+    """Log one summary line for the large liquidations tallied since the last flush."""
+    if not _large_liq_accum:
+        return
+    parts = [
+        f"{sym} {count}@${value:,.0f} ({longs}L/{count - longs}S)"
+        for sym, (count, value, longs) in sorted(_large_liq_accum.items(), key=lambda kv: kv[1][1], reverse=True)
+    ]
+    _large_liq_accum.clear()
+    log.info(f"Large liquidations ({_LARGE_LIQ_LOG_INTERVAL_SEC:g}s): " + ", ".join(parts))
+
+
+async def _large_liquidation_logger(interval_sec: float = _LARGE_LIQ_LOG_INTERVAL_SEC) -> None:
+    """Periodically flush the large-liquidation tally to the log."""
+    while True:
+        await asyncio.sleep(interval_sec)
+        try:
+            _flush_large_liquidations()
+        except Exception as e:
+            log.debug(f"Binance large liquidation log error: {e}")
+
+
+def _put_latest(queue: asyncio.Queue, item: Any) -> None:
+    """Enqueue without blocking, dropping the oldest frame when the queue is full."""
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+async def _read_frames(ws, queue: asyncio.Queue) -> None:
+    """Move raw frames from the socket into queue; enqueue None when the socket ends."""
+    try:
+        async for message in ws:
+            _put_latest(queue, message)
+    finally:
+        _put_latest(queue, None)
+
+
+async def stream_all_liquidations(symbols: Optional[AbstractSet[str]] = None) -> AsyncIterator[LiquidationEvent]:
     """Yield normalized liquidation events for all Binance USDT perpetual symbols.
 
     Uses the !forceOrder@arr stream which provides liquidations for ALL symbols
@@ -270,7 +492,7 @@ async def stream_all_liquidations(symbols: Optional[Set[str]] = None) -> AsyncIt
     Args:
         symbols: Optional set of symbols to filter. If None, yields all liquidations.
 
-    Normalized event:
+    Yields `LiquidationEvent` instances; call `.to_dict()` to serialize:
       {
         "exchange": "binance",
         "symbol": "BTCUSDT",
@@ -282,13 +504,17 @@ async def stream_all_liquidations(symbols: Optional[Set[str]] = None) -> AsyncIt
       }
     """
 
+    # Build the filter once; None (not an empty set) means "no filter" on the hot path
+    symbols = frozenset(symbols) if symbols else None
+
     # Use the all-symbols liquidation stream - much more efficient
     stream = "!forceOrder@arr"
     url = f"{BINANCE_FUTURES_WS}?streams={stream}"
 
-    backoff = 1.0
+    backoff = Backoff(cap=20)
     attempt = 0
     while True:
+        connected_at: Optional[float] = None
         try:
             attempt += 1
             log.info(f"Binance liquidations WS connect (all symbols, attempt {attempt})")
@@ -299,76 +525,51 @@ async def stream_all_liquidations(symbols: Optional[Set[str]] = None) -> AsyncIt
                 close_timeout=10,
                 max_queue=4096,
             ) as ws:
-                backoff = 1.0
+                connected_at = time.monotonic()
                 log.info("Binance liquidations stream connected")
                 
-                async for message in ws:
-                    try:
-                        data = json.loads(message)
-                        
-                        # Handle combined stream format
-                        payload = data.get("data") if isinstance(data, dict) else None
-                        if not payload:
-                            continue
-                        
-                        # Check event type
-                        if payload.get("e") != "forceOrder":
-                            continue
-                        
-                        order = payload.get("o", {})
-                        if not order:
-                            continue
-                        
-                        symbol = order.get("s", "")
-                        
-                        # Filter by symbols if provided
-                        if symbols and symbol not in symbols:
-                            continue
-                        
-                        # Parse liquidation data
-                        price = float(order.get("ap") or order.get("p") or 0)  # Average price or limit price
-                        qty = float(order.get("z") or order.get("q") or 0)  # Filled qty or original qty
-                        ts = int(order.get("T") or payload.get("E") or 0)
-                        
-                        # Side: SELL = long position liquidated, BUY = short position liquidated
-                        side = order.get("S", "")
-                        
-                        if not symbol or not price or not qty:
-                            continue
-                        
-                        normalized = {
-                            "exchange": "binance",
-                            "symbol": symbol,
-                            "ts": ts,
-                            "timestamp": ts,
-                            "price": price,
-                            "qty": qty,
-                            "value_usd": price * qty,
-                            "side": side,
-                            "status": order.get("X", ""),
-                            "source": "binance_ws"
-                        }
-                        
-                        # Store in memory for REST API access
-                        _store_liquidation(symbol, normalized)
-                        
-                        # Log significant liquidations (> $100k)
-                        if normalized["value_usd"] > 100_000:
-                            side_label = "LONG" if side == "SELL" else "SHORT"
-                            log.info(f"Large {side_label} liquidation: {symbol} ${normalized['value_usd']:,.0f} @ {price}")
+                # Network reads run in their own task so bursts keep being received
+                # while the previous batch is parsed, stored and yielded.
+                queue: asyncio.Queue = asyncio.Queue(maxsize=_FRAME_QUEUE_MAXSIZE)
+                reader = asyncio.create_task(_read_frames(ws, queue))
+                try:
+                    closed = False
+                    while not closed:
+                        batch = [await queue.get()]
+                        for _ in range(min(_PARSE_BATCH_SIZE - 1, queue.qsize())):
+                            batch.append(queue.get_nowait())
                         
-                        yield normalized
+                        events = []
+                        for message in batch:
+                            if message is None:
+                                closed = True
+                                break
+                            try:
+                                event = _handle_force_order(message, symbols)
+                            except Exception as e:
+                                log.debug(f"Binance liquidations parse error: {e}")
+                                continue
+                            if event is not None:
+                                events.append(event)
                         
-                    except Exception as e:
-                        log.debug(f"Binance liquidations parse error: {e}")
-                        continue
+                        for event in events:
+                            yield event
+                    
+                    # Surfaces the connection error (if any) so we back off and reconnect
+                    await reader
+                finally:
+                    reader.cancel()
                         
         except asyncio.CancelledError:
             raise
         except Exception as e:
-            log.warning(f"Binance liquidations WS error: {type(e).__name__}: {e} (reconnect {backoff:.1f}s)")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 20)
+            # Only a connection that stayed up for a while earns a fresh backoff, so a
+            # connect-then-drop loop keeps backing off instead of hammering Binance.
+            if connected_at is not None and time.monotonic() - connected_at >= STABLE_CONNECTION_SEC:
+                backoff.reset()
+            delay = backoff.next_delay()
+            log.warning(f"Binance liquidations WS error: {type(e).__name__}: {e} (reconnect {delay:.1f}s)")
+            await asyncio.sleep(delay)
 
 
 async def run_liquidation_collector(symbols: Optional[List[str]] = None) -> None:
@@ -380,11 +581,13 @@ async def run_liquidation_collector(symbols: Optional[List[str]] = None) -> None
     Args:
         symbols: Optional list of symbols to filter. If None, collects all liquidations.
     """
-    symbols_set = set(symbols) if symbols else None
+    symbols_set = frozenset(symbols) if symbols else None
     
     log.info(f"Starting Binance liquidation collector" + 
              (f" for {len(symbols_set)} symbols" if symbols_set else " for all symbols"))
     
+    sweeper = asyncio.create_task(_sweep_expired_levels())
+    large_liq_logger = asyncio.create_task(_large_liquidation_logger())
     try:
         async for liq in stream_all_liquidations(symbols_set):
             # Event is already stored in _store_liquidation
@@ -396,3 +599,6 @@ async def run_liquidation_collector(symbols: Optional[List[str]] = None) -> None
     except Exception as e:
         log.error(f"Binance liquidation collector error: {e}")
         raise
+    finally:
+        sweeper.cancel()
+        large_liq_logger.cancel()
@@ -15,18 +15,33 @@ Wall Detection Logic:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
-from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
+from bisect import bisect_left, bisect_right
+from operator import neg
+from typing import AsyncIterator, Dict, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, field
 
 import websockets
 
 from ..config import BINANCE_FUTURES_WS, WS_PING_INTERVAL
+from . import _json
+from ._mux import SubscriptionBatcher
+from ._reconnect import STABLE_CONNECTION_SEC, Backoff
 
 log = logging.getLogger(__name__)
 
+_WALLS_REFRESH_MS = 500  # recompute streamed walls at least this often
+_WALLS_MOVE_FRAC = 1e-4  # ...or sooner when best bid/ask moves by this fraction of mid
+
+# Partial-depth frames are full snapshots, so a backlog is pure staleness: keep the
+# socket buffer small and skip straight to the newest frames when it builds up.
+_WS_MAX_QUEUE = 32
+_STALE_BACKLOG = 8
+
+# The combined connection interleaves many symbols, so it cannot skip frames by backlog
+_COMBINED_WS_MAX_QUEUE = 1024
+
 
 @dataclass
 class OrderBookLevel:
@@ -47,54 +62,166 @@ class OrderBookWall:
     distance_pct: float  # Distance from current price as percentage
     
 
+def _side_arrays(levels: List[List[str]], descending: bool) -> Tuple[List[float], List[float], List[float]]:
+    """Convert raw [price, qty] levels into parallel price/qty/value lists sorted best-first."""
+    rows = []
+    for lvl in levels:
+        qty = float(lvl[1])
+        if qty > 0:
+            rows.append((float(lvl[0]), qty))
+    rows.sort(reverse=descending)
+    return [r[0] for r in rows], [r[1] for r in rows], [r[0] * r[1] for r in rows]
+
+
+def _apply_delta(
+    prices: List[float],
+    qtys: List[float],
+    values: List[float],
+    levels: List[List[str]],
+    descending: bool,
+) -> None:
+    """Apply [price, qty] updates in place, keeping prices sorted best-first (qty 0 = remove)."""
+    key = neg if descending else None
+    for lvl in levels:
+        price, qty = float(lvl[0]), float(lvl[1])
+        i = bisect_left(prices, -price if descending else price, key=key)
+        found = i < len(prices) and prices[i] == price
+        if qty == 0:
+            if found:
+                del prices[i]
+                del qtys[i]
+                del values[i]
+        elif found:
+            qtys[i] = qty
+            values[i] = price * qty
+        else:
+            prices.insert(i, price)
+            qtys.insert(i, qty)
+            values.insert(i, price * qty)
+
+
+def _scan_walls(
+    prices: List[float],
+    values: List[float],
+    mid_price: float,
+    min_strength: float,
+    max_distance_pct: float,
+) -> List[Tuple[int, float, float]]:
+    """Find wall levels in one side of the book.
+    
+    Args:
+        prices: Level prices, best-first
+        values: Level notional values (price * qty), parallel to prices
+        mid_price: Current mid price (must be > 0)
+        min_strength: Minimum multiplier above the side's average value
+        max_distance_pct: Maximum distance from mid price to consider
+        
+    Returns:
+        (index, strength, distance_pct) for each qualifying level, in book order
+    """
+    if not values:
+        return []
+    avg_value = sum(values) / len(values)
+    if avg_value <= 0:
+        return []
+    
+    hits = []
+    for i, price in enumerate(prices):
+        distance_pct = abs(mid_price - price) / mid_price * 100
+        if distance_pct > max_distance_pct:
+            continue
+        strength = values[i] / avg_value
+        if strength >= min_strength:
+            hits.append((i, strength, distance_pct))
+    return hits
+
+
+def _analyze_side(
+    prices: List[float],
+    qtys: List[float],
+    values: List[float],
+    side: str,
+    mid_price: float,
+    min_strength: float,
+    max_distance_pct: float,
+) -> List[Dict[str, Any]]:
+    """Build wall dicts for one side of the book ('support' = bids, 'resistance' = asks)."""
+    return [
+        {
+            "price": prices[i],
+            "quantity": qtys[i],
+            "value_usd": values[i],
+            "side": side,
+            "strength": round(strength, 2),
+            "distance_pct": round(distance_pct, 2)
+        }
+        for i, strength, distance_pct in _scan_walls(prices, values, mid_price, min_strength, max_distance_pct)
+    ]
+
+
 @dataclass
 class OrderBookState:
-    """Current state of the order book for a symbol."""
+    """Current state of the order book for a symbol.
+
+    Stored as parallel price/qty/value lists (structure-of-arrays) sorted best-first:
+    bids by descending price, asks by ascending price. Sorting and the
+    price * qty products happen once per update, so queries just slice the top levels.
+    """
     symbol: str
-    bids: Dict[float, float] = field(default_factory=dict)  # price -> qty
-    asks: Dict[float, float] = field(default_factory=dict)  # price -> qty
+    bid_prices: List[float] = field(default_factory=list)
+    bid_qtys: List[float] = field(default_factory=list)
+    bid_values: List[float] = field(default_factory=list)
+    ask_prices: List[float] = field(default_factory=list)
+    ask_qtys: List[float] = field(default_factory=list)
+    ask_values: List[float] = field(default_factory=list)
     last_update_id: int = 0
     last_update_ts: int = 0
+    # detect_walls results for the current book, keyed by call parameters; reset on every update
+    _walls_cache: Dict[Tuple[float, int, float, float], Dict[str, List[Dict[str, Any]]]] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    # Raw levels of the last snapshot, to skip re-converting a side that did not change
+    _raw_bids: Optional[List[List[str]]] = field(default=None, repr=False, compare=False)
+    _raw_asks: Optional[List[List[str]]] = field(default=None, repr=False, compare=False)
     
-    def update_from_snapshot(self, bids: List[List[str]], asks: List[List[str]], update_id: int):
-        """Initialize from a depth snapshot."""
-        self.bids.clear()
-        self.asks.clear()
-        for b in bids:
-            price, qty = float(b[0]), float(b[1])
-            if qty > 0:
-                self.bids[price] = qty
-        for a in asks:
-            price, qty = float(a[0]), float(a[1])
-            if qty > 0:
-                self.asks[price] = qty
+    def update_from_snapshot(
+        self, bids: List[List[str]], asks: List[List[str]], update_id: int, now_ms: Optional[int] = None
+    ):
+        """Initialize from a depth snapshot (now_ms: frame receive time, read from the clock if omitted)."""
+        # Comparing the raw string levels is far cheaper than float-converting and
+        # sorting them, and quiet books often resend an identical side.
+        changed = False
+        if bids != self._raw_bids:
+            self.bid_prices, self.bid_qtys, self.bid_values = _side_arrays(bids, descending=True)
+            self._raw_bids = bids
+            changed = True
+        if asks != self._raw_asks:
+            self.ask_prices, self.ask_qtys, self.ask_values = _side_arrays(asks, descending=False)
+            self._raw_asks = asks
+            changed = True
+        if changed:
+            self._walls_cache.clear()
         self.last_update_id = update_id
-        self.last_update_ts = int(time.time() * 1000)
+        self.last_update_ts = now_ms if now_ms is not None else int(time.time() * 1000)
     
-    def update_from_delta(self, bids: List[List[str]], asks: List[List[str]], update_id: int):
-        """Apply incremental updates."""
-        for b in bids:
-            price, qty = float(b[0]), float(b[1])
-            if qty == 0:
-                self.bids.pop(price, None)
-            else:
-                self.bids[price] = qty
-        for a in asks:
-            price, qty = float(a[0]), float(a[1])
-            if qty == 0:
-                self.asks.pop(price, None)
-            else:
-                self.asks[price] = qty
+    def update_from_delta(
+        self, bids: List[List[str]], asks: List[List[str]], update_id: int, now_ms: Optional[int] = None
+    ):
+        """Apply incremental updates (now_ms as in update_from_snapshot)."""
+        _apply_delta(self.bid_prices, self.bid_qtys, self.bid_values, bids, descending=True)
+        _apply_delta(self.ask_prices, self.ask_qtys, self.ask_values, asks, descending=False)
+        self._raw_bids = self._raw_asks = None
+        self._walls_cache.clear()
         self.last_update_id = update_id
-        self.last_update_ts = int(time.time() * 1000)
+        self.last_update_ts = now_ms if now_ms is not None else int(time.time() * 1000)
     
     def get_best_bid(self) -> Optional[float]:
         """Get highest bid price."""
-        return max(self.bids.keys()) if self.bids else None
+        return self.bid_prices[0] if self.bid_prices else None
     
     def get_best_ask(self) -> Optional[float]:
         """Get lowest ask price."""
-        return min(self.asks.keys()) if self.asks else None
+        return self.ask_prices[0] if self.ask_prices else None
     
     def get_mid_price(self) -> Optional[float]:
         """Get mid price between best bid and ask."""
@@ -116,69 +243,42 @@ class OrderBookState:
         Args:
             min_strength: Minimum multiplier above average to be considered a wall
             max_levels: Maximum number of price levels to analyze on each side
-            max_distance_pct: Maximum distance from mid price to consider
+            max_distance_pct: Maximum distance from mid price to consider; the
+                average that strength is measured against only covers this window
             cluster_pct: Percentage range to cluster nearby walls (0 = no clustering)
             
         Returns:
-            Dict with 'support' and 'resistance' lists of wall data
+            Dict with 'support' and 'resistance' lists of wall data. The result is
+            cached until the next book update and shared between callers, so treat
+            it as read-only.
         """
+        key = (min_strength, max_levels, max_distance_pct, cluster_pct)
+        cached = self._walls_cache.get(key)
+        if cached is not None:
+            return cached
+        
         mid_price = self.get_mid_price()
         if not mid_price or mid_price <= 0:
             return {"support": [], "resistance": []}
         
-        support_walls = []
-        resistance_walls = []
+        # Restrict each side to levels within max_distance_pct of mid, so far-away
+        # liquidity neither gets scanned nor skews the average used for strength
+        band = mid_price * max_distance_pct / 100
+        n_bids = min(max_levels, bisect_right(self.bid_prices, band - mid_price, key=neg))
+        n_asks = min(max_levels, bisect_right(self.ask_prices, mid_price + band))
         
-        # Analyze bids (support)
-        if self.bids:
-            sorted_bids = sorted(self.bids.items(), key=lambda x: x[0], reverse=True)[:max_levels]
-            bid_values = [(price, qty, price * qty) for price, qty in sorted_bids]
-            
-            if bid_values:
-                avg_value = sum(v[2] for v in bid_values) / len(bid_values)
-                
-                for price, qty, value in bid_values:
-                    distance_pct = abs(mid_price - price) / mid_price * 100
-                    if distance_pct > max_distance_pct:
-                        continue
-                    
-                    strength = value / avg_value if avg_value > 0 else 0
-                    if strength >= min_strength:
-                        support_walls.append({
-                            "price": price,
-                            "quantity": qty,
-                            "value_usd": value,
-                            "side": "support",
-                            "strength": round(strength, 2),
-                            "distance_pct": round(distance_pct, 2)
-                        })
-        
-        # Analyze asks (resistance)
-        if self.asks:
-            sorted_asks = sorted(self.asks.items(), key=lambda x: x[0])[:max_levels]
-            ask_values = [(price, qty, price * qty) for price, qty in sorted_asks]
-            
-            if ask_values:
-                avg_value = sum(v[2] for v in ask_values) / len(ask_values)
-                
-                for price, qty, value in ask_values:
-                    distance_pct = abs(price - mid_price) / mid_price * 100
-                    if distance_pct > max_distance_pct:
-                        continue
-                    
-                    strength = value / avg_value if avg_value > 0 else 0
-                    if strength >= min_strength:
-                        resistance_walls.append({
-                            "price": price,
-                            "quantity": qty,
-                            "value_usd": value,
-                            "side": "resistance",
-                            "strength": round(strength, 2),
-                            "distance_pct": round(distance_pct, 2)
-                        })
+        support_walls = _analyze_side(
+            self.bid_prices[:n_bids], self.bid_qtys[:n_bids], self.bid_values[:n_bids],
+            "support", mid_price, min_strength, max_distance_pct,
+        )
+        resistance_walls = _analyze_side(
+            self.ask_prices[:n_asks], self.ask_qtys[:n_asks], self.ask_values[:n_asks],
+            "resistance", mid_price, min_strength, max_distance_pct,
+        )
         
-        # Cluster nearby walls if requested
+        # Cluster nearby walls if requested (bids are collected best-first, i.e. descending)
         if cluster_pct > 0:
+            support_walls.reverse()
             support_walls = self._cluster_walls(support_walls, mid_price, cluster_pct)
             resistance_walls = self._cluster_walls(resistance_walls, mid_price, cluster_pct)
         
@@ -186,10 +286,12 @@ class OrderBookState:
         support_walls.sort(key=lambda x: x["strength"], reverse=True)
         resistance_walls.sort(key=lambda x: x["strength"], reverse=True)
         
-        return {
+        walls = {
             "support": support_walls[:10],
             "resistance": resistance_walls[:10]
         }
+        self._walls_cache[key] = walls
+        return walls
     
     def _cluster_walls(
         self, 
@@ -199,56 +301,51 @@ class OrderBookState:
     ) -> List[Dict[str, Any]]:
         """Cluster nearby walls together into aggregated zones.
         
-        Combines walls that are within cluster_pct of each other.
+        Combines walls that are within cluster_pct of each other. Expects walls
+        in ascending price order, which the book arrays already provide.
         """
         if not walls or cluster_pct <= 0:
             return walls
         
-        # Sort by price
-        sorted_walls = sorted(walls, key=lambda x: x["price"])
         clustered = []
+        cluster: List[Dict[str, Any]] = []
+        start_price = total_value = total_qty = price_value = strength_sum = 0.0
         
-        i = 0
-        while i < len(sorted_walls):
-            # Start a new cluster
-            cluster_walls = [sorted_walls[i]]
-            cluster_start_price = sorted_walls[i]["price"]
-            
-            # Add nearby walls to cluster
-            j = i + 1
-            while j < len(sorted_walls):
-                price_diff_pct = abs(sorted_walls[j]["price"] - cluster_start_price) / cluster_start_price * 100
-                if price_diff_pct <= cluster_pct:
-                    cluster_walls.append(sorted_walls[j])
-                    j += 1
-                else:
-                    break
-            
-            # Aggregate cluster
-            if len(cluster_walls) == 1:
-                clustered.append(cluster_walls[0])
-            else:
-                # Combine into single aggregated wall
-                total_value = sum(w["value_usd"] for w in cluster_walls)
-                total_qty = sum(w["quantity"] for w in cluster_walls)
-                # Use value-weighted average price
-                weighted_price = sum(w["price"] * w["value_usd"] for w in cluster_walls) / total_value
-                avg_strength = sum(w["strength"] for w in cluster_walls) / len(cluster_walls)
-                distance_pct = abs(weighted_price - mid_price) / mid_price * 100
-                
-                clustered.append({
-                    "price": round(weighted_price, 2),
-                    "quantity": total_qty,
-                    "value_usd": total_value,
-                    "side": cluster_walls[0]["side"],
-                    "strength": round(avg_strength * len(cluster_walls), 2),  # Boost strength for clusters
-                    "distance_pct": round(distance_pct, 2),
-                    "is_cluster": True,
-                    "cluster_count": len(cluster_walls),
-                    "price_range": [min(w["price"] for w in cluster_walls), max(w["price"] for w in cluster_walls)]
-                })
-            
-            i = j
+        def flush() -> None:
+            if len(cluster) == 1:
+                clustered.append(cluster[0])
+                return
+            # Combine into single aggregated wall with value-weighted average price
+            weighted_price = price_value / total_value
+            avg_strength = strength_sum / len(cluster)
+            distance_pct = abs(weighted_price - mid_price) / mid_price * 100
+            clustered.append({
+                "price": round(weighted_price, 2),
+                "quantity": total_qty,
+                "value_usd": total_value,
+                "side": cluster[0]["side"],
+                "strength": round(avg_strength * len(cluster), 2),  # Boost strength for clusters
+                "distance_pct": round(distance_pct, 2),
+                "is_cluster": True,
+                "cluster_count": len(cluster),
+                "price_range": [start_price, cluster[-1]["price"]]
+            })
+        
+        # Single pass: running totals per cluster, flushed when a wall falls outside it
+        for w in walls:
+            price = w["price"]
+            if cluster and abs(price - start_price) / start_price * 100 > cluster_pct:
+                flush()
+                cluster = []
+            if not cluster:
+                start_price = price
+                total_value = total_qty = price_value = strength_sum = 0.0
+            cluster.append(w)
+            total_value += w["value_usd"]
+            total_qty += w["quantity"]
+            price_value += price * w["value_usd"]
+            strength_sum += w["strength"]
+        flush()
         
         return clustered
     
@@ -282,13 +379,17 @@ class OrderBookState:
         mid_price = self.get_mid_price()
         
         # Top bids
-        sorted_bids = sorted(self.bids.items(), key=lambda x: x[0], reverse=True)[:levels]
-        top_bids = [{"price": p, "qty": q, "value": p * q} for p, q in sorted_bids]
+        top_bids = [
+            {"price": p, "qty": q, "value": v}
+            for p, q, v in zip(self.bid_prices[:levels], self.bid_qtys[:levels], self.bid_values[:levels])
+        ]
         total_bid_value = sum(b["value"] for b in top_bids)
         
         # Top asks
-        sorted_asks = sorted(self.asks.items(), key=lambda x: x[0])[:levels]
-        top_asks = [{"price": p, "qty": q, "value": p * q} for p, q in sorted_asks]
+        top_asks = [
+            {"price": p, "qty": q, "value": v}
+            for p, q, v in zip(self.ask_prices[:levels], self.ask_qtys[:levels], self.ask_values[:levels])
+        ]
         total_ask_value = sum(a["value"] for a in top_asks)
         
         # Imbalance ratio
@@ -329,7 +430,10 @@ def get_orderbook_walls(symbol: str, min_strength: float = 2.0) -> Dict[str, Lis
 async def stream_orderbook(symbol: str, depth_levels: int = 20) -> AsyncIterator[dict]:
     """Stream order book updates for a Binance symbol.
     
-    Yields normalized updates with wall detection.
+    Yields normalized updates with wall detection. The same dict object is
+    updated in place and re-yielded each frame. Walls are refreshed every
+    _WALLS_REFRESH_MS, or sooner if best bid/ask moves; in between, the previous
+    walls dict is re-sent as-is.
     
     Args:
         symbol: Trading pair (e.g., "BTCUSDT")
@@ -344,7 +448,17 @@ async def stream_orderbook(symbol: str, depth_levels: int = 20) -> AsyncIterator
         _orderbook_states[symbol] = OrderBookState(symbol=symbol)
     state = _orderbook_states[symbol]
     
-    backoff = 1.0
+    # Last streamed walls and the top of book they were computed against
+    walls: Optional[Dict[str, List[Dict[str, Any]]]] = None
+    walls_ts = 0
+    walls_bid: Optional[float] = None
+    walls_ask: Optional[float] = None
+    
+    # One dict is reused for every yielded update; consumers must read it before
+    # the next iteration (run_orderbook_collector does) and copy it to keep it.
+    out: Dict[str, Any] = {"type": "orderbook", "exchange": "binance", "symbol": symbol}
+    
+    backoff = Backoff(cap=20)
     attempt = 0
     
     while True:
@@ -357,14 +471,18 @@ async def stream_orderbook(symbol: str, depth_levels: int = 20) -> AsyncIterator
                 ping_interval=WS_PING_INTERVAL,
                 ping_timeout=60,
                 close_timeout=10,
-                max_queue=4096,
+                max_queue=_WS_MAX_QUEUE,
             ) as ws:
-                backoff = 1.0
+                backoff.reset()
                 log.info(f"Binance orderbook connected: {symbol}")
                 
+                pending = ws.messages  # frames received but not yet read
                 async for message in ws:
+                    if len(pending) > _STALE_BACKLOG:
+                        continue
                     try:
-                        data = json.loads(message)
+                        data = _json.loads(message)
+                        now_ms = int(time.time() * 1000)
                         
                         # Handle combined stream format
                         payload = data.get("data") if isinstance(data, dict) and "data" in data else data
@@ -380,31 +498,37 @@ async def stream_orderbook(symbol: str, depth_levels: int = 20) -> AsyncIterator
                             continue
                         
                         # Update state (partial depth gives us snapshots, not deltas)
-                        state.update_from_snapshot(bids, asks, update_id)
-                        
-                        # Detect walls
-                        walls = state.detect_walls(min_strength=1.5)
+                        state.update_from_snapshot(bids, asks, update_id, now_ms)
                         
                         # Get depth summary
                         depth = state.get_depth_summary(levels=10)
                         
-                        yield {
-                            "type": "orderbook",
-                            "exchange": "binance",
-                            "symbol": symbol,
-                            "ts": int(time.time() * 1000),
-                            "mid_price": depth["mid_price"],
-                            "best_bid": depth["best_bid"],
-                            "best_ask": depth["best_ask"],
-                            "spread": depth["spread"],
-                            "bid_ratio": depth["bid_ratio"],
-                            "imbalance": depth["imbalance"],
-                            "total_bid_value": depth["total_bid_value"],
-                            "total_ask_value": depth["total_ask_value"],
-                            "walls": walls,
-                        }
+                        # Detect walls, throttled unless the top of book moved materially
+                        best_bid, best_ask = depth["best_bid"], depth["best_ask"]
+                        move = (depth["mid_price"] or 0) * _WALLS_MOVE_FRAC
+                        if (
+                            walls is None
+                            or now_ms - walls_ts >= _WALLS_REFRESH_MS
+                            or best_bid is None or walls_bid is None or abs(best_bid - walls_bid) > move
+                            or best_ask is None or walls_ask is None or abs(best_ask - walls_ask) > move
+                        ):
+                            walls = state.detect_walls(min_strength=1.5)
+                            walls_ts = now_ms
+                            walls_bid, walls_ask = best_bid, best_ask
                         
-                    except json.JSONDecodeError:
+                        out["ts"] = now_ms
+                        out["mid_price"] = depth["mid_price"]
+                        out["best_bid"] = best_bid
+                        out["best_ask"] = best_ask
+                        out["spread"] = depth["spread"]
+                        out["bid_ratio"] = depth["bid_ratio"]
+                        out["imbalance"] = depth["imbalance"]
+                        out["total_bid_value"] = depth["total_bid_value"]
+                        out["total_ask_value"] = depth["total_ask_value"]
+                        out["walls"] = walls
+                        yield out
+                        
+                    except _json.JSONDecodeError:
                         continue
                     except Exception as e:
                         log.debug(f"Binance orderbook parse error: {e}")
@@ -413,9 +537,9 @@ async def stream_orderbook(symbol: str, depth_levels: int = 20) -> AsyncIterator
         except asyncio.CancelledError:
             raise
         except Exception as e:
-            log.warning(f"Binance orderbook WS error {symbol}: {type(e).__name__}: {e} (reconnect {backoff:.1f}s)")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 20)
+            delay = backoff.next_delay()
+            log.warning(f"Binance orderbook WS error {symbol}: {type(e).__name__}: {e} (reconnect {delay:.1f}s)")
+            await asyncio.sleep(delay)
 
 
 async def run_orderbook_collector(symbol: str) -> None:
@@ -449,3 +573,123 @@ async def run_orderbook_collector(symbol: str) -> None:
     except Exception as e:
         log.error(f"Binance orderbook collector error {symbol}: {e}")
         raise
+
+
+class CombinedOrderBookStream:
+    """Keeps order book states for many symbols updated over one combined connection.
+    
+    Symbols are added/removed with SUBSCRIBE/UNSUBSCRIBE requests on the live socket
+    instead of opening a socket per symbol; changes are batched into one request
+    per window, and on (re)connect the current set is subscribed in one request.
+    Each frame is routed to its symbol's OrderBookState via the payload's "s"
+    field. Walls are computed on demand by readers.
+    """
+    
+    def __init__(self, depth_levels: int = 20) -> None:
+        self._depth_levels = depth_levels
+        self._symbols: Set[str] = set()
+        self._ws = None
+        self._req_id = 0
+        self._batcher = SubscriptionBatcher(self._send_batch)
+    
+    @property
+    def symbols(self) -> Set[str]:
+        return self._symbols
+    
+    def _stream_name(self, symbol: str) -> str:
+        return f"{symbol.lower()}@depth{self._depth_levels}@100ms"
+    
+    async def add(self, symbol: str) -> None:
+        """Start tracking a symbol (subscribed with the next batch if connected)."""
+        if symbol in self._symbols:
+            return
+        self._symbols.add(symbol)
+        if symbol not in _orderbook_states:
+            _orderbook_states[symbol] = OrderBookState(symbol=symbol)
+        self._batcher.queue(symbol, True)
+    
+    async def remove(self, symbol: str) -> None:
+        """Stop tracking a symbol."""
+        if symbol not in self._symbols:
+            return
+        self._symbols.discard(symbol)
+        self._batcher.queue(symbol, False)
+    
+    async def _send_batch(self, subscribe: bool, symbols: List[str]) -> None:
+        await self._request("SUBSCRIBE" if subscribe else "UNSUBSCRIBE", symbols)
+    
+    async def _request(self, method: str, symbols: List[str]) -> None:
+        ws = self._ws
+        if ws is None or not symbols:
+            return  # run() subscribes the current set when it connects
+        self._req_id += 1
+        msg = {"method": method, "params": [self._stream_name(s) for s in symbols], "id": self._req_id}
+        try:
+            await ws.send(_json.dumps(msg))
+        except Exception as e:
+            # The read loop sees the broken socket and resubscribes everything on reconnect
+            log.debug(f"Binance orderbook {method} failed: {e}")
+    
+    async def run(self) -> None:
+        """Connect, subscribe and route depth frames until cancelled."""
+        backoff = Backoff(cap=20)
+        attempt = 0
+        
+        while True:
+            connected_at: Optional[float] = None
+            try:
+                attempt += 1
+                log.info(f"Binance combined orderbook WS connect ({len(self._symbols)} symbols, attempt {attempt})")
+                
+                async with websockets.connect(
+                    BINANCE_FUTURES_WS,
+                    ping_interval=WS_PING_INTERVAL,
+                    ping_timeout=60,
+                    close_timeout=10,
+                    max_queue=_COMBINED_WS_MAX_QUEUE,
+                ) as ws:
+                    connected_at = time.monotonic()
+                    self._ws = ws
+                    await self._request("SUBSCRIBE", sorted(self._symbols))
+                    log.info("Binance combined orderbook connected")
+                    
+                    try:
+                        async for message in ws:
+                            try:
+                                data = _json.loads(message)
+                                payload = data.get("data")
+                                if not payload:
+                                    continue  # subscription acks: {"result": null, "id": n}
+                                
+                                symbol = payload.get("s")
+                                if symbol not in self._symbols:
+                                    continue
+                                bids = payload.get("b") or []
+                                asks = payload.get("a") or []
+                                if not bids and not asks:
+                                    continue
+                                
+                                _orderbook_states[symbol].update_from_snapshot(
+                                    bids, asks, payload.get("u") or 0, int(time.time() * 1000)
+                                )
+                            except _json.JSONDecodeError:
+                                continue
+                            except Exception as e:
+                                log.debug(f"Binance combined orderbook parse error: {e}")
+                                continue
+                    finally:
+                        self._ws = None
+                reason = "closed by server"
+                    
+            except asyncio.CancelledError:
+                log.info("Binance combined orderbook stream cancelled")
+                raise
+            except Exception as e:
+                reason = f"error: {type(e).__name__}: {e}"
+            # Only a connection that stayed up for a while earns a fresh backoff, so a
+            # connect-then-drop loop keeps backing off instead of resubscribing every symbol.
+            if connected_at is not None and time.monotonic() - connected_at >= STABLE_CONNECTION_SEC:
+                backoff.reset()
+            delay = backoff.next_delay()
+            log.warning(f"Binance combined orderbook WS {reason} (reconnect {delay:.1f}s)")
+            await asyncio.sleep(delay)
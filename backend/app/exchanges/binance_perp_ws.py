@@ -1,7 +1,9 @@
 from __future__ import annotations
 import asyncio
-import json
-from typing import AsyncIterator, List
+import logging
+import os
+import time
+from typing import AsyncIterator, List, Optional
 
 import httpx
 import websockets
@@ -9,6 +11,8 @@ import websockets
 from ..config import (
     BINANCE_FUTURES_REST,
     BINANCE_FUTURES_WS,
+    BINANCE_SYMBOLS_CACHE_PATH,
+    BINANCE_SYMBOLS_CACHE_TTL_SEC,
     TOP_SYMBOLS,
     INCLUDE_SYMBOLS,
     EXCLUDE_SYMBOLS,
@@ -16,10 +20,42 @@ from ..config import (
 )
 from ..models import Kline
 from .base import PerpKlineSource
+from . import _json
+from ._reconnect import Backoff
+
+logger = logging.getLogger(__name__)
 
 REST_TICKER_24H = "/fapi/v1/ticker/24hr"
 EXCHANGE_INFO = "/fapi/v1/exchangeInfo"
 
+
+def _load_ranked_symbols() -> Optional[List[str]]:
+    """Return the cached volume-ranked symbol list if it is fresh, else None."""
+    if BINANCE_SYMBOLS_CACHE_TTL_SEC <= 0:
+        return None
+    try:
+        if time.time() - os.path.getmtime(BINANCE_SYMBOLS_CACHE_PATH) > BINANCE_SYMBOLS_CACHE_TTL_SEC:
+            return None
+        with open(BINANCE_SYMBOLS_CACHE_PATH, "rb") as f:
+            symbols = _json.loads(f.read())
+    except (OSError, ValueError):
+        return None
+    return symbols if isinstance(symbols, list) and symbols else None
+
+
+def _save_ranked_symbols(symbols: List[str]) -> None:
+    """Persist the volume-ranked symbol list (atomic replace; failures are non-fatal)."""
+    if BINANCE_SYMBOLS_CACHE_TTL_SEC <= 0 or not symbols:
+        return
+    tmp = f"{BINANCE_SYMBOLS_CACHE_PATH}.tmp"
+    try:
+        with open(tmp, "w") as f:
+            f.write(_json.dumps(symbols))
+        os.replace(tmp, BINANCE_SYMBOLS_CACHE_PATH)
+    except OSError as e:
+        logger.debug(f"Could not write Binance symbols cache: {e}")
+
+
 class BinancePerpKlineSource(PerpKlineSource):
     def __init__(self) -> None:
         self._symbols: List[str] = []
@@ -27,6 +63,22 @@ class BinancePerpKlineSource(PerpKlineSource):
     async def symbols(self) -> list[str]:
         if self._symbols:
             return self._symbols
+        # The ranking is cached unfiltered so env allow/deny/top-N changes still apply
+        ranked = _load_ranked_symbols()
+        if ranked is None:
+            ranked = await self._fetch_ranked_symbols()
+            _save_ranked_symbols(ranked)
+        symbols = ranked
+        if INCLUDE_SYMBOLS:
+            symbols = [s for s in symbols if s in set(INCLUDE_SYMBOLS)]
+        if EXCLUDE_SYMBOLS:
+            excl = set(EXCLUDE_SYMBOLS)
+            symbols = [s for s in symbols if s not in excl]
+        self._symbols = symbols[:TOP_SYMBOLS]
+        return self._symbols
+
+    async def _fetch_ranked_symbols(self) -> List[str]:
+        """Fetch USDT-margined perpetuals from REST, ranked by 24h quote volume."""
         async with httpx.AsyncClient(base_url=BINANCE_FUTURES_REST, timeout=20) as client:
             # Get exchange info to filter USDT-margined perpetuals
             r = await client.get(EXCHANGE_INFO)
@@ -50,47 +102,41 @@ class BinancePerpKlineSource(PerpKlineSource):
                         vol = 0.0
                     rows.append((sym, vol))
             rows.sort(key=lambda x: x[1], reverse=True)
-            symbols = [s for s, _ in rows]
-            if INCLUDE_SYMBOLS:
-                symbols = [s for s in symbols if s in set(INCLUDE_SYMBOLS)]
-            if EXCLUDE_SYMBOLS:
-                excl = set(EXCLUDE_SYMBOLS)
-                symbols = [s for s in symbols if s not in excl]
-            self._symbols = symbols[:TOP_SYMBOLS]
-            return self._symbols
+            return [s for s, _ in rows]
 
     async def stream_1m_klines(self) -> AsyncIterator[Kline]:
         syms = await self.symbols()
         # Build combined stream: <symbol>@kline_1m
         params = "/".join([f"{s.lower()}@kline_1m" for s in syms])
         url = f"{BINANCE_FUTURES_WS}?streams={params}"
-        async for msg in _connect_and_stream(url):
-            try:
-                data = json.loads(msg)
-                payload = data.get("data", {})
-                if payload.get("e") != "kline":
+        async for batch in _connect_and_stream(url):
+            for msg in batch:
+                try:
+                    data = _json.loads(msg)
+                    payload = data.get("data", {})
+                    if payload.get("e") != "kline":
+                        continue
+                    k = payload.get("k", {})
+                    yield Kline(
+                        symbol=payload.get("s"),
+                        open_time=k.get("t"),
+                        close_time=k.get("T"),
+                        open=float(k.get("o")),
+                        high=float(k.get("h")),
+                        low=float(k.get("l")),
+                        close=float(k.get("c")),
+                        volume=float(k.get("q")),
+                        closed=bool(k.get("x")),
+                        exchange="binance",
+                    )
+                except Exception:
                     continue
-                k = payload.get("k", {})
-                yield Kline(
-                    symbol=payload.get("s"),
-                    open_time=k.get("t"),
-                    close_time=k.get("T"),
-                    open=float(k.get("o")),
-                    high=float(k.get("h")),
-                    low=float(k.get("l")),
-                    close=float(k.get("c")),
-                    volume=float(k.get("q")),
-                    closed=bool(k.get("x")),
-                    exchange="binance",
-                )
-            except Exception:
-                continue
 
-import logging
-logger = logging.getLogger(__name__)
+_RECV_BATCH_SIZE = 256  # max frames handed to the parser per yield
 
-async def _connect_and_stream(url: str) -> AsyncIterator[str]:
-    backoff = 1.0
+async def _connect_and_stream(url: str) -> AsyncIterator[List[str]]:
+    """Yield batches of raw frames: one awaited frame plus whatever is already buffered."""
+    backoff = Backoff(cap=30)
     connection_count = 0
     while True:
         try:
@@ -103,21 +149,29 @@ async def _connect_and_stream(url: str) -> AsyncIterator[str]:
                 close_timeout=10,  # Timeout for close handshake
                 max_queue=2048
             ) as ws:
-                backoff = 1.0
+                backoff.reset()
                 logger.info(f"Binance WS connected successfully (connection #{connection_count})")
                 message_count = 0
-                async for message in ws:
-                    message_count += 1
-                    if message_count % 1000 == 0:
-                        logger.debug(f"Binance WS: received {message_count} messages on connection #{connection_count}")
-                    yield message
+                pending = ws.messages  # frames received but not yet read
+                while True:
+                    try:
+                        batch = [await ws.recv()]
+                        # recv() returns buffered frames without suspending
+                        while pending and len(batch) < _RECV_BATCH_SIZE:
+                            batch.append(await ws.recv())
+                    except websockets.exceptions.ConnectionClosedOK:
+                        break
+                    if (message_count + len(batch)) // 1000 > message_count // 1000:
+                        logger.debug(f"Binance WS: received {message_count + len(batch)} messages on connection #{connection_count}")
+                    message_count += len(batch)
+                    yield batch
                 # If we exit the loop normally (connection closed gracefully)
                 logger.warning(f"Binance WS connection #{connection_count} closed gracefully after {message_count} messages")
         except websockets.exceptions.ConnectionClosed as e:
-            logger.warning(f"Binance WS connection #{connection_count} closed: code={e.code}, reason={e.reason}; reconnecting in {backoff:.1f}s")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 30)
+            delay = backoff.next_delay()
+            logger.warning(f"Binance WS connection #{connection_count} closed: code={e.code}, reason={e.reason}; reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
         except Exception as e:
-            logger.error(f"Binance WS connection #{connection_count} error: {type(e).__name__}: {e}; reconnecting in {backoff:.1f}s")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 30)
+            delay = backoff.next_delay()
+            logger.error(f"Binance WS connection #{connection_count} error: {type(e).__name__}: {e}; reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
@@ -1,12 +1,13 @@
 from __future__ import annotations
 import asyncio
-import json
 import logging
 from typing import AsyncIterator, List
 
 import websockets
 
 from ..config import WS_PING_INTERVAL
+from . import _json
+from ._reconnect import Backoff
 
 log = logging.getLogger(__name__)
 
@@ -16,7 +17,7 @@ async def stream_minitickers(base_ws_url: str, symbols: List[str]) -> AsyncItera
         return
     params = "/".join([f"{s.lower()}@miniTicker" for s in symbols])
     url = f"{base_ws_url}?streams={params}"
-    backoff = 1.0
+    backoff = Backoff(cap=30)
     connection_count = 0
     while True:
         try:
@@ -29,28 +30,28 @@ async def stream_minitickers(base_ws_url: str, symbols: List[str]) -> AsyncItera
                 close_timeout=10,  # Timeout for close handshake
                 max_queue=4096
             ) as ws:
-                backoff = 1.0
+                backoff.reset()
                 log.info(f"Binance miniTicker WS connected (connection #{connection_count})")
                 message_count = 0
                 async for message in ws:
                     message_count += 1
                     try:
-                        data = json.loads(message)
+                        data = _json.loads(message)
                         payload = data.get("data", {})
                         if payload.get("e") != "24hrMiniTicker":
                             continue
                         sym = payload.get("s")
                         c = float(payload.get("c"))
-                        ts = int(payload.get("E", 0))
+                        ts = payload.get("E", 0)  # JSON number -> already int
                         yield sym, c, ts
                     except Exception:
                         continue
                 log.warning(f"Binance miniTicker WS connection #{connection_count} closed after {message_count} messages")
         except websockets.exceptions.ConnectionClosed as e:
-            log.warning(f"Binance miniTicker WS connection #{connection_count} closed: code={e.code}, reason={e.reason}; reconnecting in {backoff:.1f}s")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 30)
+            delay = backoff.next_delay()
+            log.warning(f"Binance miniTicker WS connection #{connection_count} closed: code={e.code}, reason={e.reason}; reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
         except Exception as e:
-            log.error(f"Binance miniTicker WS error: {type(e).__name__}: {e}; reconnecting in {backoff:.1f}s")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 30)
+            delay = backoff.next_delay()
+            log.error(f"Binance miniTicker WS error: {type(e).__name__}: {e}; reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
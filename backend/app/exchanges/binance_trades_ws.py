@@ -1,21 +1,74 @@
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
-from typing import AsyncIterator, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Tuple
 
-import websockets
-
-from ..config import BINANCE_FUTURES_WS, WS_PING_INTERVAL
+from ..config import BINANCE_FUTURES_WS
+from ._mux import StreamMux
 
 log = logging.getLogger(__name__)
 
 
+def _extract_agg_trade(p: Dict[str, Any]) -> Tuple[str, int, float, float, str]:
+    """(symbol, ts, price, qty, aggressor side) from an aggTrade/trade payload."""
+    # m = is buyer the maker. If buyer is maker, trade was aggressive sell.
+    return p["s"], p["T"], float(p["p"]), float(p["q"]), "SELL" if p["m"] else "BUY"
+
+
+# Event type ("e") -> extractor; anything else on the socket is ignored
+_EXTRACTORS: Dict[str, Callable[[Dict[str, Any]], Tuple[str, int, float, float, str]]] = {
+    "aggTrade": _extract_agg_trade,
+    "trade": _extract_agg_trade,
+}
+
+# Normalized event shape; copying it skips rebuilding the key table per trade
+_EVENT_TEMPLATE: Dict[str, Any] = {"exchange": "binance", "symbol": "", "ts": 0, "price": 0.0, "qty": 0.0, "side": ""}
+
+
+class _AggTradeMux(StreamMux):
+    """All stream_agg_trades() callers share one combined-stream connection."""
+
+    name = "Binance aggTrade"
+    url = BINANCE_FUTURES_WS  # combined stream root; streams are added via SUBSCRIBE
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._req_id = 0
+
+    def _requests(self, subscribe: bool, symbols: List[str]) -> List[Dict[str, Any]]:
+        self._req_id += 1
+        return [{
+            "method": "SUBSCRIBE" if subscribe else "UNSUBSCRIBE",
+            "params": [f"{s.lower()}@aggTrade" for s in symbols],
+            "id": self._req_id,
+        }]
+
+    def _route(self, data: Any) -> List[Tuple[str, dict]]:
+        try:
+            payload = data["data"]
+            extract = _EXTRACTORS.get(payload["e"])
+            if extract is None:
+                return []
+            symbol, ts, price, qty, side = extract(payload)
+        except (KeyError, TypeError):
+            return []  # subscription acks and unexpected frames
+        event = _EVENT_TEMPLATE.copy()
+        event["symbol"] = symbol
+        event["ts"] = ts
+        event["price"] = price
+        event["qty"] = qty
+        event["side"] = side
+        return [(symbol, event)]
+
+
+_mux = _AggTradeMux()
+
+
 async def stream_agg_trades(symbol: str) -> AsyncIterator[dict]:
     """Yield normalized trade events for a single Binance USDT perpetual symbol.
 
-    Uses Binance Futures combined stream endpoint with <symbol>@aggTrade.
+    Uses Binance Futures combined stream endpoint with <symbol>@aggTrade. All
+    symbols share one connection; events are fanned out per caller.
 
     Normalized event:
       {
@@ -27,51 +80,11 @@ async def stream_agg_trades(symbol: str) -> AsyncIterator[dict]:
         "side": "BUY"|"SELL"  # aggressor side
       }
     """
+    async for event in _mux.stream(symbol):
+        yield event
 
-    stream = f"{symbol.lower()}@aggTrade"
-    # BINANCE_FUTURES_WS is a combined stream root like wss://fstream.binance.com/stream
-    url = f"{BINANCE_FUTURES_WS}?streams={stream}"
 
-    backoff = 1.0
-    attempt = 0
-    while True:
-        try:
-            attempt += 1
-            log.info(f"Binance aggTrade WS connect {symbol} (attempt {attempt})")
-            async with websockets.connect(
-                url,
-                ping_interval=WS_PING_INTERVAL,
-                ping_timeout=60,
-                close_timeout=10,
-                max_queue=4096,
-            ) as ws:
-                backoff = 1.0
-                async for message in ws:
-                    try:
-                        data = json.loads(message)
-                        payload = data.get("data") if isinstance(data, dict) else None
-                        if not payload or payload.get("e") not in {"aggTrade", "trade"}:
-                            continue
-                        # aggTrade fields
-                        price = float(payload.get("p"))
-                        qty = float(payload.get("q"))
-                        ts = int(payload.get("T") or payload.get("E") or 0)
-                        # m = is buyer the maker. If buyer is maker, trade was aggressive sell.
-                        is_buyer_maker = bool(payload.get("m"))
-                        side = "SELL" if is_buyer_maker else "BUY"
-                        yield {
-                            "exchange": "binance",
-                            "symbol": payload.get("s") or symbol,
-                            "ts": ts,
-                            "price": price,
-                            "qty": qty,
-                            "side": side,
-                        }
-                    except Exception:
-                        continue
-        except asyncio.CancelledError:
-            raise
-        except Exception as e:
-            log.warning(f"Binance aggTrade WS error {symbol}: {type(e).__name__}: {e} (reconnect {backoff:.1f}s)")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 20)
+async def stream_agg_trades_batched(symbol: str) -> AsyncIterator[List[dict]]:
+    """Like stream_agg_trades(), but yields lists of the events queued since the last wakeup."""
+    async for batch in _mux.stream_batches(symbol):
+        yield batch
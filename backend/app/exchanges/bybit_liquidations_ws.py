@@ -24,22 +24,23 @@ Message format:
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import time
-from typing import AsyncIterator, Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from collections import deque
+from itertools import islice
 
-import websockets
-
-from ..config import BYBIT_WS_LINEAR, WS_PING_INTERVAL
+from ..config import BYBIT_WS_LINEAR
+from ._liquidation import LiquidationEvent
+from ._mux import StreamMux
 
 log = logging.getLogger(__name__)
 
 # In-memory store for recent liquidations per symbol
-# Structure: {symbol: deque([{liquidation_event}, ...])}
+# Structure: {symbol: deque([LiquidationEvent, ...])}
 _liquidation_store: Dict[str, deque] = {}
 _MAX_STORED_LIQUIDATIONS = 100  # Keep last 100 per symbol
+_SUMMARY_WINDOW_MS = 5 * 60 * 1000  # get_liquidation_summary() looks back this far
 
 # Liquidation levels heatmap store
 # Structure: {symbol: {price_bucket: {"long_value": float, "short_value": float, "count": int, "last_ts": int}}}
@@ -52,15 +53,13 @@ def get_recent_liquidations(symbol: str, limit: int = 20) -> List[Dict[str, Any]
     if symbol not in _liquidation_store:
         return []
     
-    liqs = list(_liquidation_store[symbol])
-    # Sort by timestamp descending (most recent first)
-    liqs.sort(key=lambda x: x.get("timestamp", 0), reverse=True)
-    return liqs[:limit]
+    # Appended in arrival order, so newest-first is just the deque reversed
+    return [l.to_dict() for l in islice(reversed(_liquidation_store[symbol]), limit)]
 
 
 def get_liquidation_summary(symbol: str) -> Dict[str, Any]:
     """Get summary stats for recent liquidations."""
-    liqs = get_recent_liquidations(symbol, limit=_MAX_STORED_LIQUIDATIONS)
+    liqs = _liquidation_store.get(symbol)
     
     if not liqs:
         return {
@@ -72,22 +71,36 @@ def get_liquidation_summary(symbol: str) -> Dict[str, Any]:
             "short_liq_value": 0,
         }
     
-    # Filter to last 5 minutes for summary
-    now_ms = int(time.time() * 1000)
-    five_min_ago = now_ms - (5 * 60 * 1000)
-    recent = [l for l in liqs if l.get("timestamp", 0) > five_min_ago]
+    # Filter to last 5 minutes for summary; single pass over the store.
+    # The deque is in arrival order, so walk newest-first and stop at the cutoff.
+    cutoff = time.time_ns() // 1_000_000 - _SUMMARY_WINDOW_MS
+    recent_count = long_count = short_count = 0
+    total_value = long_value = short_value = 0
+    for l in reversed(liqs):
+        if l.ts <= cutoff:
+            break
+        v = l.value_usd
+        side = l.side
+        recent_count += 1
+        total_value += v
+        if side == "SELL":
+            long_count += 1
+            long_value += v
+        elif side == "BUY":
+            short_count += 1
+            short_value += v
     
     return {
-        "recent_count": len(recent),
-        "long_liq_count": sum(1 for l in recent if l.get("side") == "SELL"),
-        "short_liq_count": sum(1 for l in recent if l.get("side") == "BUY"),
-        "total_value_usd": sum(l.get("value_usd", 0) for l in recent),
-        "long_liq_value": sum(l.get("value_usd", 0) for l in recent if l.get("side") == "SELL"),
-        "short_liq_value": sum(l.get("value_usd", 0) for l in recent if l.get("side") == "BUY"),
+        "recent_count": recent_count,
+        "long_liq_count": long_count,
+        "short_liq_count": short_count,
+        "total_value_usd": total_value,
+        "long_liq_value": long_value,
+        "short_liq_value": short_value,
     }
 
 
-def _store_liquidation(symbol: str, liq: Dict[str, Any]) -> None:
+def _store_liquidation(symbol: str, liq: LiquidationEvent) -> None:
     """Store a liquidation event in the in-memory store."""
     if symbol not in _liquidation_store:
         _liquidation_store[symbol] = deque(maxlen=_MAX_STORED_LIQUIDATIONS)
@@ -123,12 +136,12 @@ def _calculate_bucket_size(price: float) -> float:
     return nice_bucket
 
 
-def _aggregate_liquidation_level(symbol: str, liq: Dict[str, Any]) -> None:
+def _aggregate_liquidation_level(symbol: str, liq: LiquidationEvent) -> None:
     """Aggregate a liquidation into price level buckets for heatmap."""
-    price = liq.get("price", 0)
-    value_usd = liq.get("value_usd", 0)
-    side = liq.get("side", "")
-    ts = liq.get("timestamp", int(time.time() * 1000))
+    price = liq.price
+    value_usd = liq.value_usd
+    side = liq.side
+    ts = liq.ts
     
     if price <= 0 or value_usd <= 0:
         return
@@ -208,113 +221,109 @@ def get_liquidation_levels(symbol: str, current_price: float = 0, range_pct: flo
     return levels
 
 
-async def stream_liquidations(symbol: str) -> AsyncIterator[dict]:
-    """Yield normalized liquidation events for a single Bybit linear perp symbol.
+_TOPIC_PREFIX = "liquidation."
+# BUY = short liquidated, SELL = long liquidated
+_SIDES = {"Buy": "BUY", "Sell": "SELL", "BUY": "BUY", "SELL": "SELL", "buy": "BUY", "sell": "SELL"}
+
+
+class _LiquidationMux(StreamMux):
+    """All stream_liquidations() callers share one Bybit linear connection.
+
+    Each topic is subscribed in its own request tagged with req_id=topic, so a
+    rejected symbol (no liquidation feed) can be told apart and closed alone.
+    Events are stored once here, however many callers are streaming the symbol.
+    """
+
+    name = "Bybit liquidations"
+    url = BYBIT_WS_LINEAR
 
-    Normalized event:
+    def _requests(self, subscribe: bool, symbols: List[str]) -> List[Dict[str, Any]]:
+        op = "subscribe" if subscribe else "unsubscribe"
+        return [{"op": op, "req_id": f"{_TOPIC_PREFIX}{s}", "args": [f"{_TOPIC_PREFIX}{s}"]} for s in symbols]
+
+    def _route(self, data: Any) -> List[Tuple[str, LiquidationEvent]]:
+        if not isinstance(data, dict):
+            return []
+        
+        # Check for subscription confirmation
+        if data.get("op") == "subscribe":
+            topic = data.get("req_id") or ""
+            if data.get("success"):
+                log.info(f"Bybit liquidations subscribed to {topic}")
+            else:
+                # Subscription failed - likely unsupported symbol
+                ret_msg = data.get("ret_msg", "")
+                if "handler not found" in ret_msg and topic.startswith(_TOPIC_PREFIX):
+                    symbol = topic[len(_TOPIC_PREFIX):]
+                    log.debug(f"Bybit liquidations not available for {symbol} (not supported)")
+                    # End the streams for this symbol - no point retrying
+                    self.close_symbol(symbol)
+                else:
+                    log.warning(f"Bybit liquidations subscription failed: {data}")
+            return []
+        
+        topic = data.get("topic") or ""
+        if not topic.startswith(_TOPIC_PREFIX):
+            return []
+        symbol = topic[len(_TOPIC_PREFIX):]
+        
+        liq_data = data.get("data", {})
+        if not liq_data:
+            return []
+        
+        # Parse liquidation event
+        ts = liq_data.get("updatedTime") or data.get("ts") or 0  # JSON numbers -> already int
+        price = float(liq_data.get("price", 0))
+        qty = float(liq_data.get("size", 0))
+        
+        # Bybit: "Buy" = short position liquidated (market buys to close)
+        #        "Sell" = long position liquidated (market sells to close)
+        side = _SIDES.get(liq_data.get("side"))
+        if side is None:
+            return []
+        
+        event = LiquidationEvent(
+            exchange="bybit",
+            symbol=symbol,
+            ts=ts,
+            price=price,
+            qty=qty,
+            value_usd=price * qty,
+            side=side,
+            source="bybit_ws",
+        )
+        
+        # Store in memory for REST API access; streamers get the same object
+        _store_liquidation(symbol, event)
+        
+        return [(symbol, event)]
+
+
+_mux = _LiquidationMux()
+
+
+async def stream_liquidations(symbol: str) -> AsyncIterator[LiquidationEvent]:
+    """Yield LiquidationEvent objects for a single Bybit linear perp symbol.
+
+    Call `to_dict()` for the JSON shape:
       {
         "exchange": "bybit",
         "symbol": "BTCUSDT",
         "ts": 173... (ms),
+        "timestamp": 173... (ms),
         "price": float,
         "qty": float,
         "value_usd": float,
-        "side": "BUY"|"SELL"  # BUY = short liquidated, SELL = long liquidated
+        "side": "BUY"|"SELL",  # BUY = short liquidated, SELL = long liquidated
+        "status": "",  # Bybit does not report an order status
+        "source": "bybit_ws"
       }
 
-    Bybit v5 public liquidation topic: liquidation.<symbol>
+    Bybit v5 public liquidation topic: liquidation.<symbol>. All symbols share one
+    connection; the stream ends if Bybit has no liquidation feed for the symbol.
     """
-
-    topic = f"liquidation.{symbol}"
-    url = BYBIT_WS_LINEAR
-
-    backoff = 1.0
-    attempt = 0
-    while True:
-        try:
-            attempt += 1
-            log.info(f"Bybit liquidations WS connect {symbol} (attempt {attempt})")
-            async with websockets.connect(
-                url,
-                ping_interval=WS_PING_INTERVAL,
-                ping_timeout=60,
-                close_timeout=10,
-                max_queue=4096,
-            ) as ws:
-                backoff = 1.0
-                sub = {"op": "subscribe", "args": [topic]}
-                await ws.send(json.dumps(sub))
-
-                async for message in ws:
-                    try:
-                        data = json.loads(message)
-                        if not isinstance(data, dict):
-                            continue
-                        
-                        # Check for subscription confirmation
-                        if data.get("op") == "subscribe":
-                            if data.get("success"):
-                                log.info(f"Bybit liquidations subscribed to {topic}")
-                            else:
-                                # Subscription failed - likely unsupported symbol
-                                ret_msg = data.get("ret_msg", "")
-                                if "handler not found" in ret_msg:
-                                    log.debug(f"Bybit liquidations not available for {symbol} (not supported)")
-                                    # Exit the stream for this symbol - no point retrying
-                                    return
-                                else:
-                                    log.warning(f"Bybit liquidations subscription failed: {data}")
-                            continue
-                        
-                        if data.get("topic") != topic:
-                            continue
-                        
-                        liq_data = data.get("data", {})
-                        if not liq_data:
-                            continue
-                        
-                        # Parse liquidation event
-                        ts = int(liq_data.get("updatedTime") or data.get("ts") or 0)
-                        price = float(liq_data.get("price", 0))
-                        qty = float(liq_data.get("size", 0))
-                        
-                        # Bybit: "Buy" = short position liquidated (market buys to close)
-                        #        "Sell" = long position liquidated (market sells to close)
-                        side_raw = (liq_data.get("side") or "").capitalize()
-                        if side_raw == "Buy":
-                            side = "BUY"  # Short liquidated
-                        elif side_raw == "Sell":
-                            side = "SELL"  # Long liquidated
-                        else:
-                            continue
-                        
-                        normalized = {
-                            "exchange": "bybit",
-                            "symbol": symbol,
-                            "ts": ts,
-                            "timestamp": ts,
-                            "price": price,
-                            "qty": qty,
-                            "value_usd": price * qty,
-                            "side": side,
-                            "source": "bybit_ws"
-                        }
-                        
-                        # Store in memory for REST API access
-                        _store_liquidation(symbol, normalized)
-                        
-                        yield normalized
-                        
-                    except Exception as e:
-                        log.debug(f"Bybit liquidations parse error: {e}")
-                        continue
-                        
-        except asyncio.CancelledError:
-            raise
-        except Exception as e:
-            log.warning(f"Bybit liquidations WS error {symbol}: {type(e).__name__}: {e} (reconnect {backoff:.1f}s)")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 20)
+    async for event in _mux.stream(symbol):
+        yield event
 
 
 async def run_liquidation_collector(symbols: List[str]) -> None:
@@ -334,9 +343,9 @@ async def run_liquidation_collector(symbols: List[str]) -> None:
             async for liq in stream_liquidations(symbol):
                 # Event is already stored in _store_liquidation
                 # Log significant liquidations (> $100k)
-                if liq.get("value_usd", 0) > 100_000:
-                    side_label = "LONG" if liq["side"] == "SELL" else "SHORT"
-                    log.info(f"Large {side_label} liquidation: {symbol} ${liq['value_usd']:,.0f} @ {liq['price']}")
+                if liq.value_usd > 100_000:
+                    side_label = "LONG" if liq.side == "SELL" else "SHORT"
+                    log.info(f"Large {side_label} liquidation: {symbol} ${liq.value_usd:,.0f} @ {liq.price}")
         except asyncio.CancelledError:
             raise
         except Exception as e:
@@ -15,15 +15,18 @@ Wall Detection Logic:
 from __future__ import annotations
 
 import asyncio
-import json
+import heapq
 import logging
 import time
+from operator import itemgetter
 from typing import AsyncIterator, Dict, List, Any, Optional
 from dataclasses import dataclass, field
 
 import websockets
 
 from ..config import BYBIT_WS_LINEAR, WS_PING_INTERVAL
+from . import _json
+from ._reconnect import Backoff
 
 log = logging.getLogger(__name__)
 
@@ -112,7 +115,7 @@ class OrderBookState:
         
         # Analyze bids (support)
         if self.bids:
-            sorted_bids = sorted(self.bids.items(), key=lambda x: x[0], reverse=True)[:max_levels]
+            sorted_bids = heapq.nlargest(max_levels, self.bids.items(), key=itemgetter(0))
             bid_values = [(price, qty, price * qty) for price, qty in sorted_bids]
             
             if bid_values:
@@ -136,7 +139,7 @@ class OrderBookState:
         
         # Analyze asks (resistance)
         if self.asks:
-            sorted_asks = sorted(self.asks.items(), key=lambda x: x[0])[:max_levels]
+            sorted_asks = heapq.nsmallest(max_levels, self.asks.items(), key=itemgetter(0))
             ask_values = [(price, qty, price * qty) for price, qty in sorted_asks]
             
             if ask_values:
@@ -243,12 +246,12 @@ class OrderBookState:
         mid_price = self.get_mid_price()
         
         # Top bids
-        sorted_bids = sorted(self.bids.items(), key=lambda x: x[0], reverse=True)[:levels]
+        sorted_bids = heapq.nlargest(levels, self.bids.items(), key=itemgetter(0))
         top_bids = [{"price": p, "qty": q, "value": p * q} for p, q in sorted_bids]
         total_bid_value = sum(b["value"] for b in top_bids)
         
         # Top asks
-        sorted_asks = sorted(self.asks.items(), key=lambda x: x[0])[:levels]
+        sorted_asks = heapq.nsmallest(levels, self.asks.items(), key=itemgetter(0))
         top_asks = [{"price": p, "qty": q, "value": p * q} for p, q in sorted_asks]
         total_ask_value = sum(a["value"] for a in top_asks)
         
@@ -298,13 +301,14 @@ async def stream_orderbook(symbol: str, depth_levels: int = 50) -> AsyncIterator
     """
     topic = f"orderbook.{depth_levels}.{symbol}"
     url = BYBIT_WS_LINEAR
+    sub_frame = _json.dumps({"op": "subscribe", "args": [topic]})
     
     # Initialize state
     if symbol not in _orderbook_states:
         _orderbook_states[symbol] = OrderBookState(symbol=symbol)
     state = _orderbook_states[symbol]
     
-    backoff = 1.0
+    backoff = Backoff(cap=20)
     attempt = 0
     
     while True:
@@ -319,15 +323,14 @@ async def stream_orderbook(symbol: str, depth_levels: int = 50) -> AsyncIterator
                 close_timeout=10,
                 max_queue=4096,
             ) as ws:
-                backoff = 1.0
+                backoff.reset()
                 
                 # Subscribe to orderbook topic
-                sub = {"op": "subscribe", "args": [topic]}
-                await ws.send(json.dumps(sub))
+                await ws.send(sub_frame)
                 
                 async for message in ws:
                     try:
-                        data = json.loads(message)
+                        data = _json.loads(message)
                         
                         # Check for subscription confirmation
                         if data.get("op") == "subscribe":
@@ -381,7 +384,7 @@ async def stream_orderbook(symbol: str, depth_levels: int = 50) -> AsyncIterator
                             "walls": walls,
                         }
                         
-                    except json.JSONDecodeError:
+                    except _json.JSONDecodeError:
                         continue
                     except Exception as e:
                         log.debug(f"Bybit orderbook parse error: {e}")
@@ -390,9 +393,9 @@ async def stream_orderbook(symbol: str, depth_levels: int = 50) -> AsyncIterator
         except asyncio.CancelledError:
             raise
         except Exception as e:
-            log.warning(f"Bybit orderbook WS error {symbol}: {type(e).__name__}: {e} (reconnect {backoff:.1f}s)")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 20)
+            delay = backoff.next_delay()
+            log.warning(f"Bybit orderbook WS error {symbol}: {type(e).__name__}: {e} (reconnect {delay:.1f}s)")
+            await asyncio.sleep(delay)
 
 
 async def run_orderbook_collector(symbol: str) -> None:
@@ -1,28 +1,33 @@
 from __future__ import annotations
 import asyncio
-import json
+import heapq
 import logging
 from typing import AsyncIterator, List
 
 import httpx
 import websockets
 
-from ..config import TOP_SYMBOLS, INCLUDE_SYMBOLS, EXCLUDE_SYMBOLS
 from ..config import (
+    TOP_SYMBOLS,
+    INCLUDE_SYMBOLS,
+    EXCLUDE_SYMBOLS,
     WS_PING_INTERVAL,
+    BYBIT_REST,
+    BYBIT_WS_LINEAR,
 )
 from ..models import Kline
 from .base import PerpKlineSource
+from . import _json
+from ._reconnect import Backoff
 
 log = logging.getLogger(__name__)
 
-BYBIT_REST = "https://api.bybit.com"
 # v5 market instruments and tickers (linear = USDT/USDC perps)
 INSTRUMENTS = "/v5/market/instruments-info?category=linear"
 TICKERS = "/v5/market/tickers?category=linear"
 
-# Public WS linear
-BYBIT_WS_LINEAR = "wss://stream.bybit.com/v5/public/linear"
+_KLINE_PREFIX = "kline.1."
+_SUBSCRIBE_BATCH = 50  # topics per subscribe request
 
 class BybitPerpKlineSource(PerpKlineSource):
     def __init__(self) -> None:
@@ -32,8 +37,9 @@ class BybitPerpKlineSource(PerpKlineSource):
         if self._symbols:
             return self._symbols
         async with httpx.AsyncClient(base_url=BYBIT_REST, timeout=20) as client:
+            # Instruments and tickers are independent; fetch them concurrently
+            r, r2 = await asyncio.gather(client.get(INSTRUMENTS), client.get(TICKERS))
             # Discover active linear perps (USDT/USDC), status Trading
-            r = await client.get(INSTRUMENTS)
             r.raise_for_status()
             info = r.json()
             syms = []
@@ -43,7 +49,6 @@ class BybitPerpKlineSource(PerpKlineSource):
                     if sym:
                         syms.append(sym)
             # Rank by quote volume via tickers (turnover24h)
-            r2 = await client.get(TICKERS)
             r2.raise_for_status()
             tick = r2.json().get("result", {}).get("list", [])
             vols = {}
@@ -54,15 +59,16 @@ class BybitPerpKlineSource(PerpKlineSource):
                 except Exception:
                     vol = 0.0
                 vols[sym] = vol
-            rows = [(s, vols.get(s, 0.0)) for s in syms]
-            rows.sort(key=lambda x: x[1], reverse=True)
-            symbols = [s for s, _ in rows]
+            # Filter first so only candidates enter the top-N heap
+            candidates = iter(syms)
             if INCLUDE_SYMBOLS:
-                symbols = [s for s in symbols if s in set(INCLUDE_SYMBOLS)]
+                incl = set(INCLUDE_SYMBOLS)
+                candidates = (s for s in candidates if s in incl)
             if EXCLUDE_SYMBOLS:
                 excl = set(EXCLUDE_SYMBOLS)
-                symbols = [s for s in symbols if s not in excl]
-            self._symbols = symbols[:TOP_SYMBOLS]
+                candidates = (s for s in candidates if s not in excl)
+            # nlargest with a key keeps listing order on ties, like a stable sort
+            self._symbols = heapq.nlargest(TOP_SYMBOLS, candidates, key=lambda s: vols.get(s, 0.0))
             log.info(f"Bybit selected symbols: {len(self._symbols)}")
             return self._symbols
 
@@ -72,39 +78,38 @@ class BybitPerpKlineSource(PerpKlineSource):
             return
         url = BYBIT_WS_LINEAR
         async for msg in _connect_and_stream(url, syms):
+            if msg.startswith(_json.BYBIT_OP_PREFIX):
+                continue  # subscribe ack / pong
             try:
-                data = json.loads(msg)
+                data = _json.loads(msg)
                 if not isinstance(data, dict):
                     continue
-                if data.get("topic", "").startswith("kline.1."):
-                    for item in data.get("data", []) or []:
-                        symbol = item.get("symbol") or data.get("topic", "").split(".")[-1]
-                        start = int(item.get("start"))
-                        end = int(item.get("end"))
-                        o = float(item.get("open"))
-                        h = float(item.get("high"))
-                        l = float(item.get("low"))
-                        c = float(item.get("close"))
-                        # turnover = quote volume
-                        vol = float(item.get("turnover", 0.0)) if item.get("turnover") is not None else 0.0
-                        closed = bool(item.get("confirm", False))
-                        yield Kline(
-                            symbol=symbol,
-                            open_time=start,
-                            close_time=end,
-                            open=o, high=h, low=l, close=c,
-                            volume=vol,
-                            closed=closed,
-                            exchange="bybit",
-                        )
+                topic = data.get("topic", "")
+                if not topic.startswith(_KLINE_PREFIX):
+                    continue
+                # Kline items carry no symbol field; it is the topic suffix
+                topic_symbol = topic[len(_KLINE_PREFIX):]
+                for item in data.get("data") or ():
+                    turnover = item.get("turnover")  # quote volume
+                    yield Kline(
+                        symbol=item.get("symbol") or topic_symbol,
+                        open_time=item.get("start"),  # JSON numbers -> already int
+                        close_time=item.get("end"),
+                        open=float(item["open"]),
+                        high=float(item["high"]),
+                        low=float(item["low"]),
+                        close=float(item["close"]),
+                        volume=float(turnover) if turnover is not None else 0.0,
+                        closed=bool(item.get("confirm", False)),
+                        exchange="bybit",
+                    )
             except Exception:
                 continue
 
 async def _connect_and_stream(url: str, symbols: List[str]) -> AsyncIterator[str]:
     # Subscribe in batches to avoid frame limits
-    batch = 50
-    args = [f"kline.1.{s}" for s in symbols]
-    backoff = 1.0
+    sub_frames = _json.op_frames("subscribe", [f"{_KLINE_PREFIX}{s}" for s in symbols], _SUBSCRIBE_BATCH)
+    backoff = Backoff(cap=30)
     connection_count = 0
     while True:
         try:
@@ -117,13 +122,10 @@ async def _connect_and_stream(url: str, symbols: List[str]) -> AsyncIterator[str
                 close_timeout=10,  # Timeout for close handshake
                 max_queue=2048
             ) as ws:
-                backoff = 1.0
+                backoff.reset()
                 log.info(f"Bybit WS connected successfully (connection #{connection_count})")
-                # Subscribe in batches
-                for i in range(0, len(args), batch):
-                    sub = {"op": "subscribe", "args": args[i:i+batch]}
-                    await ws.send(json.dumps(sub))
-                    await asyncio.sleep(0.2)
+                for frame in sub_frames:
+                    await ws.send(frame)
                 message_count = 0
                 async for message in ws:
                     message_count += 1
@@ -132,10 +134,10 @@ async def _connect_and_stream(url: str, symbols: List[str]) -> AsyncIterator[str
                     yield message
                 log.warning(f"Bybit WS connection #{connection_count} closed gracefully after {message_count} messages")
         except websockets.exceptions.ConnectionClosed as e:
-            log.warning(f"Bybit WS connection #{connection_count} closed: code={e.code}, reason={e.reason}; reconnecting in {backoff:.1f}s")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 30)
+            delay = backoff.next_delay()
+            log.warning(f"Bybit WS connection #{connection_count} closed: code={e.code}, reason={e.reason}; reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
         except Exception as e:
-            log.error(f"Bybit WS connection #{connection_count} error: {type(e).__name__}: {e}; reconnecting in {backoff:.1f}s")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 30)
+            delay = backoff.next_delay()
+            log.error(f"Bybit WS connection #{connection_count} error: {type(e).__name__}: {e}; reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
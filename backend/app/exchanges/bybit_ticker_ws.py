@@ -1,12 +1,13 @@
 from __future__ import annotations
 import asyncio
-import json
 import logging
 from typing import AsyncIterator, List
 
 import websockets
 
 from ..config import WS_PING_INTERVAL, BYBIT_WS_LINEAR
+from . import _json
+from ._reconnect import Backoff
 
 log = logging.getLogger(__name__)
 
@@ -17,7 +18,8 @@ async def stream_tickers(symbols: List[str]) -> AsyncIterator[tuple[str, float,
     url = BYBIT_WS_LINEAR
     args = [f"tickers.{s}" for s in symbols]
     batch = 50
-    backoff = 1.0
+    sub_frames = _json.op_frames("subscribe", args, batch)
+    backoff = Backoff(cap=30)
     connection_count = 0
     while True:
         try:
@@ -30,18 +32,18 @@ async def stream_tickers(symbols: List[str]) -> AsyncIterator[tuple[str, float,
                 close_timeout=10,  # Timeout for close handshake
                 max_queue=4096
             ) as ws:
-                backoff = 1.0
+                backoff.reset()
                 log.info(f"Bybit ticker WS connected (connection #{connection_count})")
                 # Subscribe in batches
-                for i in range(0, len(args), batch):
-                    sub = {"op": "subscribe", "args": args[i:i+batch]}
-                    await ws.send(json.dumps(sub))
-                    await asyncio.sleep(0.2)
+                for frame in sub_frames:
+                    await ws.send(frame)
                 message_count = 0
                 async for message in ws:
                     message_count += 1
+                    if message.startswith(_json.BYBIT_OP_PREFIX):
+                        continue  # subscribe ack / pong
                     try:
-                        data = json.loads(message)
+                        data = _json.loads(message)
                         topic = data.get("topic", "")
                         if not topic.startswith("tickers."):
                             continue
@@ -53,17 +55,17 @@ async def stream_tickers(symbols: List[str]) -> AsyncIterator[tuple[str, float,
                             if p is None or sym is None:
                                 continue
                             price = float(p)
-                            ts = int(item.get("ts") or item.get("timestamp") or data.get("ts") or 0)
+                            ts = item.get("ts") or item.get("timestamp") or data.get("ts") or 0  # JSON numbers -> already int
                             yield sym, price, ts
                     except Exception as e:
                         log.debug(f"Bybit ticker parse error: {e}")
                         continue
                 log.warning(f"Bybit ticker WS connection #{connection_count} closed after {message_count} messages")
         except websockets.exceptions.ConnectionClosed as e:
-            log.warning(f"Bybit ticker WS connection #{connection_count} closed: code={e.code}, reason={e.reason}; reconnecting in {backoff:.1f}s")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 30)
+            delay = backoff.next_delay()
+            log.warning(f"Bybit ticker WS connection #{connection_count} closed: code={e.code}, reason={e.reason}; reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
         except Exception as e:
-            log.error(f"Bybit ticker WS error: {type(e).__name__}: {e}; reconnecting in {backoff:.1f}s")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 30)
+            delay = backoff.next_delay()
+            log.error(f"Bybit ticker WS error: {type(e).__name__}: {e}; reconnecting in {delay:.1f}s")
+            await asyncio.sleep(delay)
@@ -1,16 +1,65 @@
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
-from typing import AsyncIterator
+from typing import Any, AsyncIterator, Dict, List, Tuple
 
-import websockets
-
-from ..config import BYBIT_WS_LINEAR, WS_PING_INTERVAL
+from ..config import BYBIT_WS_LINEAR
+from . import _json
+from ._mux import StreamMux
 
 log = logging.getLogger(__name__)
 
+_TOPIC_PREFIX = "publicTrade."
+_SUBSCRIBE_BATCH = 50
+# Normalized event shape; copying it skips rebuilding the key table per trade
+_EVENT_TEMPLATE: Dict[str, Any] = {"exchange": "bybit", "symbol": "", "ts": 0, "price": 0.0, "qty": 0.0, "side": ""}
+# Taker side as sent ("Buy"/"Sell") -> normalized; other spellings kept for safety
+_SIDES = {"Buy": "BUY", "Sell": "SELL", "BUY": "BUY", "SELL": "SELL", "buy": "BUY", "sell": "SELL"}
+
+
+class _TradeMux(StreamMux):
+    """All stream_trades() callers share one Bybit linear connection."""
+
+    name = "Bybit trades"
+    url = BYBIT_WS_LINEAR
+    skip_prefix = _json.BYBIT_OP_PREFIX  # acks carry nothing we act on
+
+    def _requests(self, subscribe: bool, symbols: List[str]) -> List[Dict[str, Any]]:
+        op = "subscribe" if subscribe else "unsubscribe"
+        args = [f"{_TOPIC_PREFIX}{s}" for s in symbols]
+        return [{"op": op, "args": args[i:i + _SUBSCRIBE_BATCH]} for i in range(0, len(args), _SUBSCRIBE_BATCH)]
+
+    def _route(self, data: Any) -> List[Tuple[str, dict]]:
+        try:
+            topic = data["topic"]
+            items = data["data"]
+        except (KeyError, TypeError):
+            return []  # op frames (subscribe acks, pongs)
+        if not topic.startswith(_TOPIC_PREFIX):
+            return []
+        symbol = topic[len(_TOPIC_PREFIX):]
+        events = []
+        for t in items:
+            try:
+                # Fields: T (ms), p (price), v (size), S (side)
+                ts = t["T"]
+                price = float(t["p"])
+                qty = float(t["v"])
+                side = _SIDES[t["S"]]
+            except (KeyError, TypeError, ValueError):
+                continue
+            event = _EVENT_TEMPLATE.copy()
+            event["symbol"] = symbol
+            event["ts"] = ts
+            event["price"] = price
+            event["qty"] = qty
+            event["side"] = side
+            events.append((symbol, event))
+        return events
+
+
+_mux = _TradeMux()
+
 
 async def stream_trades(symbol: str) -> AsyncIterator[dict]:
     """Yield normalized trade events for a single Bybit linear perp symbol.
@@ -25,58 +74,14 @@ async def stream_trades(symbol: str) -> AsyncIterator[dict]:
         "side": "BUY"|"SELL"
       }
 
-    Bybit v5 public trade topic: publicTrade.<symbol>
+    Bybit v5 public trade topic: publicTrade.<symbol>. All symbols share one
+    connection; events are fanned out per caller.
     """
+    async for event in _mux.stream(symbol):
+        yield event
 
-    topic = f"publicTrade.{symbol}"
-    url = BYBIT_WS_LINEAR
 
-    backoff = 1.0
-    attempt = 0
-    while True:
-        try:
-            attempt += 1
-            log.info(f"Bybit trades WS connect {symbol} (attempt {attempt})")
-            async with websockets.connect(
-                url,
-                ping_interval=WS_PING_INTERVAL,
-                ping_timeout=60,
-                close_timeout=10,
-                max_queue=4096,
-            ) as ws:
-                backoff = 1.0
-                sub = {"op": "subscribe", "args": [topic]}
-                await ws.send(json.dumps(sub))
-
-                async for message in ws:
-                    try:
-                        data = json.loads(message)
-                        if not isinstance(data, dict):
-                            continue
-                        if data.get("topic") != topic:
-                            continue
-                        for t in data.get("data", []) or []:
-                            # Fields typically: T (ms), p (price), v (size), S (side)
-                            ts = int(t.get("T") or t.get("ts") or 0)
-                            price = float(t.get("p"))
-                            qty = float(t.get("v"))
-                            side_raw = (t.get("S") or t.get("side") or "").upper()
-                            side = "BUY" if side_raw == "BUY" else "SELL" if side_raw == "SELL" else None
-                            if side is None:
-                                continue
-                            yield {
-                                "exchange": "bybit",
-                                "symbol": symbol,
-                                "ts": ts,
-                                "price": price,
-                                "qty": qty,
-                                "side": side,
-                            }
-                    except Exception:
-                        continue
-        except asyncio.CancelledError:
-            raise
-        except Exception as e:
-            log.warning(f"Bybit trades WS error {symbol}: {type(e).__name__}: {e} (reconnect {backoff:.1f}s)")
-            await asyncio.sleep(backoff)
-            backoff = min(backoff * 2, 20)
+async def stream_trades_batched(symbol: str) -> AsyncIterator[List[dict]]:
+    """Like stream_trades(), but yields lists of the events queued since the last wakeup."""
+    async for batch in _mux.stream_batches(symbol):
+        yield batch
@@ -1,15 +1,50 @@
 from __future__ import annotations
 import asyncio
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from fastapi import FastAPI, Response, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-
+from fastapi.responses import ORJSONResponse
+import orjson
+
+from .config import (
+    DEBUG_STATUS_INCLUDE_LISTS_DEFAULT,
+    STALE_KLINE_MS,
+    STALE_TICKER_MS,
+    WS_HEARTBEAT_SEC,
+    WS_SEND_TIMEOUT_SEC,
+)
 from .services.stream_manager import StreamManager
+from .services.alert_store import get_alert_history_json, get_latest_trade_plan, get_recent_alerts
+from .services.analysis_backtester import get_symbol_performance_stats, run_analysis_backtest, update_grader_symbol_rates
+from .services.backtester import STRATEGY_VERSION, backtest_symbol
+from .services.backtester import _insert_backtest_row  # type: ignore
+from .services.funding_rate import fetch_funding_rate
+from .services.market_cap import get_provider, initialize
+from .services.market_data import fetch_liquidations, fetch_long_short_ratio, fetch_market_data_combined
+from .services.news import get_news_provider
+from .services.ohlc_store import read_all, read_one
+from .services.portfolio import get_portfolio_manager
 from .models import ScreenerSnapshot
 
 import logging
+import random
+import time
+import traceback
+import weakref
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
-app = FastAPI(title="Crypto Screener Backend", version="0.1.0")
+log = logging.getLogger(__name__)
+
+class _ORJSONResponse(ORJSONResponse):
+    """orjson-encoded responses; non-str dict keys become strings like stdlib json."""
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
+app = FastAPI(title="Crypto Screener Backend", version="0.1.0", default_response_class=_ORJSONResponse)
 
 # Allow local dev frontends
 app.add_middleware(
@@ -28,51 +63,81 @@ orderflow_mgr = OrderFlowHub()
 
 @app.on_event("startup")
 async def on_startup():
+    # The loop is chosen by uvicorn before this module loads (run_backend.sh passes
+    # --loop uvloop); log it so a fallback to the stdlib selector loop is visible.
+    loop = asyncio.get_running_loop()
+    log.info(f"Event loop: {type(loop).__module__}.{type(loop).__name__}")
+    # Python 3.12+: tasks run eagerly up to their first suspension, so ones that
+    # finish without awaiting I/O (cache hits) never hit the scheduler.
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is not None:
+        loop.set_task_factory(eager_task_factory)
+    # One shared pool for encoding large, already-built payloads off the loop
+    app.state.cpu_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="cpu")
+    # Strong refs for app-lifetime loops; the loop itself only keeps weak ones
+    app.state.background_tasks = set()
     await stream_mgr.start()
 
     # Initialize market cap provider
     try:
-        from .services.market_cap import initialize
-        import logging as log
         log.info("Initializing market cap provider...")
         await initialize()
         log.info("Market cap provider initialized successfully")
         # Schedule periodic updates
-        asyncio.create_task(_market_cap_update_loop())
+        _spawn_background(_market_cap_update_loop())
     except Exception as e:
-        import traceback
-        logging.getLogger(__name__).error(f"Failed to initialize market cap provider: {e}")
-        logging.getLogger(__name__).error(traceback.format_exc())
+        log.error(f"Failed to initialize market cap provider: {e}")
+        log.error(traceback.format_exc())
 
     # Optional scheduled analysis recompute
     try:
         from .config import ANALYSIS_AUTORUN
         if ANALYSIS_AUTORUN:
             from .services.analysis_scheduler import analysis_autorun_loop
-            asyncio.create_task(analysis_autorun_loop())
+            _spawn_background(analysis_autorun_loop())
     except Exception:
         pass
 
+@app.on_event("shutdown")
+async def on_shutdown():
+    tasks = list(app.state.background_tasks)
+    for t in tasks:
+        t.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    app.state.cpu_executor.shutdown(wait=False, cancel_futures=True)
+
+def _spawn_background(coro) -> asyncio.Task:
+    """Start an app-lifetime task, held on app.state until it finishes."""
+    task = asyncio.create_task(coro)
+    app.state.background_tasks.add(task)
+    task.add_done_callback(app.state.background_tasks.discard)
+    return task
+
 async def _market_cap_update_loop():
     """Periodically update market cap cache."""
-    from .services.market_cap import get_provider
     while True:
-        await asyncio.sleep(300)  # 5 minutes
+        # ~5 minutes, jittered so restarted instances don't poll CoinGecko in lock-step
+        await asyncio.sleep(300 * random.uniform(0.9, 1.1))
         try:
             provider = get_provider()
             await provider.update_if_needed()
         except Exception as e:
-            logging.getLogger(__name__).error(f"Market cap update failed: {e}")
+            log.error(f"Market cap update failed: {e}")
+
+# Probe bodies are pre-encoded; a fresh Response wraps them per request because
+# middleware (CORS) appends headers to the response it is given.
+_OK_BODY = orjson.dumps({"status": "ok"})
+_readyz_bodies: dict = {}  # task-running flags tuple -> encoded body
 
 @app.get("/health")
 async def health():
     # Backward-compatible basic liveness endpoint
-    return {"status": "ok"}
+    return Response(content=_OK_BODY, media_type="application/json")
 
 @app.get("/healthz")
 async def healthz():
     # Standard liveness probe
-    return {"status": "ok"}
+    return Response(content=_OK_BODY, media_type="application/json")
 
 @app.get("/readyz")
 async def readyz():
@@ -84,82 +149,122 @@ async def readyz():
 
     (We avoid making external network calls here to keep the probe reliable.)
     """
-    tasks = {
-        "binance_kline": bool(stream_mgr._task and not stream_mgr._task.done()),
-        "binance_ticker": bool(stream_mgr._task_bin_ticker and not stream_mgr._task_bin_ticker.done()),
-        "bybit_kline": bool(stream_mgr._task_bybit and not stream_mgr._task_bybit.done()),
-        "bybit_ticker": bool(stream_mgr._task_bybit_ticker and not stream_mgr._task_bybit_ticker.done()),
-    }
-    any_running = any(tasks.values())
-    return {"ready": any_running, "tasks": tasks}
+    key = (
+        bool(stream_mgr._task and not stream_mgr._task.done()),
+        bool(stream_mgr._task_bin_ticker and not stream_mgr._task_bin_ticker.done()),
+        bool(stream_mgr._task_bybit and not stream_mgr._task_bybit.done()),
+        bool(stream_mgr._task_bybit_ticker and not stream_mgr._task_bybit_ticker.done()),
+    )
+    body = _readyz_bodies.get(key)
+    if body is None:
+        tasks = dict(zip(("binance_kline", "binance_ticker", "bybit_kline", "bybit_ticker"), key))
+        body = _readyz_bodies[key] = orjson.dumps({"ready": any(key), "tasks": tasks})
+    return Response(content=body, media_type="application/json")
+
+# /debug/status walks every symbol's aggregator state; probes and dashboards that
+# poll it share one computation per window (keyed by include_lists).
+_STATUS_CACHE_TTL_S = 0.5
+_status_cache: dict = {}  # include_lists -> (monotonic ts, body)
+_status_lock = asyncio.Lock()
 
 @app.get("/debug/status")
 async def debug_status(include_lists: bool | None = None):
-    import time
-    now_ms = int(time.time() * 1000)
+    inc = DEBUG_STATUS_INCLUDE_LISTS_DEFAULT if include_lists is None else bool(include_lists)
+
+    cached = _status_cache.get(inc)
+    if cached is not None and time.monotonic() - cached[0] < _STATUS_CACHE_TTL_S:
+        return cached[1]
+    async with _status_lock:
+        # Another request may have refreshed it while we waited
+        cached = _status_cache.get(inc)
+        if cached is not None and time.monotonic() - cached[0] < _STATUS_CACHE_TTL_S:
+            return cached[1]
+        body = await _build_debug_status(inc)
+        _status_cache[inc] = (time.monotonic(), body)
+        return body
+
+_TASK_NOT_STARTED = {"status": "not_started", "error": None}
+_TASK_RUNNING = {"status": "running", "error": None}
+_TASK_CANCELLED = {"status": "cancelled", "error": None}
+# A finished task's status never changes; computed once (str(exc) etc.) per task
+_finished_task_status: "weakref.WeakKeyDictionary[asyncio.Task, dict]" = weakref.WeakKeyDictionary()
+
+
+def _task_status(task, name):
+    if task is None:
+        return _TASK_NOT_STARTED
+    if not task.done():
+        return _TASK_RUNNING
+    status = _finished_task_status.get(task)
+    if status is None:
+        status = _finished_task_status[task] = _finished_status(task)
+    return status
+
+
+def _finished_status(task) -> dict:
+    # Important: CancelledError is a BaseException in modern asyncio, so we must
+    # handle it explicitly to avoid 500s in debug endpoints during restarts.
+    if task.cancelled():
+        return _TASK_CANCELLED
+    try:
+        exc = task.exception()
+    except asyncio.CancelledError:
+        return _TASK_CANCELLED
+    except BaseException as e:
+        # Any other BaseException should be represented as an error string
+        return {"status": "dead", "error": str(e)}
+    return {"status": "dead", "error": str(exc) if exc else "completed"}
+
+
+async def _build_debug_status(inc: bool) -> dict:
+    now_ms = time.time_ns() // 1_000_000
     
     try:
-        bin_syms = await stream_mgr.binance.symbols()
+        bin_sym_count = await stream_mgr.binance.symbols_count()
     except Exception:
-        bin_syms = []
+        bin_sym_count = 0
     try:
-        byb_syms = await stream_mgr.bybit.symbols()  # type: ignore[attr-defined]
+        byb_sym_count = await stream_mgr.bybit.symbols_count()  # type: ignore[attr-defined]
     except Exception:
-        byb_syms = []
+        byb_sym_count = 0
     
-    # Check task health
-    def check_task(task, name):
-        if task is None:
-            return {"status": "not_started", "error": None}
-        # Important: CancelledError is a BaseException in modern asyncio, so we must
-        # handle it explicitly to avoid 500s in debug endpoints during restarts.
-        if task.cancelled():
-            return {"status": "cancelled", "error": None}
-        if task.done():
-            exc = None
-            try:
-                exc = task.exception()
-            except asyncio.CancelledError:
-                return {"status": "cancelled", "error": None}
-            except BaseException as e:
-                # Any other BaseException should be represented as an error string
-                return {"status": "dead", "error": str(e)}
-            return {"status": "dead", "error": str(exc) if exc else "completed"}
-        return {"status": "running", "error": None}
-    
-    bin_last_ingest = getattr(stream_mgr.agg, 'last_ingest_ts', 0)
-    bin_last_kline_ingest = getattr(stream_mgr.agg, 'last_kline_ingest_ts', bin_last_ingest)
-    bin_last_ticker_ingest = getattr(stream_mgr.agg, 'last_ticker_ingest_ts', bin_last_ingest)
-    bin_last_emit = getattr(stream_mgr.agg, 'last_emit_ts', 0)
-    bybit_last_ingest = getattr(stream_mgr.agg_bybit, 'last_ingest_ts', 0) if hasattr(stream_mgr, 'agg_bybit') else 0
-    bybit_last_kline_ingest = getattr(stream_mgr.agg_bybit, 'last_kline_ingest_ts', bybit_last_ingest) if hasattr(stream_mgr, 'agg_bybit') else 0
-    bybit_last_ticker_ingest = getattr(stream_mgr.agg_bybit, 'last_ticker_ingest_ts', bybit_last_ingest) if hasattr(stream_mgr, 'agg_bybit') else 0
-    bybit_last_emit = getattr(stream_mgr.agg_bybit, 'last_emit_ts', 0) if hasattr(stream_mgr, 'agg_bybit') else 0
+    # Aggregator.__init__ sets every timestamp, so plain attribute reads are safe
+    agg = stream_mgr.agg
+    agg_b = stream_mgr.agg_bybit if hasattr(stream_mgr, 'agg_bybit') else None
+    bin_last_ingest = agg.last_ingest_ts
+    bin_last_kline_ingest = agg.last_kline_ingest_ts
+    bin_last_ticker_ingest = agg.last_ticker_ingest_ts
+    bin_last_emit = agg.last_emit_ts
+    if agg_b is not None:
+        bybit_last_ingest = agg_b.last_ingest_ts
+        bybit_last_kline_ingest = agg_b.last_kline_ingest_ts
+        bybit_last_ticker_ingest = agg_b.last_ticker_ingest_ts
+        bybit_last_emit = agg_b.last_emit_ts
+    else:
+        bybit_last_ingest = bybit_last_kline_ingest = bybit_last_ticker_ingest = bybit_last_emit = 0
     
-    from .config import STALE_TICKER_MS, STALE_KLINE_MS, DEBUG_STATUS_INCLUDE_LISTS_DEFAULT
-    inc = DEBUG_STATUS_INCLUDE_LISTS_DEFAULT if include_lists is None else bool(include_lists)
 
-    bin_stale = stream_mgr.agg.stale_symbols(
+    bin_stale = agg.stale_symbols(
         now_ms,
         ticker_stale_ms=STALE_TICKER_MS,
         kline_stale_ms=STALE_KLINE_MS,
         include_lists=inc,
     )
     byb_stale = (
-        stream_mgr.agg_bybit.stale_symbols(
+        agg_b.stale_symbols(
             now_ms,
             ticker_stale_ms=STALE_TICKER_MS,
             kline_stale_ms=STALE_KLINE_MS,
             include_lists=inc,
         )
-        if hasattr(stream_mgr, 'agg_bybit')
+        if agg_b is not None
         else {"ticker":[],"kline":[],"ticker_count":0,"kline_count":0, "include_lists": inc, "ticker_stale_ms": STALE_TICKER_MS, "kline_stale_ms": STALE_KLINE_MS}
     )
 
     return {
         "binance": {
-            "symbols": len(bin_syms),
-            "state": getattr(stream_mgr.agg, 'state_count', lambda: 0)(),
+            "symbols": bin_sym_count,
+            "state": agg.state_count(),
             "last_emit_ts": bin_last_emit,
             "last_ingest_ts": bin_last_ingest,
             "last_kline_ingest_ts": bin_last_kline_ingest,
@@ -168,14 +273,14 @@ async def debug_status(include_lists: bool | None = None):
             "last_kline_ingest_age_s": (now_ms - bin_last_kline_ingest) / 1000 if bin_last_kline_ingest else None,
             "last_ticker_ingest_age_s": (now_ms - bin_last_ticker_ingest) / 1000 if bin_last_ticker_ingest else None,
             "tasks": {
-                "kline": check_task(stream_mgr._task, "binance_kline"),
-                "ticker": check_task(stream_mgr._task_bin_ticker, "binance_ticker"),
+                "kline": _task_status(stream_mgr._task, "binance_kline"),
+                "ticker": _task_status(stream_mgr._task_bin_ticker, "binance_ticker"),
             },
             "stale": bin_stale,
         },
         "bybit": {
-            "symbols": len(byb_syms),
-            "state": getattr(stream_mgr.agg_bybit, 'state_count', lambda: 0)() if hasattr(stream_mgr, 'agg_bybit') else 0,
+            "symbols": byb_sym_count,
+            "state": agg_b.state_count() if agg_b is not None else 0,
             "last_emit_ts": bybit_last_emit,
             "last_ingest_ts": bybit_last_ingest,
             "last_kline_ingest_ts": bybit_last_kline_ingest,
@@ -184,8 +289,8 @@ async def debug_status(include_lists: bool | None = None):
             "last_kline_ingest_age_s": (now_ms - bybit_last_kline_ingest) / 1000 if bybit_last_kline_ingest else None,
             "last_ticker_ingest_age_s": (now_ms - bybit_last_ticker_ingest) / 1000 if bybit_last_ticker_ingest else None,
             "tasks": {
-                "kline": check_task(stream_mgr._task_bybit, "bybit_kline"),
-                "ticker": check_task(stream_mgr._task_bybit_ticker, "bybit_ticker"),
+                "kline": _task_status(stream_mgr._task_bybit, "bybit_kline"),
+                "ticker": _task_status(stream_mgr._task_bybit_ticker, "bybit_ticker"),
             },
             "stale": byb_stale,
         }
@@ -207,16 +312,17 @@ async def debug_symbols():
 @app.get("/debug/snapshot")
 async def debug_snapshot():
     try:
-        snap = stream_mgr.agg.build_snapshot()  # type: ignore[attr-defined]
-        return snap.model_dump()
+        # Same pre-serialized payload the screener WS sends; no model_dump/re-encode
+        payload = stream_mgr.agg._build_snapshot_payload()  # type: ignore[attr-defined]
+        return Response(content=payload, media_type="application/json")
     except Exception:
         return {"exchange": "binance", "ts": 0, "metrics": []}
 
 @app.get("/debug/snapshot/bybit")
 async def debug_snapshot_bybit():
     try:
-        snap = stream_mgr.agg_bybit.build_snapshot()  # type: ignore[attr-defined]
-        return snap.model_dump()
+        payload = stream_mgr.agg_bybit._build_snapshot_payload()  # type: ignore[attr-defined]
+        return Response(content=payload, media_type="application/json")
     except Exception:
         return {"exchange": "bybit", "ts": 0, "metrics": []}
 
@@ -224,7 +330,7 @@ async def debug_snapshot_bybit():
 async def debug_oi():
     """Debug endpoint to check Open Interest data"""
     try:
-        snap = stream_mgr.agg.build_snapshot()  # type: ignore[attr-defined]
+        snap = stream_mgr.agg.latest_snapshot()  # type: ignore[attr-defined]
         oi_metrics = []
         for m in snap.metrics:
             if m.open_interest is not None and m.open_interest > 0:
@@ -249,9 +355,8 @@ async def debug_oi():
 async def debug_marketcap():
     """Debug endpoint to check Market Cap data"""
     try:
-        from .services.market_cap import get_provider
         provider = get_provider()
-        snap = stream_mgr.agg.build_snapshot()  # type: ignore[attr-defined]
+        snap = stream_mgr.agg.latest_snapshot()  # type: ignore[attr-defined]
         mc_metrics = []
         for m in snap.metrics:
             mc = provider.get_market_cap(m.symbol)
@@ -269,7 +374,6 @@ async def debug_marketcap():
             "mc_data": mc_metrics[:10]  # Show first 10
         }
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 # ========================================
@@ -280,50 +384,32 @@ async def debug_marketcap():
 async def get_positions():
     """Get all open positions with real-time PnL."""
     try:
-        from .services.portfolio import get_portfolio_manager
         manager = get_portfolio_manager()
         positions = manager.get_open_positions()
         
         # Get current prices from BOTH Binance and Bybit screeners
-        price_map = {}
-        
-        # Add Binance prices
+        binance_metrics = bybit_metrics = ()
         try:
-            snap_binance = stream_mgr.agg.build_snapshot()  # type: ignore[attr-defined]
-            for m in snap_binance.metrics:
-                price_map[f"{m.exchange}:{m.symbol}"] = m.last_price
+            binance_metrics = stream_mgr.agg.latest_snapshot().metrics  # type: ignore[attr-defined]
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Failed to get Binance prices for portfolio: {e}")
-        
-        # Add Bybit prices
+            log.warning(f"Failed to get Binance prices for portfolio: {e}")
         try:
-            snap_bybit = stream_mgr.agg_bybit.build_snapshot()  # type: ignore[attr-defined]
-            for m in snap_bybit.metrics:
-                price_map[f"{m.exchange}:{m.symbol}"] = m.last_price
+            bybit_metrics = stream_mgr.agg_bybit.latest_snapshot().metrics  # type: ignore[attr-defined]
         except Exception as e:
-            import logging
-            logging.getLogger(__name__).warning(f"Failed to get Bybit prices for portfolio: {e}")
+            log.warning(f"Failed to get Bybit prices for portfolio: {e}")
+        price_map = {(m.exchange, m.symbol): m.last_price for m in chain(binance_metrics, bybit_metrics)}
+        get_price = price_map.get
         
-        result = []
-        for pos in positions:
-            pos_dict = pos.to_dict()
-            key = f"{pos.exchange}:{pos.symbol}"
-            current_price = price_map.get(key, pos.entry_price)
-            pnl_data = pos.calculate_pnl(current_price)
-            pos_dict.update(pnl_data)
-            result.append(pos_dict)
+        result = [pos.to_dict(get_price((pos.exchange, pos.symbol), pos.entry_price)) for pos in positions]
         
         return {"positions": result}
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 @app.post("/portfolio/positions")
 async def add_position(body: dict):
     """Add a new position to the portfolio."""
     try:
-        from .services.portfolio import get_portfolio_manager
         manager = get_portfolio_manager()
         
         position_id = manager.add_position(
@@ -342,14 +428,12 @@ async def add_position(body: dict):
         else:
             return {"success": False, "error": "Failed to add position"}
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 @app.put("/portfolio/positions/{position_id}")
 async def update_position(position_id: int, body: dict):
     """Update an existing position."""
     try:
-        from .services.portfolio import get_portfolio_manager
         manager = get_portfolio_manager()
         
         success = manager.update_position(
@@ -361,14 +445,12 @@ async def update_position(position_id: int, body: dict):
         
         return {"success": success}
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 @app.post("/portfolio/positions/{position_id}/close")
 async def close_position(position_id: int, body: dict):
     """Close a position."""
     try:
-        from .services.portfolio import get_portfolio_manager
         manager = get_portfolio_manager()
         
         success = manager.close_position(
@@ -379,35 +461,30 @@ async def close_position(position_id: int, body: dict):
         
         return {"success": success}
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 @app.delete("/portfolio/positions/{position_id}")
 async def delete_position(position_id: int):
     """Delete a position (only if open)."""
     try:
-        from .services.portfolio import get_portfolio_manager
         manager = get_portfolio_manager()
         
         success = manager.delete_position(position_id)
         
         return {"success": success}
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 @app.get("/portfolio/history")
 async def get_trade_history(limit: int = 100):
     """Get closed positions (trade history)."""
     try:
-        from .services.portfolio import get_portfolio_manager
         manager = get_portfolio_manager()
         
         trades = manager.get_closed_positions(limit=limit)
         
         return {"trades": trades}
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 # ==================== Market Data (L/S Ratio, Liquidations) ====================
@@ -420,13 +497,11 @@ async def get_long_short_ratio(exchange: str, symbol: str):
     Higher ratio = more longs, Lower ratio = more shorts.
     """
     try:
-        from .services.market_data import fetch_long_short_ratio
         data = await fetch_long_short_ratio(exchange, symbol)
         if data is None:
             return {"error": "Failed to fetch L/S ratio", "exchange": exchange, "symbol": symbol}
         return data
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 
@@ -437,12 +512,21 @@ async def get_liquidations(exchange: str, symbol: str, limit: int = 20):
     Returns list of recent forced liquidations with size and direction.
     """
     try:
-        from .services.market_data import fetch_liquidations
         data = await fetch_liquidations(exchange, symbol, limit=limit)
         
-        # Calculate summary
-        long_liq = [l for l in data if l.get("side") == "SELL"]  # SELL = long liquidated
-        short_liq = [l for l in data if l.get("side") == "BUY"]  # BUY = short liquidated
+        # Calculate summary in one pass
+        long_count = short_count = 0
+        total_value = long_value = short_value = 0
+        for l in data:
+            v = l.get("value_usd", 0)
+            total_value += v
+            side = l.get("side")
+            if side == "SELL":  # SELL = long liquidated
+                long_count += 1
+                long_value += v
+            elif side == "BUY":  # BUY = short liquidated
+                short_count += 1
+                short_value += v
         
         return {
             "exchange": exchange,
@@ -450,15 +534,14 @@ async def get_liquidations(exchange: str, symbol: str, limit: int = 20):
             "liquidations": data,
             "summary": {
                 "total_count": len(data),
-                "long_liq_count": len(long_liq),
-                "short_liq_count": len(short_liq),
-                "total_value_usd": sum(l.get("value_usd", 0) for l in data),
-                "long_liq_value": sum(l.get("value_usd", 0) for l in long_liq),
-                "short_liq_value": sum(l.get("value_usd", 0) for l in short_liq),
+                "long_liq_count": long_count,
+                "short_liq_count": short_count,
+                "total_value_usd": total_value,
+                "long_liq_value": long_value,
+                "short_liq_value": short_value,
             }
         }
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 
@@ -501,9 +584,12 @@ async def get_liquidation_levels(
         else:
             return {"error": f"Unknown exchange: {exchange}"}
         
-        # Calculate totals
-        total_long_value = sum(l.get("long_value", 0) for l in levels)
-        total_short_value = sum(l.get("short_value", 0) for l in levels)
+        # Totals and bias in one pass
+        tl = ts = 0
+        for l in levels:
+            tl += l.get("long_value", 0)
+            ts += l.get("short_value", 0)
+        bias = "long" if tl > ts else "short" if ts > tl else "neutral"
         
         return {
             "exchange": exchange,
@@ -513,24 +599,25 @@ async def get_liquidation_levels(
             "levels": levels,
             "summary": {
                 "level_count": len(levels),
-                "total_long_value": total_long_value,
-                "total_short_value": total_short_value,
-                "total_value": total_long_value + total_short_value,
-                "bias": "long" if total_long_value > total_short_value else "short" if total_short_value > total_long_value else "neutral"
+                "total_long_value": tl,
+                "total_short_value": ts,
+                "total_value": tl + ts,
+                "bias": bias
             }
         }
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 
 # ==================== Funding Rate ====================
 
+# Funding settles every 8 hours (3x per day); rate -> annualized percentage
+_FUNDING_ANNUAL_MULT = 3 * 365 * 100
+
 @app.get("/funding_rate/{exchange}/{symbol}")
 async def get_funding_rate(exchange: str, symbol: str):
     """Get funding rate for a specific symbol."""
     try:
-        from .services.funding_rate import fetch_funding_rate
         
         result = await fetch_funding_rate(exchange, symbol)
         
@@ -539,8 +626,7 @@ async def get_funding_rate(exchange: str, symbol: str):
         
         funding_rate, next_funding_time = result
         
-        # Calculate annualized rate (funding happens every 8 hours = 3x per day)
-        funding_rate_annual = funding_rate * 3 * 365 * 100  # Convert to percentage
+        funding_rate_annual = funding_rate * _FUNDING_ANNUAL_MULT
         
         return {
             "exchange": exchange,
@@ -551,7 +637,6 @@ async def get_funding_rate(exchange: str, symbol: str):
         }
     
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 
@@ -559,14 +644,12 @@ async def get_funding_rate(exchange: str, symbol: str):
 async def get_portfolio_stats():
     """Get portfolio performance statistics."""
     try:
-        from .services.portfolio import get_portfolio_manager
         manager = get_portfolio_manager()
         
         stats = manager.get_portfolio_stats()
         
         return stats
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
 # ========================================
@@ -577,7 +660,6 @@ async def get_portfolio_stats():
 async def get_news(exchange: str, symbol: str, limit: int = 20):
     """Get latest news for a crypto symbol from CryptoCompare."""
     try:
-        from .services.news import get_news_provider
         provider = get_news_provider()
         
         articles = await provider.get_news(symbol, limit=limit)
@@ -589,19 +671,35 @@ async def get_news(exchange: str, symbol: str, limit: int = 20):
             "count": len(articles)
         }
     except Exception as e:
-        import traceback
         return {"error": str(e), "traceback": traceback.format_exc()}
 
+async def _run_cpu(fn, *args):
+    """Run fn(*args) on the shared CPU pool so the loop keeps servicing sockets.
+
+    Only for work on data the loop no longer mutates (built snapshots, not
+    aggregator state).
+    """
+    return await asyncio.get_running_loop().run_in_executor(app.state.cpu_executor, fn, *args)
+
+
+# (binance snapshot, bybit snapshot, encoded body): latest_snapshot() returns the
+# same objects until a rebuild, so repeat requests reuse the encoded body.
+_all_snapshot_cache: tuple = (None, None, b"")
+
 @app.get("/debug/snapshot/all")
 async def debug_snapshot_all():
+    global _all_snapshot_cache
     try:
-        snap_b = stream_mgr.agg.build_snapshot()  # type: ignore[attr-defined]
+        snap_b = stream_mgr.agg.latest_snapshot()  # type: ignore[attr-defined]
     except Exception:
         snap_b = None
     try:
-        snap_y = stream_mgr.agg_bybit.build_snapshot()  # type: ignore[attr-defined]
+        snap_y = stream_mgr.agg_bybit.latest_snapshot()  # type: ignore[attr-defined]
     except Exception:
         snap_y = None
+    cached_b, cached_y, body = _all_snapshot_cache
+    if body and cached_b is snap_b and cached_y is snap_y:
+        return Response(content=body, media_type="application/json")
     metrics = []
     ts = 0
     if snap_b:
@@ -610,8 +708,10 @@ async def debug_snapshot_all():
     if snap_y:
         metrics.extend(snap_y.metrics)
         ts = max(ts, snap_y.ts)
-    from .models import ScreenerSnapshot
-    return ScreenerSnapshot(exchange="all", ts=ts, metrics=metrics).model_dump()
+    snap = ScreenerSnapshot(exchange="all", ts=ts, metrics=metrics)
+    body = (await _run_cpu(snap.model_dump_json)).encode()
+    _all_snapshot_cache = (snap_b, snap_y, body)
+    return Response(content=body, media_type="application/json")
 
 @app.post("/debug/resync")
 async def debug_resync(exchange: str = "all", backfill_limit: int = 200):
@@ -619,8 +719,6 @@ async def debug_resync(exchange: str = "all", backfill_limit: int = 200):
 
     Intended for local-only deployments (ngrok/cloudflare tunnel).
     """
-    import logging
-    log = logging.getLogger(__name__)
 
     results = {"exchange": exchange, "backfill_limit": backfill_limit, "actions": []}
 
@@ -656,16 +754,17 @@ async def debug_resync(exchange: str = "all", backfill_limit: int = 200):
         except Exception:
             pass
 
-    try:
-        if exchange in {"all", "binance"}:
-            await do_binance()
-        if exchange in {"all", "bybit"}:
-            await do_bybit()
-        results["ok"] = True
-    except Exception as e:
-        # Ensure this endpoint never throws 500s; surface the error instead.
-        results["ok"] = False
-        results["error"] = str(e)
+    # The venues are independent, so restart/backfill them concurrently
+    jobs = []
+    if exchange in {"all", "binance"}:
+        jobs.append(do_binance())
+    if exchange in {"all", "bybit"}:
+        jobs.append(do_bybit())
+    errors = [r for r in await asyncio.gather(*jobs, return_exceptions=True) if isinstance(r, Exception)]
+    # Ensure this endpoint never throws 500s; surface the error instead.
+    results["ok"] = not errors
+    if errors:
+        results["error"] = str(errors[0])
 
     return results
 
@@ -701,25 +800,59 @@ async def meta_alerts(
     source_tf: str | None = None,
     min_grade: str = 'B',
 ):
-    import time
-    from .services.alert_store import get_recent_alerts
     since_ts = int(time.time() * 1000) - int(since_minutes * 60 * 1000)
+    alerts = await asyncio.to_thread(
+        get_recent_alerts,
+        exchange=exchange,
+        limit=limit,
+        since_ts=since_ts,
+        signal=signal,
+        source_tf=source_tf,
+        min_grade=min_grade,
+    )
     return {
         "exchange": exchange or "all",
         "limit": limit,
         "since_minutes": since_minutes,
         "min_grade": min_grade,
-        "alerts": get_recent_alerts(
-            exchange=exchange,
-            limit=limit,
-            since_ts=since_ts,
-            signal=signal,
-            source_tf=source_tf,
-            min_grade=min_grade,
-        ),
+        "alerts": alerts,
     }
 
 
+# Short-lived in-process cache for the read-heavy SQLite endpoints: dashboards poll
+# them with identical params, and each miss re-runs an aggregate over the table.
+_RESPONSE_CACHE_MAX = 1024  # entries per namespace; expired, then oldest, are evicted beyond this
+_response_cache: dict = {}  # namespace -> {(endpoint, sorted kwargs): (expires monotonic, body)}, oldest first
+
+def _cached(ttl_s: float, namespace: str = "default"):
+    """Cache an endpoint's return value per query-parameter set for ttl_s seconds."""
+    def decorator(fn):
+        entries = _response_cache.setdefault(namespace, {})
+
+        @functools.wraps(fn)
+        async def wrapper(**kwargs):
+            key = (fn.__name__, tuple(sorted(kwargs.items())))
+            now = time.monotonic()
+            hit = entries.get(key)
+            if hit is not None and hit[0] > now:
+                return hit[1]
+            body = await fn(**kwargs)
+            entries.pop(key, None)  # re-insert at the end so dict order stays oldest-first
+            if len(entries) >= _RESPONSE_CACHE_MAX:
+                for k in [k for k, (exp, _) in entries.items() if exp <= now]:
+                    del entries[k]
+                # Keys come from client query params, so live entries must be capped too
+                while len(entries) >= _RESPONSE_CACHE_MAX:
+                    del entries[next(iter(entries))]
+            entries[key] = (now + ttl_s, body)
+            return body
+        return wrapper
+    return decorator
+
+def _clear_cached(namespace: str) -> None:
+    _response_cache.get(namespace, {}).clear()
+
+
 @app.get("/alerts/history")
 async def alerts_history(
     exchange: str | None = None,
@@ -733,38 +866,22 @@ async def alerts_history(
     This is the historical alerts from the screener's signal detection system,
     NOT custom price alerts set by users.
     """
-    from .services.alert_store import get_recent_alerts
-    
-    alerts = get_recent_alerts(
+
+    # No time filter - all historical alerts, already in the page's row shape
+    body = await asyncio.to_thread(
+        get_alert_history_json,
         exchange=exchange,
         limit=limit,
-        since_ts=None,  # No time filter - get all historical alerts
         signal=signal,
         source_tf=source_tf,
         min_grade=min_grade,
     )
-    
-    # Transform to match frontend expected format
-    return [
-        {
-            "id": a["id"],
-            "ts": a["created_ts"] or a["ts"],
-            "exchange": a["exchange"],
-            "symbol": a["symbol"],
-            "signal": a["signal"],
-            "source_tf": a.get("source_tf"),
-            "reason": a.get("reason"),
-            "price": a.get("price"),
-            "grade": a.get("setup_grade"),
-        }
-        for a in alerts
-    ]
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/meta/trade_plan")
 async def meta_trade_plan(exchange: str, symbol: str):
-    from .services.alert_store import get_latest_trade_plan
-    plan = get_latest_trade_plan(exchange, symbol)
+    plan = await asyncio.to_thread(get_latest_trade_plan, exchange, symbol)
     return {"exchange": exchange, "symbol": symbol, "plan": plan}
 
 
@@ -775,14 +892,6 @@ async def symbol_details(exchange: str, symbol: str):
     Returns: history, oi_history, trade_plan, backtest (30d & 90d), news, funding_rate,
              long_short_ratio, liquidations
     """
-    import json
-    from .services.alert_store import get_latest_trade_plan
-    from .services.ohlc_store import init_db, _DB_LOCK, _CONN
-    from .services.backtester import STRATEGY_VERSION
-    from .services.news import get_news_provider
-    from .services.funding_rate import fetch_funding_rate
-    from .services.market_data import fetch_market_data_combined
-    
     result = {
         "exchange": exchange,
         "symbol": symbol,
@@ -799,7 +908,15 @@ async def symbol_details(exchange: str, symbol: str):
         "liquidation_levels": [],
     }
     
-    # Get history data
+    # Network fetches (news, funding rate, L/S ratio + liquidations) and the SQLite
+    # reads (run in threads) all overlap; the endpoint waits for the slowest one.
+    news_task = asyncio.create_task(_fetch_news_safe(symbol))
+    funding_task = asyncio.create_task(_fetch_funding_safe(exchange, symbol))
+    market_data_task = asyncio.create_task(_fetch_market_data_safe(exchange, symbol))
+    plan_task = asyncio.to_thread(_load_trade_plan_safe, exchange, symbol)
+    backtest_task = asyncio.to_thread(_load_backtests_safe, exchange, symbol)
+    
+    # History is in-memory aggregator state, read on the loop that updates it
     try:
         if exchange == 'binance':
             result["closes"] = stream_mgr.agg.get_history(symbol, 60)
@@ -810,54 +927,13 @@ async def symbol_details(exchange: str, symbol: str):
     except Exception:
         pass
     
-    # Get trade plan
-    try:
-        result["plan"] = get_latest_trade_plan(exchange, symbol)
-    except Exception:
-        pass
-    
-    # Get backtest results (30d and 90d)
     try:
-        init_db()
-        with _DB_LOCK:
-            for window_days in [30, 90]:
-                cur = _CONN.execute(
-                    """
-                    SELECT ts, n_trades, win_rate, avg_r, avg_mae_r, avg_mfe_r, avg_bars_to_resolve, results_json
-                    FROM backtest_results
-                    WHERE exchange=? AND symbol=? AND window_days=? AND strategy_version=?
-                    """,
-                    (exchange, symbol, window_days, STRATEGY_VERSION),
-                )
-                row = cur.fetchone()
-                if row:
-                    bt_data = {
-                        "window_days": window_days,
-                        "ts": row[0],
-                        "n_trades": row[1],
-                        "win_rate": row[2],
-                        "avg_r": row[3],
-                        "avg_mae_r": row[4],
-                        "avg_mfe_r": row[5],
-                        "avg_bars_to_resolve": row[6],
-                        "result": json.loads(row[7]) if row[7] else None,
-                    }
-                    if window_days == 30:
-                        result["bt30"] = bt_data
-                    else:
-                        result["bt90"] = bt_data
-    except Exception:
-        pass
-    
-    # Fetch news, funding rate, and market data (L/S ratio + liquidations) concurrently
-    try:
-        news_task = asyncio.create_task(_fetch_news_safe(symbol))
-        funding_task = asyncio.create_task(_fetch_funding_safe(exchange, symbol))
-        market_data_task = asyncio.create_task(_fetch_market_data_safe(exchange, symbol))
-        
-        news_result, funding_result, market_data_result = await asyncio.gather(
-            news_task, funding_task, market_data_task
+        news_result, funding_result, market_data_result, plan, backtests = await asyncio.gather(
+            news_task, funding_task, market_data_task, plan_task, backtest_task
         )
+        result["plan"] = plan
+        result["bt30"] = backtests.get(30)
+        result["bt90"] = backtests.get(90)
         result["news"] = news_result
         result["funding"] = funding_result
         if market_data_result:
@@ -871,10 +947,51 @@ async def symbol_details(exchange: str, symbol: str):
     return result
 
 
+def _load_trade_plan_safe(exchange: str, symbol: str):
+    """Latest trade plan, or None on error (runs in a worker thread)."""
+    try:
+        return get_latest_trade_plan(exchange, symbol)
+    except Exception:
+        return None
+
+
+def _load_backtests_safe(exchange: str, symbol: str) -> dict:
+    """30d and 90d backtest rows in one query, keyed by window_days (runs in a worker thread)."""
+    try:
+        rows = read_all(
+            """
+            SELECT window_days, ts, n_trades, win_rate, avg_r, avg_mae_r, avg_mfe_r, avg_bars_to_resolve, results_json
+            FROM backtest_results
+            WHERE exchange=? AND symbol=? AND window_days IN (30, 90) AND strategy_version=?
+            """,
+            (exchange, symbol, STRATEGY_VERSION),
+        )
+    except Exception:
+        return {}
+    out = {}
+    for row in rows:
+        if row[0] in out:
+            continue  # first row per window, as the per-window fetchone() did
+        try:
+            out[row[0]] = {
+                "window_days": row[0],
+                "ts": row[1],
+                "n_trades": row[2],
+                "win_rate": row[3],
+                "avg_r": row[4],
+                "avg_mae_r": row[5],
+                "avg_mfe_r": row[6],
+                "avg_bars_to_resolve": row[7],
+                "result": orjson.loads(row[8]) if row[8] else None,
+            }
+        except Exception:
+            pass
+    return out
+
+
 async def _fetch_market_data_safe(exchange: str, symbol: str):
     """Fetch market data (L/S ratio + liquidations) with error handling."""
     try:
-        from .services.market_data import fetch_market_data_combined
         return await fetch_market_data_combined(exchange, symbol)
     except Exception:
         return None
@@ -883,7 +1000,6 @@ async def _fetch_market_data_safe(exchange: str, symbol: str):
 async def _fetch_news_safe(symbol: str):
     """Fetch news with error handling."""
     try:
-        from .services.news import get_news_provider
         provider = get_news_provider()
         return await provider.get_news(symbol, limit=20)
     except Exception:
@@ -893,13 +1009,12 @@ async def _fetch_news_safe(symbol: str):
 async def _fetch_funding_safe(exchange: str, symbol: str):
     """Fetch funding rate with error handling."""
     try:
-        from .services.funding_rate import fetch_funding_rate
         result = await fetch_funding_rate(exchange, symbol)
         if result:
             funding_rate, next_funding_time = result
             return {
                 "funding_rate": funding_rate,
-                "funding_rate_annual": funding_rate * 3 * 365 * 100,
+                "funding_rate_annual": funding_rate * _FUNDING_ANNUAL_MULT,
                 "next_funding_time": next_funding_time,
             }
     except Exception:
@@ -910,10 +1025,9 @@ async def _fetch_funding_safe(exchange: str, symbol: str):
 @app.post("/meta/backtest/run")
 async def meta_backtest_run(exchange: str, symbol: str, window_days: int = 30):
     """Run backtest for a symbol and persist results."""
-    from .services.backtester import backtest_symbol
-    from .services.backtester import _insert_backtest_row  # type: ignore
-    res = backtest_symbol(exchange, symbol, window_days)
-    _insert_backtest_row(
+    res = await asyncio.to_thread(backtest_symbol, exchange, symbol, window_days)
+    await asyncio.to_thread(
+        _insert_backtest_row,
         exchange=exchange,
         symbol=symbol,
         source_tf=None,
@@ -926,28 +1040,24 @@ async def meta_backtest_run(exchange: str, symbol: str, window_days: int = 30):
         avg_bars_to_resolve=res.get('avg_bars_to_resolve'),
         results_json=res,
     )
+    _clear_cached("analysis")
     return {"exchange": exchange, "symbol": symbol, "window_days": window_days, "result": res}
 
 
 @app.get("/meta/backtest")
+@_cached(60, namespace="analysis")
 async def meta_backtest(exchange: str, symbol: str, window_days: int = 30):
-    from .services.ohlc_store import init_db
-    from .services.ohlc_store import _DB_LOCK, _CONN  # type: ignore
-    from .services.backtester import STRATEGY_VERSION
-    init_db()
-    with _DB_LOCK:
-        cur = _CONN.execute(
-            """
-            SELECT ts, n_trades, win_rate, avg_r, avg_mae_r, avg_mfe_r, avg_bars_to_resolve, results_json
-            FROM backtest_results
-            WHERE exchange=? AND symbol=? AND window_days=? AND strategy_version=?
-            """,
-            (exchange, symbol, window_days, STRATEGY_VERSION),
-        )
-        row = cur.fetchone()
+    row = await asyncio.to_thread(
+        read_one,
+        """
+        SELECT ts, n_trades, win_rate, avg_r, avg_mae_r, avg_mfe_r, avg_bars_to_resolve, results_json
+        FROM backtest_results
+        WHERE exchange=? AND symbol=? AND window_days=? AND strategy_version=?
+        """,
+        (exchange, symbol, window_days, STRATEGY_VERSION),
+    )
     if not row:
         return {"exchange": exchange, "symbol": symbol, "window_days": window_days, "strategy_version": STRATEGY_VERSION, "result": None}
-    import json
     return {
         "exchange": exchange,
         "symbol": symbol,
@@ -960,118 +1070,120 @@ async def meta_backtest(exchange: str, symbol: str, window_days: int = 30):
         "avg_mae_r": row[4],
         "avg_mfe_r": row[5],
         "avg_bars_to_resolve": row[6],
-        "result": json.loads(row[7]) if row[7] else None,
+        "result": orjson.loads(row[7]) if row[7] else None,
     }
 
 
+async def _sentiment_counts(since_ts: int) -> dict:
+    """BUY/SELL alert counts per exchange since since_ts, from one GROUP BY query."""
+    rows = await asyncio.to_thread(
+        read_all,
+        """
+        SELECT exchange, signal, COUNT(*)
+        FROM alerts
+        WHERE created_ts >= ? AND signal IN ('BUY', 'SELL')
+        GROUP BY exchange, signal
+        """,
+        (since_ts,),
+    )
+    counts: dict = {}
+    for exchange, signal, count in rows:
+        counts.setdefault(exchange, {"BUY": 0, "SELL": 0})[signal] = count
+    return counts
+
+
+def _sentiment(buy: int, sell: int) -> dict:
+    total = buy + sell
+    # score in [-1, +1]
+    score = ((buy - sell) / total) if total else 0.0
+    bias = "bullish" if score > 0.1 else "bearish" if score < -0.1 else "neutral"
+    return {"buy": buy, "sell": sell, "total": total, "score": score, "bias": bias}
+
+
 @app.get("/meta/sentiment")
+@_cached(10)
 async def meta_sentiment(exchange: str | None = None, window_minutes: int = 240):
     """Aggregate BUY/SELL counts over a rolling window (default 4h) from the persisted alerts table."""
-    import time
-    from .services.ohlc_store import init_db
-    from .services.ohlc_store import _DB_LOCK, _CONN  # type: ignore
-    init_db()
     since_ts = int(time.time() * 1000) - int(window_minutes * 60 * 1000)
-
-    params = [since_ts]
-    where = "WHERE created_ts >= ?"
+    counts = await _sentiment_counts(since_ts)
     if exchange:
-        where += " AND exchange = ?"
-        params.append(exchange)
-
-    with _DB_LOCK:
-        cur = _CONN.execute(
-            f"""
-            SELECT signal, COUNT(*)
-            FROM alerts
-            {where}
-            GROUP BY signal
-            """,
-            tuple(params),
-        )
-        rows = cur.fetchall()
-
-    counts = {"BUY": 0, "SELL": 0}
-    for sig, c in rows:
-        if sig in counts:
-            counts[sig] = int(c)
-
-    total = counts["BUY"] + counts["SELL"]
-    # score in [-1, +1]
-    score = ((counts["BUY"] - counts["SELL"]) / total) if total else 0.0
-    bias = "bullish" if score > 0.1 else "bearish" if score < -0.1 else "neutral"
+        c = counts.get(exchange, {"BUY": 0, "SELL": 0})
+        buy, sell = c["BUY"], c["SELL"]
+    else:
+        buy = sum(c["BUY"] for c in counts.values())
+        sell = sum(c["SELL"] for c in counts.values())
 
     return {
         "exchange": exchange or "all",
         "window_minutes": window_minutes,
         "since_ts": since_ts,
-        "buy": counts["BUY"],
-        "sell": counts["SELL"],
-        "total": total,
-        "score": score,
-        "bias": bias,
+        **_sentiment(buy, sell),
     }
 
 
 @app.get("/meta/sentiment/all")
+@_cached(10)
 async def meta_sentiment_all(window_minutes: int = 240):
     """Combined sentiment endpoint - returns all, binance, and bybit sentiment in one call.
     
     Reduces 3 API calls to 1 for the main dashboard.
     """
-    import time
-    from .services.ohlc_store import init_db
-    from .services.ohlc_store import _DB_LOCK, _CONN  # type: ignore
-    init_db()
     since_ts = int(time.time() * 1000) - int(window_minutes * 60 * 1000)
-
-    def calc_sentiment(buy: int, sell: int):
-        total = buy + sell
-        score = ((buy - sell) / total) if total else 0.0
-        bias = "bullish" if score > 0.1 else "bearish" if score < -0.1 else "neutral"
-        return {"buy": buy, "sell": sell, "total": total, "score": score, "bias": bias}
-
-    with _DB_LOCK:
-        # Single query to get counts by exchange and signal
-        cur = _CONN.execute(
-            """
-            SELECT exchange, signal, COUNT(*)
-            FROM alerts
-            WHERE created_ts >= ?
-            GROUP BY exchange, signal
-            """,
-            (since_ts,),
-        )
-        rows = cur.fetchall()
-
-    # Aggregate counts
-    all_buy, all_sell = 0, 0
-    binance_buy, binance_sell = 0, 0
-    bybit_buy, bybit_sell = 0, 0
-
-    for exchange, signal, count in rows:
-        if signal == "BUY":
-            all_buy += count
-            if exchange == "binance":
-                binance_buy = count
-            elif exchange == "bybit":
-                bybit_buy = count
-        elif signal == "SELL":
-            all_sell += count
-            if exchange == "binance":
-                binance_sell = count
-            elif exchange == "bybit":
-                bybit_sell = count
+    counts = await _sentiment_counts(since_ts)
+    binance = counts.get("binance", {"BUY": 0, "SELL": 0})
+    bybit = counts.get("bybit", {"BUY": 0, "SELL": 0})
 
     return {
         "window_minutes": window_minutes,
         "since_ts": since_ts,
-        "all": calc_sentiment(all_buy, all_sell),
-        "binance": calc_sentiment(binance_buy, binance_sell),
-        "bybit": calc_sentiment(bybit_buy, bybit_sell),
+        "all": _sentiment(sum(c["BUY"] for c in counts.values()), sum(c["SELL"] for c in counts.values())),
+        "binance": _sentiment(binance["BUY"], binance["SELL"]),
+        "bybit": _sentiment(bybit["BUY"], bybit["SELL"]),
     }
 
 
+@functools.lru_cache(maxsize=None)
+def _trades_where_sql(exchange: bool, top200: bool, grade: bool, source_tf: bool, signal: bool, symbol: bool) -> str:
+    where = ["window_days=?", "strategy_version=?", "resolved != 'NONE'"]
+    if exchange:
+        where.append('exchange=?')
+    if top200:
+        where.append('liquidity_top200 = 1')
+    if grade:
+        where.append('setup_grade=?')
+    if source_tf:
+        where.append('source_tf=?')
+    if signal:
+        where.append('signal=?')
+    if symbol:
+        where.append('symbol=?')
+    return ' AND '.join(where)
+
+
+def _trades_filter(
+    window_days: int,
+    strategy_version: str,
+    exchange: str,
+    top200_only: bool,
+    grade: str | None = None,
+    source_tf: str | None = None,
+    signal: str | None = None,
+    symbol: str | None = None,
+) -> tuple[str, list]:
+    """WHERE clause and params for the analysis endpoints' backtest_trades filters.
+
+    The clause text depends only on which filters are set, so it is built once
+    per combination; identical SQL text also lets each reader connection reuse
+    its prepared statement instead of re-parsing.
+    """
+    where_sql = _trades_where_sql(exchange != 'all', bool(top200_only), bool(grade), bool(source_tf), bool(signal), bool(symbol))
+    params = [window_days, strategy_version]
+    if exchange != 'all':
+        params.append(exchange)
+    params.extend(v for v in (grade, source_tf, signal, symbol) if v)
+    return where_sql, params
+
+
 @app.post('/meta/analysis/run')
 async def meta_analysis_run(window_days: int = 30, exchange: str = 'all', top200_only: bool = True):
     """Run analysis backtest and update grader with symbol win rates.
@@ -1079,23 +1191,25 @@ async def meta_analysis_run(window_days: int = 30, exchange: str = 'all', top200
     This can be triggered manually from the Analysis page to recompute all backtests
     and update the signal grading model with latest symbol performance data.
     """
-    from .services.analysis_backtester import run_analysis_backtest, update_grader_symbol_rates
-    import time
     
     start = time.time()
-    result = run_analysis_backtest(window_days=window_days, exchange=exchange, top200_only=top200_only)
+    result = await asyncio.to_thread(
+        run_analysis_backtest, window_days=window_days, exchange=exchange, top200_only=top200_only
+    )
     
     # Also update grader with symbol win rates
-    update_grader_symbol_rates(window_days=30)
+    await asyncio.to_thread(update_grader_symbol_rates, window_days=30)
     
     elapsed = time.time() - start
     result['elapsed_sec'] = round(elapsed, 2)
     result['grader_updated'] = True
+    _clear_cached("analysis")
     
     return result
 
 
 @app.get('/meta/analysis/filtered_winrate')
+@_cached(60, namespace="analysis")
 async def meta_analysis_filtered_winrate(
     window_days: int = 30,
     exchange: str = 'all',
@@ -1110,113 +1224,76 @@ async def meta_analysis_filtered_winrate(
     This allows users to see win rates for specific signal configurations,
     e.g., "A-grade BUY signals on 15m timeframe for BTCUSDT".
     """
-    from .services.ohlc_store import init_db
-    from .services.ohlc_store import _DB_LOCK, _CONN  # type: ignore
-    from .services.backtester import STRATEGY_VERSION
-    init_db()
 
-    params = [window_days, STRATEGY_VERSION]
-    where = ["window_days=?", "strategy_version=?", "resolved != 'NONE'"]
+    where_sql, params = _trades_filter(
+        window_days, STRATEGY_VERSION, exchange, top200_only,
+        grade=grade, source_tf=source_tf, signal=signal, symbol=symbol,
+    )
     
-    if exchange != 'all':
-        where.append('exchange=?')
-        params.append(exchange)
-    if top200_only:
-        where.append('liquidity_top200 = 1')
+    stats_q = asyncio.to_thread(
+        read_one,
+        f"""
+        SELECT
+          COUNT(*) as n,
+          SUM(resolved LIKE 'TP%') as wins,
+          SUM(resolved = 'SL') as losses,
+          AVG(r_multiple) as avg_r,
+          SUM(r_multiple) as total_r,
+          AVG(mae_r) as avg_mae_r,
+          AVG(mfe_r) as avg_mfe_r,
+          AVG(bars_to_resolve) as avg_bars,
+          SUM(resolved = 'TP1') as tp1_count,
+          SUM(resolved = 'TP2') as tp2_count,
+          SUM(resolved = 'TP3') as tp3_count
+        FROM backtest_trades
+        WHERE {where_sql}
+        """,
+        tuple(params),
+    )
+    # Also get breakdown by grade if no grade filter; both reads run concurrently
     if grade:
-        where.append('setup_grade=?')
-        params.append(grade)
-    if source_tf:
-        where.append('source_tf=?')
-        params.append(source_tf)
-    if signal:
-        where.append('signal=?')
-        params.append(signal)
-    if symbol:
-        where.append('symbol=?')
-        params.append(symbol)
-
-    where_sql = ' AND '.join(where)
-    
-    with _DB_LOCK:
-        row = _CONN.execute(
+        row = await stats_q
+        grades_rows = []
+    else:
+        row, grades_rows = await asyncio.gather(stats_q, asyncio.to_thread(
+            read_all,
             f"""
-            SELECT
-              COUNT(*) as n,
-              SUM(CASE WHEN resolved LIKE 'TP%' THEN 1 ELSE 0 END) as wins,
-              SUM(CASE WHEN resolved = 'SL' THEN 1 ELSE 0 END) as losses,
-              AVG(CASE WHEN resolved LIKE 'TP%' THEN 1.0 ELSE 0.0 END) as win_rate,
-              AVG(r_multiple) as avg_r,
-              SUM(r_multiple) as total_r,
-              AVG(mae_r) as avg_mae_r,
-              AVG(mfe_r) as avg_mfe_r,
-              AVG(bars_to_resolve) as avg_bars,
-              SUM(CASE WHEN resolved = 'TP1' THEN 1 ELSE 0 END) as tp1_count,
-              SUM(CASE WHEN resolved = 'TP2' THEN 1 ELSE 0 END) as tp2_count,
-              SUM(CASE WHEN resolved = 'TP3' THEN 1 ELSE 0 END) as tp3_count
+            SELECT setup_grade,
+                   COUNT(*) as n,
+                   AVG(resolved LIKE 'TP%') as win_rate,
+                   AVG(r_multiple) as avg_r
             FROM backtest_trades
             WHERE {where_sql}
+            GROUP BY setup_grade
+            ORDER BY setup_grade
             """,
             tuple(params),
-        ).fetchone()
-        
-        # Also get breakdown by grade if no grade filter
-        grade_breakdown = []
-        if not grade:
-            grades_rows = _CONN.execute(
-                f"""
-                SELECT setup_grade,
-                       COUNT(*) as n,
-                       AVG(CASE WHEN resolved LIKE 'TP%' THEN 1.0 ELSE 0.0 END) as win_rate,
-                       AVG(r_multiple) as avg_r
-                FROM backtest_trades
-                WHERE {where_sql}
-                GROUP BY setup_grade
-                ORDER BY setup_grade
-                """,
-                tuple(params),
-            ).fetchall()
-            for gr in grades_rows:
-                grade_breakdown.append({
-                    'grade': gr[0] or '—',
-                    'n': int(gr[1] or 0),
-                    'win_rate': round(float(gr[2] or 0), 3),
-                    'avg_r': round(float(gr[3] or 0), 3),
-                })
+        ))
+    grade_breakdown = []
+    for gr in grades_rows:
+        grade_breakdown.append({
+            'grade': gr[0] or '—',
+            'n': int(gr[1] or 0),
+            'win_rate': round(float(gr[2] or 0), 3),
+            'avg_r': round(float(gr[3] or 0), 3),
+        })
 
     n = int(row[0] or 0)
     wins = int(row[1] or 0)
     losses = int(row[2] or 0)
-    win_rate = float(row[3] or 0)
-    avg_r = float(row[4] or 0)
+    win_rate = wins / n if n else 0.0
+    avg_r = float(row[3] or 0)
     
     # Calculate expectancy
     if n > 0:
-        avg_win = float(row[7] or 0)  # avg_mfe_r as proxy for avg win
-        avg_loss = abs(float(row[6] or 0))  # avg_mae_r as proxy for avg loss
+        avg_win = float(row[6] or 0)  # avg_mfe_r as proxy for avg win
+        avg_loss = abs(float(row[5] or 0))  # avg_mae_r as proxy for avg loss
         expectancy = (win_rate * avg_win) - ((1 - win_rate) * avg_loss) if avg_loss > 0 else 0
     else:
         expectancy = 0
 
-    # Get list of symbols with trades for the dropdown
-    symbol_list = []
-    with _DB_LOCK:
-        sym_rows = _CONN.execute(
-            f"""
-            SELECT DISTINCT symbol, exchange, COUNT(*) as n
-            FROM backtest_trades
-            WHERE window_days=? AND strategy_version=? AND resolved != 'NONE'
-            {' AND exchange=?' if exchange != 'all' else ''}
-            {' AND liquidity_top200 = 1' if top200_only else ''}
-            GROUP BY symbol, exchange
-            HAVING COUNT(*) >= 3
-            ORDER BY COUNT(*) DESC
-            LIMIT 100
-            """,
-            tuple([window_days, STRATEGY_VERSION] + ([exchange] if exchange != 'all' else [])),
-        ).fetchall()
-        for sr in sym_rows:
-            symbol_list.append({'symbol': sr[0], 'exchange': sr[1], 'n': sr[2]})
+    # Dropdown symbols only depend on window/exchange/top200, not the other filters
+    symbol_list = await _analysis_symbol_list(window_days=window_days, exchange=exchange, top200_only=top200_only)
 
     return {
         'filters': {
@@ -1235,50 +1312,59 @@ async def meta_analysis_filtered_winrate(
             'losses': losses,
             'win_rate': round(win_rate, 3),
             'avg_r': round(avg_r, 3),
-            'total_r': round(float(row[5] or 0), 2),
+            'total_r': round(float(row[4] or 0), 2),
             'expectancy': round(expectancy, 3),
-            'avg_mae_r': round(float(row[6] or 0), 3),
-            'avg_mfe_r': round(float(row[7] or 0), 3),
-            'avg_bars': round(float(row[8] or 0), 1),
-            'tp1_count': int(row[9] or 0),
-            'tp2_count': int(row[10] or 0),
-            'tp3_count': int(row[11] or 0),
+            'avg_mae_r': round(float(row[5] or 0), 3),
+            'avg_mfe_r': round(float(row[6] or 0), 3),
+            'avg_bars': round(float(row[7] or 0), 1),
+            'tp1_count': int(row[8] or 0),
+            'tp2_count': int(row[9] or 0),
+            'tp3_count': int(row[10] or 0),
         },
         'grade_breakdown': grade_breakdown,
     }
 
 
+@_cached(600, namespace="analysis")
+async def _analysis_symbol_list(window_days: int, exchange: str, top200_only: bool) -> list:
+    """Symbols with >= 3 resolved trades, for the filtered-winrate dropdown."""
+    where_sql, params = _trades_filter(window_days, STRATEGY_VERSION, exchange, top200_only)
+    sym_rows = await asyncio.to_thread(
+        read_all,
+        f"""
+        SELECT DISTINCT symbol, exchange, COUNT(*) as n
+        FROM backtest_trades
+        WHERE {where_sql}
+        GROUP BY symbol, exchange
+        HAVING COUNT(*) >= 3
+        ORDER BY COUNT(*) DESC
+        LIMIT 100
+        """,
+        tuple(params),
+    )
+    return [{'symbol': sr[0], 'exchange': sr[1], 'n': sr[2]} for sr in sym_rows]
+
+
 @app.get('/meta/analysis/summary')
+@_cached(60, namespace="analysis")
 async def meta_analysis_summary(window_days: int = 30, exchange: str = 'all', top200_only: bool = True):
-    from .services.ohlc_store import init_db
-    from .services.ohlc_store import _DB_LOCK, _CONN  # type: ignore
-    from .services.backtester import STRATEGY_VERSION
-    init_db()
 
-    params = [window_days, STRATEGY_VERSION]
-    where = ["window_days=?", "strategy_version=?", "resolved != 'NONE'"]
-    if exchange != 'all':
-        where.append('exchange=?')
-        params.append(exchange)
-    if top200_only:
-        where.append('liquidity_top200 = 1')
-
-    where_sql = ' AND '.join(where)
-    with _DB_LOCK:
-        row = _CONN.execute(
-            f"""
-            SELECT
-              COUNT(*) as n,
-              AVG(CASE WHEN resolved LIKE 'TP%' THEN 1.0 ELSE 0.0 END) as win_rate,
-              AVG(r_multiple) as avg_r,
-              AVG(mae_r) as avg_mae_r,
-              AVG(mfe_r) as avg_mfe_r,
-              AVG(bars_to_resolve) as avg_bars
-            FROM backtest_trades
-            WHERE {where_sql}
-            """,
-            tuple(params),
-        ).fetchone()
+    where_sql, params = _trades_filter(window_days, STRATEGY_VERSION, exchange, top200_only)
+    row = await asyncio.to_thread(
+        read_one,
+        f"""
+        SELECT
+          COUNT(*) as n,
+          AVG(CASE WHEN resolved LIKE 'TP%' THEN 1.0 ELSE 0.0 END) as win_rate,
+          AVG(r_multiple) as avg_r,
+          AVG(mae_r) as avg_mae_r,
+          AVG(mfe_r) as avg_mfe_r,
+          AVG(bars_to_resolve) as avg_bars
+        FROM backtest_trades
+        WHERE {where_sql}
+        """,
+        tuple(params),
+    )
 
     return {
         'window_days': window_days,
@@ -1294,6 +1380,7 @@ async def meta_analysis_summary(window_days: int = 30, exchange: str = 'all', to
 
 
 @app.get('/meta/analysis/breakdown')
+@_cached(60, namespace="analysis")
 async def meta_analysis_breakdown(
     window_days: int = 30,
     exchange: str = 'all',
@@ -1301,36 +1388,25 @@ async def meta_analysis_breakdown(
     min_trades: int = 1,
     limit: int = 500,
 ):
-    from .services.ohlc_store import init_db
-    from .services.ohlc_store import _DB_LOCK, _CONN  # type: ignore
-    from .services.backtester import STRATEGY_VERSION
-    init_db()
 
-    params = [window_days, STRATEGY_VERSION]
-    where = ["window_days=?", "strategy_version=?", "resolved != 'NONE'"]
-    if exchange != 'all':
-        where.append('exchange=?')
-        params.append(exchange)
-    if top200_only:
-        where.append('liquidity_top200 = 1')
-    where_sql = ' AND '.join(where)
-
-    with _DB_LOCK:
-        rows = _CONN.execute(
-            f"""
-            SELECT setup_grade, source_tf, signal,
-                   COUNT(*) as n,
-                   AVG(CASE WHEN resolved LIKE 'TP%' THEN 1.0 ELSE 0.0 END) as win_rate,
-                   AVG(r_multiple) as avg_r
-            FROM backtest_trades
-            WHERE {where_sql}
-            GROUP BY setup_grade, source_tf, signal
-            HAVING COUNT(*) >= ?
-            ORDER BY setup_grade, source_tf, signal
-            LIMIT ?
-            """,
-            tuple(params + [max(1, int(min_trades)), max(1, int(limit))]),
-        ).fetchall()
+    where_sql, params = _trades_filter(window_days, STRATEGY_VERSION, exchange, top200_only)
+
+    rows = await asyncio.to_thread(
+        read_all,
+        f"""
+        SELECT setup_grade, source_tf, signal,
+               COUNT(*) as n,
+               AVG(CASE WHEN resolved LIKE 'TP%' THEN 1.0 ELSE 0.0 END) as win_rate,
+               AVG(r_multiple) as avg_r
+        FROM backtest_trades
+        WHERE {where_sql}
+        GROUP BY setup_grade, source_tf, signal
+        HAVING COUNT(*) >= ?
+        ORDER BY setup_grade, source_tf, signal
+        LIMIT ?
+        """,
+        tuple(params + [max(1, int(min_trades)), max(1, int(limit))]),
+    )
 
     out = []
     for r in rows:
@@ -1359,9 +1435,8 @@ async def meta_analysis_symbols(window_days: int = 30, min_trades: int = 3):
     Returns symbols ranked by total R, with win rate, avg R, expectancy, etc.
     Used to identify best/worst performing symbols and feed the grader's auto-filtering.
     """
-    from .services.analysis_backtester import get_symbol_performance_stats
     
-    stats = get_symbol_performance_stats(window_days=window_days, min_trades=min_trades)
+    stats = await asyncio.to_thread(get_symbol_performance_stats, window_days=window_days, min_trades=min_trades)
     
     # Split into best and worst
     best = [s for s in stats if s['total_r'] > 0][:20]
@@ -1379,19 +1454,16 @@ async def meta_analysis_symbols(window_days: int = 30, min_trades: int = 3):
 
 @app.get('/meta/analysis/status')
 async def meta_analysis_status(window_days: int = 30, exchange: str = 'all', top200_only: bool = True):
-    from .services.ohlc_store import init_db, get_conn
-    from .services.ohlc_store import _DB_LOCK  # type: ignore
-    from .services.backtester import STRATEGY_VERSION
-    init_db(); conn = get_conn()
 
     top = 1 if top200_only else 0
-    with _DB_LOCK:
-        last = conn.execute(
+    last, totals = await asyncio.gather(
+        asyncio.to_thread(
+            read_one,
             """SELECT ts, n_alerts FROM analysis_runs WHERE window_days=? AND exchange=? AND top200_only=?""",
             (window_days, exchange, top),
-        ).fetchone()
-
-        totals = conn.execute(
+        ),
+        asyncio.to_thread(
+            read_one,
             """
             SELECT
               COUNT(*) as total,
@@ -1403,7 +1475,8 @@ async def meta_analysis_status(window_days: int = 30, exchange: str = 'all', top
               AND (?=0 OR liquidity_top200=1)
             """,
             (window_days, STRATEGY_VERSION, exchange, exchange, top),
-        ).fetchone()
+        ),
+    )
 
     total = int(totals[0] or 0)
     none_cnt = int(totals[1] or 0)
@@ -1425,20 +1498,8 @@ async def meta_analysis_status(window_days: int = 30, exchange: str = 'all', top
 
 @app.get('/meta/analysis/worst_symbols')
 async def meta_analysis_worst_symbols(window_days: int = 30, exchange: str = 'all', top200_only: bool = True, min_trades: int = 5, limit: int = 25):
-    from .services.ohlc_store import init_db, get_conn
-    from .services.ohlc_store import _DB_LOCK  # type: ignore
-    from .services.backtester import STRATEGY_VERSION
-    init_db()
-    conn = get_conn()
 
-    params = [window_days, STRATEGY_VERSION]
-    where = ["window_days=?", "strategy_version=?", "resolved != 'NONE'"]
-    if exchange != 'all':
-        where.append('exchange=?')
-        params.append(exchange)
-    if top200_only:
-        where.append('liquidity_top200 = 1')
-    where_sql = ' AND '.join(where)
+    where_sql, params = _trades_filter(window_days, STRATEGY_VERSION, exchange, top200_only)
 
     q = f"""
       SELECT exchange, symbol, COUNT(*) as n, AVG(r_multiple) as avg_r,
@@ -1452,8 +1513,7 @@ async def meta_analysis_worst_symbols(window_days: int = 30, exchange: str = 'al
     """
     params2 = params + [min_trades, limit]
 
-    with _DB_LOCK:
-        rows = conn.execute(q, tuple(params2)).fetchall()
+    rows = await asyncio.to_thread(read_all, q, tuple(params2))
 
     out=[]
     for r in rows:
@@ -1463,19 +1523,8 @@ async def meta_analysis_worst_symbols(window_days: int = 30, exchange: str = 'al
 
 @app.get('/meta/analysis/best_symbols')
 async def meta_analysis_best_symbols(window_days: int = 30, exchange: str = 'all', top200_only: bool = True, min_trades: int = 5, limit: int = 25):
-    from .services.ohlc_store import init_db, get_conn
-    from .services.ohlc_store import _DB_LOCK  # type: ignore
-    from .services.backtester import STRATEGY_VERSION
-    init_db(); conn = get_conn()
 
-    params = [window_days, STRATEGY_VERSION]
-    where = ["window_days=?", "strategy_version=?", "resolved != 'NONE'"]
-    if exchange != 'all':
-        where.append('exchange=?')
-        params.append(exchange)
-    if top200_only:
-        where.append('liquidity_top200 = 1')
-    where_sql = ' AND '.join(where)
+    where_sql, params = _trades_filter(window_days, STRATEGY_VERSION, exchange, top200_only)
 
     q = f"""
       SELECT exchange, symbol, COUNT(*) as n, AVG(r_multiple) as avg_r,
@@ -1489,8 +1538,7 @@ async def meta_analysis_best_symbols(window_days: int = 30, exchange: str = 'all
     """
     params2 = params + [min_trades, limit]
 
-    with _DB_LOCK:
-        rows = conn.execute(q, tuple(params2)).fetchall()
+    rows = await asyncio.to_thread(read_all, q, tuple(params2))
 
     out=[]
     for r in rows:
@@ -1501,19 +1549,8 @@ async def meta_analysis_best_symbols(window_days: int = 30, exchange: str = 'all
 @app.get('/meta/analysis/best_buckets')
 async def meta_analysis_best_buckets(window_days: int = 30, exchange: str = 'all', top200_only: bool = True, min_trades: int = 10, limit: int = 25):
     """Best performing buckets (grade × TF × side) by avg R."""
-    from .services.ohlc_store import init_db, get_conn
-    from .services.ohlc_store import _DB_LOCK  # type: ignore
-    from .services.backtester import STRATEGY_VERSION
-    init_db(); conn = get_conn()
 
-    params = [window_days, STRATEGY_VERSION]
-    where = ["window_days=?", "strategy_version=?", "resolved != 'NONE'"]
-    if exchange != 'all':
-        where.append('exchange=?')
-        params.append(exchange)
-    if top200_only:
-        where.append('liquidity_top200 = 1')
-    where_sql = ' AND '.join(where)
+    where_sql, params = _trades_filter(window_days, STRATEGY_VERSION, exchange, top200_only)
 
     q = f"""
       SELECT setup_grade, source_tf, signal,
@@ -1529,8 +1566,7 @@ async def meta_analysis_best_buckets(window_days: int = 30, exchange: str = 'all
     """
     params2 = params + [min_trades, limit]
 
-    with _DB_LOCK:
-        rows = conn.execute(q, tuple(params2)).fetchall()
+    rows = await asyncio.to_thread(read_all, q, tuple(params2))
 
     out=[]
     for r in rows:
@@ -1561,35 +1597,38 @@ async def meta_analysis_report(
     - best_symbols
     - worst_symbols
     """
-    summary = await meta_analysis_summary(window_days=window_days, exchange=exchange, top200_only=top200_only)
-    status = await meta_analysis_status(window_days=window_days, exchange=exchange, top200_only=top200_only)
-    breakdown = await meta_analysis_breakdown(
-        window_days=window_days,
-        exchange=exchange,
-        top200_only=top200_only,
-        min_trades=breakdown_min_trades,
-        limit=breakdown_limit,
-    )
-    best_buckets = await meta_analysis_best_buckets(
-        window_days=window_days,
-        exchange=exchange,
-        top200_only=top200_only,
-        min_trades=bucket_min_trades,
-        limit=bucket_limit,
-    )
-    best_symbols = await meta_analysis_best_symbols(
-        window_days=window_days,
-        exchange=exchange,
-        top200_only=top200_only,
-        min_trades=symbol_min_trades,
-        limit=symbol_limit,
-    )
-    worst_symbols = await meta_analysis_worst_symbols(
-        window_days=window_days,
-        exchange=exchange,
-        top200_only=top200_only,
-        min_trades=symbol_min_trades,
-        limit=symbol_limit,
+    # Sections read on separate worker-thread connections, so they run concurrently
+    summary, status, breakdown, best_buckets, best_symbols, worst_symbols = await asyncio.gather(
+        meta_analysis_summary(window_days=window_days, exchange=exchange, top200_only=top200_only),
+        meta_analysis_status(window_days=window_days, exchange=exchange, top200_only=top200_only),
+        meta_analysis_breakdown(
+            window_days=window_days,
+            exchange=exchange,
+            top200_only=top200_only,
+            min_trades=breakdown_min_trades,
+            limit=breakdown_limit,
+        ),
+        meta_analysis_best_buckets(
+            window_days=window_days,
+            exchange=exchange,
+            top200_only=top200_only,
+            min_trades=bucket_min_trades,
+            limit=bucket_limit,
+        ),
+        meta_analysis_best_symbols(
+            window_days=window_days,
+            exchange=exchange,
+            top200_only=top200_only,
+            min_trades=symbol_min_trades,
+            limit=symbol_limit,
+        ),
+        meta_analysis_worst_symbols(
+            window_days=window_days,
+            exchange=exchange,
+            top200_only=top200_only,
+            min_trades=symbol_min_trades,
+            limit=symbol_limit,
+        ),
     )
 
     return {
@@ -1677,14 +1716,12 @@ async def ws_orderflow(
 @app.websocket("/ws/screener")
 async def ws_screener(ws: WebSocket):
     await ws.accept()
-    import logging
-    log = logging.getLogger(__name__)
     log.info("WS client connected")
     q = await stream_mgr.subscribe()
 
     async def send_latest():
         payload = stream_mgr.agg._build_snapshot_payload()  # type: ignore[attr-defined]
-        await ws.send_text(payload)
+        await _send_snapshot(ws, payload)
 
     # initial send (guarded)
     try:
@@ -1696,14 +1733,13 @@ async def ws_screener(ws: WebSocket):
             pass
         return
 
-    from .config import WS_HEARTBEAT_SEC
     periodic = asyncio.create_task(_periodic_sender(ws, send_latest, WS_HEARTBEAT_SEC))
     ping_task = asyncio.create_task(_pinger(ws))
     try:
         while True:
-            payload = await q.get()
+            payload = await stream_mgr.next_payload(q)
             try:
-                await ws.send_text(payload)
+                await _send_snapshot(ws, payload)
             except Exception:
                 break
     except WebSocketDisconnect:
@@ -1719,14 +1755,12 @@ async def ws_screener(ws: WebSocket):
 @app.websocket("/ws/screener/bybit")
 async def ws_screener_bybit(ws: WebSocket):
     await ws.accept()
-    import logging
-    log = logging.getLogger(__name__)
     log.info("WS client connected (bybit)")
     q = await stream_mgr.subscribe_bybit()
 
     async def send_latest():
         payload = stream_mgr.agg_bybit._build_snapshot_payload()  # type: ignore[attr-defined]
-        await ws.send_text(payload)
+        await _send_snapshot(ws, payload)
 
     # initial send (guarded)
     try:
@@ -1738,14 +1772,13 @@ async def ws_screener_bybit(ws: WebSocket):
             pass
         return
 
-    from .config import WS_HEARTBEAT_SEC
     periodic = asyncio.create_task(_periodic_sender(ws, send_latest, WS_HEARTBEAT_SEC))
     ping_task = asyncio.create_task(_pinger(ws))
     try:
         while True:
-            payload = await q.get()
+            payload = await stream_mgr.next_payload(q)
             try:
-                await ws.send_text(payload)
+                await _send_snapshot(ws, payload)
             except Exception:
                 break
     except WebSocketDisconnect:
@@ -1787,8 +1820,6 @@ async def ws_orderbook(websocket: WebSocket, exchange: str, symbol: str):
         "ts": timestamp
     }
     """
-    import time
-    log = logging.getLogger(__name__)
     
     await websocket.accept()
     log.info(f"Orderbook WS connected: {exchange}:{symbol}")
@@ -1891,9 +1922,6 @@ async def ws_liquidations(websocket: WebSocket, exchange: str, symbol: str):
         "ts": timestamp
     }
     """
-    import json
-    import time
-    log = logging.getLogger(__name__)
     
     await websocket.accept()
     
@@ -1910,9 +1938,9 @@ async def ws_liquidations(websocket: WebSocket, exchange: str, symbol: str):
         current_price = 0
         try:
             if exchange == 'binance':
-                snap = stream_mgr.agg.build_snapshot()
+                snap = stream_mgr.agg.latest_snapshot()
             else:
-                snap = stream_mgr.agg_bybit.build_snapshot()
+                snap = stream_mgr.agg_bybit.latest_snapshot()
             for m in snap.metrics:
                 if m.symbol == symbol:
                     current_price = m.last_price
@@ -1974,11 +2002,12 @@ async def ws_liquidations(websocket: WebSocket, exchange: str, symbol: str):
             
             try:
                 async for liq in stream_fn({symbol}):
-                    if liq.get("symbol") == symbol:
+                    # Both venues yield LiquidationEvent objects; serialize at the send boundary
+                    if liq.symbol == symbol:
                         # Send individual liquidation event
                         await websocket.send_json({
                             "type": "liquidation",
-                            "data": liq,
+                            "data": liq.to_dict(),
                             "ts": int(time.time() * 1000)
                         })
                         
@@ -2009,9 +2038,9 @@ async def ws_liquidations(websocket: WebSocket, exchange: str, symbol: str):
                     # Update current price
                     try:
                         if exchange == 'binance':
-                            snap = stream_mgr.agg.build_snapshot()
+                            snap = stream_mgr.agg.latest_snapshot()
                         else:
-                            snap = stream_mgr.agg_bybit.build_snapshot()
+                            snap = stream_mgr.agg_bybit.latest_snapshot()
                         for m in snap.metrics:
                             if m.symbol == symbol:
                                 current_price = m.last_price
@@ -2081,8 +2110,6 @@ async def ws_liquidations(websocket: WebSocket, exchange: str, symbol: str):
 @app.websocket("/ws/screener/all")
 async def ws_screener_all(ws: WebSocket):
     await ws.accept()
-    import logging
-    log = logging.getLogger(__name__)
     log.info("WS client connected (all)")
     q_bin = await stream_mgr.subscribe()
     q_byb = None
@@ -2091,13 +2118,16 @@ async def ws_screener_all(ws: WebSocket):
     except Exception as e:
         log.warning(f"subscribe_bybit failed; continuing with Binance only: {e}")
 
-    async def build_combined_snapshot():
+    async def build_combined_snapshot(fresh: bool = False):
+        # Sends follow an emit, which already refreshed latest_snapshot(); only the
+        # readiness poll needs to see symbols as they arrive.
+        agg_bin, agg_byb = stream_mgr.agg, stream_mgr.agg_bybit
         try:
-            snap_bin = stream_mgr.agg.build_snapshot()  # type: ignore[attr-defined]
+            snap_bin = agg_bin.build_snapshot() if fresh else agg_bin.latest_snapshot()  # type: ignore[attr-defined]
         except Exception:
             snap_bin = None
         try:
-            snap_byb = stream_mgr.agg_bybit.build_snapshot()  # type: ignore[attr-defined]
+            snap_byb = agg_byb.build_snapshot() if fresh else agg_byb.latest_snapshot()  # type: ignore[attr-defined]
         except Exception:
             snap_byb = None
         metrics = []
@@ -2112,18 +2142,18 @@ async def ws_screener_all(ws: WebSocket):
 
     async def send_combined():
         snap = await build_combined_snapshot()
-        payload = snap.model_dump_json()
+        payload = await _run_cpu(snap.model_dump_json)
         try:
             log.debug(f"/ws/screener/all sending {len(snap.metrics)} metrics")
         except Exception:
             pass
-        await ws.send_text(payload)
+        await _send_snapshot(ws, payload)
 
     # readiness wait: give bybit a brief window to populate before first send
     async def readiness_wait(timeout_s: float = 3.0):
         start = asyncio.get_event_loop().time()
         while True:
-            snap = await build_combined_snapshot()
+            snap = await build_combined_snapshot(fresh=True)
             has_bin = any((m.exchange or '').lower() == 'binance' for m in snap.metrics)
             has_byb = any((m.exchange or '').lower() == 'bybit' for m in snap.metrics)
             if has_bin and has_byb:
@@ -2148,18 +2178,14 @@ async def ws_screener_all(ws: WebSocket):
                 pass
             return
 
-    from .config import WS_HEARTBEAT_SEC
     periodic = asyncio.create_task(_periodic_sender(ws, send_combined, WS_HEARTBEAT_SEC))
 
     ping_task = asyncio.create_task(_pinger(ws))
     try:
+        queues = (q_bin,) if q_byb is None else (q_bin, q_byb)
         while True:
-            tasks = {asyncio.create_task(q_bin.get())}
-            if q_byb is not None:
-                tasks.add(asyncio.create_task(q_byb.get()))
-            done, pending = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
-            for t in pending:
-                t.cancel()
+            # Both venues emitting within the coalesce window -> one combined frame
+            await stream_mgr.next_payload(*queues)
             try:
                 await send_combined()
             except Exception:
@@ -2184,10 +2210,23 @@ async def _periodic_sender(ws: WebSocket, send_fn, interval: float):
         except Exception:
             break
 
+_PING_FRAME = '{"type":"ping"}'
+
+
+async def _send_snapshot(ws: WebSocket, payload: str):
+    """Send one snapshot frame, giving up on clients that stop draining.
+
+    Each client already has its own drop-oldest queue, so a slow reader never
+    blocks the aggregator; the timeout makes sure it can't pin its handler on
+    a stalled write either. The caller's except path then closes the client.
+    """
+    await asyncio.wait_for(ws.send_text(payload), WS_SEND_TIMEOUT_SEC)
+
+
 async def _pinger(ws: WebSocket):
     while True:
         await asyncio.sleep(20)
         try:
-            await ws.send_json({"type": "ping"})
+            await ws.send_text(_PING_FRAME)
         except Exception:
             break
@@ -38,6 +38,9 @@ class Aggregator:
         self._snapshot_cache: str | None = None
         self._snapshot_cache_ts: int = 0
         self._snapshot_cache_ttl_ms: int = 5000  # 5 seconds
+        # Snapshot object behind the cached payload, for readers that need fields
+        self._latest_snapshot: ScreenerSnapshot | None = None
+        self._latest_snapshot_ts: int = 0
 
         # Persist snapshot cache to SQLite periodically (for instant warm start)
         self._last_persist_ts: int = 0
@@ -112,8 +115,25 @@ class Aggregator:
         payload = snap.model_dump_json()
         self._snapshot_cache = payload
         self._snapshot_cache_ts = now_ms
+        self._latest_snapshot = snap
+        self._latest_snapshot_ts = now_ms
         return payload
 
+    def latest_snapshot(self) -> ScreenerSnapshot:
+        """Most recently built snapshot, rebuilt only if older than the cache TTL.
+
+        For read-only consumers (debug/portfolio endpoints); emits keep it fresh.
+        """
+        import time
+        now_ms = int(time.time() * 1000)
+        if (self._latest_snapshot is not None
+            and (now_ms - self._latest_snapshot_ts < self._snapshot_cache_ttl_ms)):
+            return self._latest_snapshot
+        snap = self.build_snapshot()
+        self._latest_snapshot = snap
+        self._latest_snapshot_ts = now_ms
+        return snap
+
     async def emit_if_due(self):
         now_ms = int(__import__('time').time() * 1000)
         if now_ms - self.last_emit_ts < self._throttle_ms:
@@ -133,6 +153,8 @@ class Aggregator:
         now_ms = int(time.time() * 1000)
         self._snapshot_cache = payload
         self._snapshot_cache_ts = now_ms
+        self._latest_snapshot = snap
+        self._latest_snapshot_ts = now_ms
         
         try:
             self.last_emit_ts = now_ms
@@ -3,11 +3,17 @@ import json
 import time
 from typing import Optional, Dict, Any, List, Tuple
 
-from .ohlc_store import init_db, get_conn, _DB_LOCK  # type: ignore
+import orjson
+
+from .ohlc_store import init_db, get_conn, read_all, read_one, _DB_LOCK  # type: ignore
 
 # Simple in-memory cache for recent alerts (feed page)
 _alerts_cache: Dict[str, tuple[float, List[Dict[str, Any]]]] = {}
 _ALERTS_CACHE_TTL_SEC = 5.0  # 5 second cache for feed page
+_history_cache: Dict[str, tuple[float, bytes]] = {}  # same TTL, encoded History page bodies
+
+# Alerts/History page row shape; "ts" prefers created_ts like the feed does
+_HISTORY_KEYS = ("id", "ts", "exchange", "symbol", "signal", "source_tf", "reason", "price", "grade")
 
 
 def insert_alert(
@@ -93,25 +99,13 @@ def insert_trade_plan(
         return int(cur.lastrowid)
 
 
-def get_recent_alerts(
-    exchange: Optional[str] = None,
-    limit: int = 200,
-    since_ts: Optional[int] = None,
-    signal: Optional[str] = None,
-    source_tf: Optional[str] = None,
-    min_grade: Optional[str] = None,
-) -> List[Dict[str, Any]]:
-    # Build cache key from params
-    cache_key = f"{exchange}:{limit}:{since_ts}:{signal}:{source_tf}:{min_grade}"
-    now = time.time()
-    
-    # Check cache first
-    if cache_key in _alerts_cache:
-        cached_ts, cached_data = _alerts_cache[cache_key]
-        if now - cached_ts < _ALERTS_CACHE_TTL_SEC:
-            return cached_data
-    
-    conn = get_conn()
+def _alerts_where(
+    exchange: Optional[str],
+    since_ts: Optional[int],
+    signal: Optional[str],
+    source_tf: Optional[str],
+    min_grade: Optional[str],
+) -> Tuple[str, List[Any]]:
     where = []
     params: list[Any] = []
     if exchange:
@@ -137,6 +131,69 @@ def get_recent_alerts(
             where.append("setup_grade IN ('A','B','C')")
 
     where_sql = ("WHERE " + " AND ".join(where)) if where else ""
+    return where_sql, params
+
+
+def get_alert_history_json(
+    exchange: Optional[str] = None,
+    limit: int = 200,
+    signal: Optional[str] = None,
+    source_tf: Optional[str] = None,
+    min_grade: Optional[str] = None,
+) -> bytes:
+    """Alerts/History page rows as an encoded JSON array.
+
+    The page's fields are projected in SQL, so rows go straight from tuples to
+    the encoder without the full get_recent_alerts() dicts in between.
+    """
+    cache_key = f"{exchange}:{limit}:{signal}:{source_tf}:{min_grade}"
+    now = time.time()
+    cached = _history_cache.get(cache_key)
+    if cached is not None and now - cached[0] < _ALERTS_CACHE_TTL_SEC:
+        return cached[1]
+
+    where_sql, params = _alerts_where(exchange, None, signal, source_tf, min_grade)
+    params.append(limit)
+    rows = read_all(
+        f"""
+        SELECT id, COALESCE(NULLIF(created_ts, 0), ts), exchange, symbol, signal, source_tf, reason, price, setup_grade
+        FROM alerts
+        {where_sql}
+        ORDER BY created_ts DESC
+        LIMIT ?
+        """,
+        tuple(params),
+    )
+    body = orjson.dumps([dict(zip(_HISTORY_KEYS, r)) for r in rows])
+
+    _history_cache[cache_key] = (now, body)
+    if len(_history_cache) > 100:
+        # Snapshot the items: callers may run this from several worker threads
+        oldest = sorted(list(_history_cache.items()), key=lambda kv: kv[1][0])[:50]
+        for k, _ in oldest:
+            _history_cache.pop(k, None)
+    return body
+
+
+def get_recent_alerts(
+    exchange: Optional[str] = None,
+    limit: int = 200,
+    since_ts: Optional[int] = None,
+    signal: Optional[str] = None,
+    source_tf: Optional[str] = None,
+    min_grade: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    # Build cache key from params
+    cache_key = f"{exchange}:{limit}:{since_ts}:{signal}:{source_tf}:{min_grade}"
+    now = time.time()
+    
+    # Check cache first
+    if cache_key in _alerts_cache:
+        cached_ts, cached_data = _alerts_cache[cache_key]
+        if now - cached_ts < _ALERTS_CACHE_TTL_SEC:
+            return cached_data
+    
+    where_sql, params = _alerts_where(exchange, since_ts, signal, source_tf, min_grade)
 
     q = f"""
       SELECT id, ts, created_ts, exchange, symbol, signal, source_tf, price, reason, setup_score, setup_grade, avoid_reasons
@@ -147,9 +204,7 @@ def get_recent_alerts(
     """
     params.append(limit)
 
-    with _DB_LOCK:
-        cur = conn.execute(q, tuple(params))
-        rows = cur.fetchall()
+    rows = read_all(q, tuple(params))
     out = []
     for r in rows:
         avoid = None
@@ -177,27 +232,25 @@ def get_recent_alerts(
     
     # Clean old cache entries (keep cache size bounded)
     if len(_alerts_cache) > 100:
-        oldest_keys = sorted(_alerts_cache.keys(), key=lambda k: _alerts_cache[k][0])[:50]
-        for k in oldest_keys:
+        # Snapshot the items: callers may run this from several worker threads
+        oldest = sorted(list(_alerts_cache.items()), key=lambda kv: kv[1][0])[:50]
+        for k, _ in oldest:
             _alerts_cache.pop(k, None)
     
     return out
 
 
 def get_latest_trade_plan(exchange: str, symbol: str) -> Optional[Dict[str, Any]]:
-    conn = get_conn()
-    with _DB_LOCK:
-        cur = conn.execute(
-            """
-            SELECT id, ts, side, entry_type, entry_price, stop_loss, tp1, tp2, tp3, atr, atr_mult, swing_ref, risk_per_unit, rr_tp1, rr_tp2, rr_tp3
-            FROM trade_plans
-            WHERE exchange=? AND symbol=?
-            ORDER BY ts DESC
-            LIMIT 1
-            """,
-            (exchange, symbol),
-        )
-        row = cur.fetchone()
+    row = read_one(
+        """
+        SELECT id, ts, side, entry_type, entry_price, stop_loss, tp1, tp2, tp3, atr, atr_mult, swing_ref, risk_per_unit, rr_tp1, rr_tp2, rr_tp3
+        FROM trade_plans
+        WHERE exchange=? AND symbol=?
+        ORDER BY ts DESC
+        LIMIT 1
+        """,
+        (exchange, symbol),
+    )
     if not row:
         return None
     return {
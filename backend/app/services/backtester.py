@@ -1,6 +1,6 @@
 from __future__ import annotations
 import time
-import json
+import orjson
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any, Tuple
 
@@ -67,7 +67,7 @@ def _insert_backtest_row(
             """,
             (
                 _now_ms(), exchange, symbol, source_tf, window_days, STRATEGY_VERSION,
-                n_trades, win_rate, avg_r, avg_mae_r, avg_mfe_r, avg_bars_to_resolve, json.dumps(results_json),
+                n_trades, win_rate, avg_r, avg_mae_r, avg_mfe_r, avg_bars_to_resolve, orjson.dumps(results_json, option=orjson.OPT_NON_STR_KEYS),
             ),
         )
         conn.commit()
@@ -170,8 +170,8 @@ class MarketCapProvider:
                     self._last_update = time.time()
                     logger.info(f"Updated market cap cache with {len(new_cache)} symbols from CoinGecko")
                     
-                    # Save to database
-                    self._save_to_db()
+                    # Save to database off the event loop (DELETE + bulk INSERT + commit)
+                    await asyncio.to_thread(self._save_to_db)
                 elif resp.status == 429:
                     logger.warning("CoinGecko rate limit hit, using cached data")
                 else:
@@ -3,8 +3,12 @@ import sqlite3
 import threading
 from typing import List, Tuple, Optional, Any, Dict
 
-_DB_LOCK = threading.Lock()
+_DB_LOCK = threading.Lock()  # guards the shared (writer) connection
 _CONN: Optional[sqlite3.Connection] = None
+_DB_PATH = "ohlc.sqlite3"
+_READ_MMAP_SIZE = 256 * 1024 * 1024  # bytes of the db file readers may mmap
+_READ_STMT_CACHE = 256  # prepared statements kept per reader, keyed by SQL text
+_tls = threading.local()
 
 
 def get_conn() -> sqlite3.Connection:
@@ -14,10 +18,37 @@ def get_conn() -> sqlite3.Connection:
     return _CONN  # type: ignore[return-value]
 
 
+def get_read_conn() -> sqlite3.Connection:
+    """Return this thread's read-only connection (opened on first use).
+
+    The database runs in WAL mode, so readers on their own connections see the
+    last committed state without taking _DB_LOCK or blocking the writer.
+    """
+    conn = getattr(_tls, "conn", None)
+    if conn is None:
+        get_conn()  # schema and WAL mode are set up by the writer connection
+        conn = sqlite3.connect(_DB_PATH, cached_statements=_READ_STMT_CACHE)
+        conn.execute("PRAGMA query_only=ON")
+        conn.execute(f"PRAGMA mmap_size={_READ_MMAP_SIZE}")
+        _tls.conn = conn
+    return conn
+
+
+def read_all(sql: str, params: Tuple[Any, ...] = ()) -> List[Tuple[Any, ...]]:
+    """Run a read-only query on this thread's connection; all rows."""
+    return get_read_conn().execute(sql, params).fetchall()
+
+
+def read_one(sql: str, params: Tuple[Any, ...] = ()) -> Optional[Tuple[Any, ...]]:
+    """Run a read-only query on this thread's connection; first row or None."""
+    return get_read_conn().execute(sql, params).fetchone()
+
+
 def init_db(path: str = "ohlc.sqlite3"):
-    global _CONN
+    global _CONN, _DB_PATH
     with _DB_LOCK:
         if _CONN is None:
+            _DB_PATH = path
             _CONN = sqlite3.connect(path, check_same_thread=False)
             _CONN.execute("PRAGMA journal_mode=WAL")
             _CONN.execute("PRAGMA synchronous=NORMAL")
@@ -262,6 +293,11 @@ def init_db(path: str = "ohlc.sqlite3"):
             )
             _CONN.execute("CREATE INDEX IF NOT EXISTS idx_bt_trades_lookup ON backtest_trades(exchange, window_days, created_ts)")
             _CONN.execute("CREATE INDEX IF NOT EXISTS idx_bt_trades_symbol ON backtest_trades(exchange, symbol, window_days)")
+            # Analysis filters: window/version always, the rest optional
+            _CONN.execute(
+                "CREATE INDEX IF NOT EXISTS idx_bt_trades_filter ON backtest_trades("
+                "window_days, strategy_version, exchange, liquidity_top200, setup_grade, source_tf, signal, symbol, resolved)"
+            )
 
             # Snapshot cache for instant startup
             _CONN.execute(
@@ -27,6 +27,9 @@ class OrderBookHub:
         }
         self._tasks: Dict[str, asyncio.Task] = {}
         self._lock = asyncio.Lock()
+        # Binance symbols share one combined depth connection (see CombinedOrderBookStream)
+        self._binance_stream = None
+        self._binance_task: Optional[asyncio.Task] = None
     
     async def start_orderbook(self, exchange: str, symbol: str) -> bool:
         """Start order book streaming for a symbol.
@@ -43,14 +46,17 @@ class OrderBookHub:
             
             # Already running
             if symbol in self._active_symbols[exchange]:
-                task = self._tasks.get(task_key)
+                task = self._binance_task if exchange == "binance" else self._tasks.get(task_key)
                 if task and not task.done():
                     return True
             
             # Start new collector
             try:
                 if exchange == "binance":
-                    from ..exchanges.binance_orderbook_ws import run_orderbook_collector
+                    await self._start_binance(symbol)
+                    self._active_symbols[exchange].add(symbol)
+                    log.info(f"Started orderbook collector: {task_key}")
+                    return True
                 elif exchange == "bybit":
                     from ..exchanges.bybit_orderbook_ws import run_orderbook_collector
                 else:
@@ -67,12 +73,35 @@ class OrderBookHub:
                 log.error(f"Failed to start orderbook collector {task_key}: {e}")
                 return False
     
+    async def _start_binance(self, symbol: str) -> None:
+        """Add a symbol to the shared Binance connection, starting it if needed."""
+        if self._binance_stream is None:
+            from ..exchanges.binance_orderbook_ws import CombinedOrderBookStream
+            self._binance_stream = CombinedOrderBookStream()
+        await self._binance_stream.add(symbol)
+        if self._binance_task is None or self._binance_task.done():
+            self._binance_task = asyncio.create_task(self._binance_stream.run())
+    
+    async def _stop_binance(self) -> None:
+        task, self._binance_task = self._binance_task, None
+        if task and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+    
     async def stop_orderbook(self, exchange: str, symbol: str) -> None:
         """Stop order book streaming for a symbol."""
         async with self._lock:
             exchange = exchange.lower()
             task_key = f"{exchange}:{symbol}"
             
+            if exchange == "binance" and self._binance_stream is not None:
+                await self._binance_stream.remove(symbol)
+                if not self._binance_stream.symbols:
+                    await self._stop_binance()
+            
             task = self._tasks.pop(task_key, None)
             if task and not task.done():
                 task.cancel()
@@ -98,6 +127,8 @@ class OrderBookHub:
                         pass
             
             self._tasks.clear()
+            await self._stop_binance()
+            self._binance_stream = None
             for exchange in self._active_symbols:
                 self._active_symbols[exchange].clear()
             
@@ -5,8 +5,8 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, Optional, Set, Tuple
 
-from ..exchanges.binance_trades_ws import stream_agg_trades
-from ..exchanges.bybit_trades_ws import stream_trades
+from ..exchanges.binance_trades_ws import stream_agg_trades_batched
+from ..exchanges.bybit_trades_ws import stream_trades_batched
 from .orderflow import OrderFlowEngine, _tf_ms
 
 log = logging.getLogger(__name__)
@@ -70,38 +70,39 @@ class OrderFlowHub:
     async def _run_ingest(self, exchange: str, symbol: str, engine: OrderFlowEngine) -> None:
         max_candles = 500
 
-        async def iter_trades():
+        async def iter_batches():
             if exchange == 'binance':
-                async for t in stream_agg_trades(symbol):
-                    yield t
+                async for batch in stream_agg_trades_batched(symbol):
+                    yield batch
             elif exchange == 'bybit':
-                async for t in stream_trades(symbol):
-                    yield t
+                async for batch in stream_trades_batched(symbol):
+                    yield batch
             else:
                 return
 
         try:
-            async for t in iter_trades():
-                # Apply trade to all currently-subscribed (tf_ms, step) series
+            async for batch in iter_batches():
+                # Apply trades to all currently-subscribed (tf_ms, step) series
                 key = (exchange, symbol)
                 async with self._lock:
                     targets = list(self._subs.get(key, set()))
                 if not targets:
                     continue
 
-                for tf_ms, step in targets:
-                    try:
-                        await engine.ingest_trade(
-                            ts=int(t['ts']),
-                            price=float(t['price']),
-                            qty=float(t['qty']),
-                            side=str(t['side']),
-                            tf_ms=int(tf_ms),
-                            step=float(step),
-                            max_candles=max_candles,
-                        )
-                    except Exception:
-                        continue
+                for t in batch:
+                    for tf_ms, step in targets:
+                        try:
+                            await engine.ingest_trade(
+                                ts=int(t['ts']),
+                                price=float(t['price']),
+                                qty=float(t['qty']),
+                                side=str(t['side']),
+                                tf_ms=int(tf_ms),
+                                step=float(step),
+                                max_candles=max_candles,
+                            )
+                        except Exception:
+                            continue
         except asyncio.CancelledError:
             raise
         except Exception as e:
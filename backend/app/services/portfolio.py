@@ -3,7 +3,7 @@ Portfolio tracking service for managing open positions and calculating PnL.
 """
 import sqlite3
 import logging
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -34,15 +34,19 @@ class Position:
         self.take_profit = take_profit
         self.notes = notes
     
-    def calculate_pnl(self, current_price: float) -> Dict:
-        """Calculate PnL for this position."""
+    def _pnl(self, current_price: float) -> Tuple[float, float]:
+        """(pnl, pnl_pct) at current_price."""
         if self.side == 'LONG':
             pnl = (current_price - self.entry_price) * self.quantity
             pnl_pct = ((current_price / self.entry_price) - 1) * 100
         else:  # SHORT
             pnl = (self.entry_price - current_price) * self.quantity
             pnl_pct = ((self.entry_price / current_price) - 1) * 100
-        
+        return pnl, pnl_pct
+
+    def calculate_pnl(self, current_price: float) -> Dict:
+        """Calculate PnL for this position."""
+        pnl, pnl_pct = self._pnl(current_price)
         return {
             'pnl': pnl,
             'pnl_pct': pnl_pct,
@@ -51,9 +55,12 @@ class Position:
             'cost_basis': self.entry_price * self.quantity,
         }
     
-    def to_dict(self) -> Dict:
-        """Convert position to dictionary."""
-        return {
+    def to_dict(self, current_price: Optional[float] = None) -> Dict:
+        """Convert position to dictionary.
+
+        With current_price, the calculate_pnl() fields are included in the same dict.
+        """
+        d = {
             'id': self.id,
             'exchange': self.exchange,
             'symbol': self.symbol,
@@ -65,6 +72,9 @@ class Position:
             'take_profit': self.take_profit,
             'notes': self.notes,
         }
+        if current_price is not None:
+            d.update(self.calculate_pnl(current_price))
+        return d
 
 
 class PortfolioManager:
@@ -9,7 +9,7 @@ from typing import Optional
 from ..config import BINANCE_FUTURES_WS
 from ..exchanges.binance_ticker_ws import stream_minitickers
 import httpx
-from ..config import BINANCE_FUTURES_REST
+from ..config import BINANCE_FUTURES_REST, WS_COALESCE_MS
 
 from .watchdog import StreamWatchdog
 from .open_interest import OpenInterestFetcher
@@ -680,6 +680,32 @@ class StreamManager:
     async def subscribe_bybit(self):
         return await self.agg_bybit.subscribe()
 
+    @staticmethod
+    async def next_payload(*queues: asyncio.Queue) -> str:
+        """Wait for a snapshot on any queue, then coalesce whatever else arrives.
+
+        Snapshots are full state, so only the newest one is worth sending: after
+        the first push we wait WS_COALESCE_MS and drain every queue, and the
+        caller sends a single frame for the whole burst. Returns the newest
+        payload seen (across queues, the last one drained).
+        """
+        if len(queues) == 1:
+            payload = await queues[0].get()
+        else:
+            getters = [asyncio.ensure_future(q.get()) for q in queues]
+            try:
+                done, _ = await asyncio.wait(getters, return_when=asyncio.FIRST_COMPLETED)
+            finally:
+                for g in getters:
+                    g.cancel()
+            payload = next(iter(done)).result()
+        if WS_COALESCE_MS > 0:
+            await asyncio.sleep(WS_COALESCE_MS / 1000)
+        for q in queues:
+            while not q.empty():
+                payload = q.get_nowait()
+        return payload
+
     def bybit_running(self) -> bool:
         return self._task_bybit is not None and not self._task_bybit.done()
 
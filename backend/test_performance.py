@@ -201,4 +201,9 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    try:
+        import uvloop  # same loop the server runs on (see run_backend.sh)
+    except ImportError:
+        asyncio.run(main())
+    else:
+        uvloop.run(main())